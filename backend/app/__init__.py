@@ -3,24 +3,36 @@
 from flask import Flask
 from flask_cors import CORS
 from .config import Config
-from .extensions import db, jwt, migrate
+from .extensions import db, jwt, migrate, task_cache, token_version_cache, password_hasher, request_metrics, query_budgets
 from .routes.auth import auth_bp
 from .routes.task import task_bp
 from .errors import register_error_handlers
+from .db_profiles import apply_engine_profile
+from .compression import register_sqlite_functions
+from .cache import cache_metric_lines
 
-def create_app():
+def create_app(config_class=Config):
     app = Flask(__name__)
     CORS(app, 
          origins=["http://localhost:3000", "http://192.168.1.165:3000"],
          methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
          allow_headers=["Content-Type", "Authorization"])
 
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     # Initialize extensions
     db.init_app(app)
+    with app.app_context():
+        apply_engine_profile(db.engine, app.config["DB_ENGINE_PROFILE"])
+        register_sqlite_functions(db.engine)
+        request_metrics.init_app(app, db.engine)
+        query_budgets.init_app(app, db.engine)
     jwt.init_app(app)
     migrate.init_app(app, db)
+    task_cache.init_app(app)
+    token_version_cache.init_app(app)
+    password_hasher.init_app(app)
+    request_metrics.add_collector("caches", lambda: cache_metric_lines([task_cache, token_version_cache]))
 
     # Register global error handlers
     register_error_handlers(app)
@@ -0,0 +1,227 @@
+# app/cache.py
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+class CacheBackend(ABC):
+    """
+    Interface for per-user cache backends.
+
+    `generation(key)` returns a counter that changes on every invalidation of
+    the key; `set` only stores a value if the generation it was computed under
+    is still current, so a slow reader cannot re-cache data that a concurrent
+    write has already invalidated.
+
+    Values may be stored with a `marker` describing the data they were built
+    from; `get` with a marker only returns a value stored under the same
+    one. Invalidations only reach the worker process that made the write,
+    so the marker (read fresh from the database) is what keeps other
+    workers from serving an entry after a change.
+    """
+    @abstractmethod
+    def get(self, key: Hashable, marker: Optional[str] = None) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, generation: int, marker: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    def generation(self, key: Hashable) -> int:
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        ...
+
+
+class NullCache(CacheBackend):
+    """Backend that never stores anything (caching disabled)."""
+    def __init__(self):
+        self.misses = 0
+
+    def get(self, key, marker=None):
+        self.misses += 1
+        return None
+
+    def set(self, key, value, generation, marker=None):
+        pass
+
+    def generation(self, key):
+        return 0
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self):
+        return {"hits": 0, "misses": self.misses, "size": 0}
+
+
+class InProcessLRUCache(CacheBackend):
+    """
+    Thread-safe in-process cache with LRU eviction and a per-entry TTL.
+
+    Entries live in the worker process only: with several worker processes a
+    write invalidates the entry in its own worker. Other workers drop their
+    entry once a read passes a marker that differs from the stored one
+    (counted as a stale miss); entries read without a marker are bounded
+    by the TTL alone.
+    """
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple[float, Optional[str], Any]]" = OrderedDict()
+        self._generations: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    def get(self, key, marker=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, stored_marker, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            if marker is not None and stored_marker != marker:
+                del self._entries[key]
+                self.stale += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, generation, marker=None):
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return
+            self._entries[key] = (self._clock() + self.ttl, marker, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def generation(self, key):
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def delete(self, key):
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.pop(key, None)
+            self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._generations) + list(self._entries):
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "stale": self.stale,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+CACHE_BACKENDS: Dict[str, Callable[..., CacheBackend]] = {
+    "memory": InProcessLRUCache,
+    "none": lambda **options: NullCache(),
+}
+
+
+class UserCache:
+    """
+    Cache keyed by user ID, e.g. each user's task board.
+
+    Configured from <PREFIX>_BACKEND ("memory" or "none"),
+    <PREFIX>_MAX_ENTRIES and <PREFIX>_TTL (seconds). Until init_app runs it
+    behaves as a disabled cache.
+    """
+    def __init__(self, config_prefix: str):
+        self.config_prefix = config_prefix
+        self.backend: CacheBackend = NullCache()
+
+    def init_app(self, app, backend: Optional[CacheBackend] = None):
+        prefix = self.config_prefix
+        if backend is None:
+            factory = CACHE_BACKENDS[app.config.get(f"{prefix}_BACKEND", "memory")]
+            backend = factory(
+                max_entries=app.config.get(f"{prefix}_MAX_ENTRIES", 1024),
+                ttl=app.config.get(f"{prefix}_TTL", 60.0),
+            )
+        self.backend = backend
+        app.extensions[prefix.lower()] = self
+
+    def get(self, user_id: int, marker: Optional[str] = None) -> Optional[Any]:
+        return self.backend.get(user_id, marker)
+
+    def set(self, user_id: int, value: Any, generation: int, marker: Optional[str] = None) -> None:
+        self.backend.set(user_id, value, generation, marker)
+
+    def generation(self, user_id: int) -> int:
+        return self.backend.generation(user_id)
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drop one user's entry, or every entry when user_id is None."""
+        if user_id is None:
+            self.backend.clear()
+        else:
+            self.backend.delete(user_id)
+
+    def stats(self) -> Dict[str, int]:
+        return self.backend.stats()
+
+
+def cache_metric_lines(caches: Iterable[UserCache]) -> List[str]:
+    """Prometheus text lines for the counters of the given caches."""
+    lines = [
+        "# HELP trackly_cache_events_total Cache hits, misses, evictions, expirations, stale entries and invalidations.",
+        "# TYPE trackly_cache_events_total counter",
+    ]
+    sizes = []
+    for cache in caches:
+        name = cache.config_prefix.lower()
+        stats = cache.stats()
+        for event_name, value in stats.items():
+            if event_name == "size":
+                sizes.append(f'trackly_cache_entries{{cache="{name}"}} {value}')
+            else:
+                lines.append(f'trackly_cache_events_total{{cache="{name}",event="{event_name}"}} {value}')
+    lines += [
+        "# HELP trackly_cache_entries Entries currently held by the cache.",
+        "# TYPE trackly_cache_entries gauge",
+    ] + sizes
+    return lines
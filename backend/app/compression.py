@@ -0,0 +1,75 @@
+# app/compression.py
+import zlib
+from sqlalchemy import Text, event
+from sqlalchemy.types import TypeDecorator
+
+# Values whose UTF-8 encoding is at least this many bytes are compressed
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 6
+
+# SQL function (SQLite) returning the plain text of a CompressedText value;
+# SearchIndexService.rebuild() indexes through it. Only this app's
+# connections have it, so nothing in the schema may call it.
+SQLITE_TEXT_FUNCTION = "task_text"
+
+
+def compress_text(value: str, threshold: int = COMPRESSION_THRESHOLD, level: int = COMPRESSION_LEVEL):
+    """Return zlib bytes for a long value when that saves space, else the value itself."""
+    encoded = value.encode("utf-8")
+    if len(encoded) < threshold:
+        return value
+    packed = zlib.compress(encoded, level)
+    return packed if len(packed) < len(encoded) else value
+
+
+def decompress_text(value):
+    """Inverse of compress_text: stored bytes are compressed, strings are plain."""
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column that stores long values zlib-compressed.
+
+    On SQLite, values of `threshold` bytes or more are written as BLOBs into
+    the TEXT column (SQLite keeps the storage class per value) and short ones
+    as plain text, so the two are told apart on read without a marker byte.
+    Decompression happens in the result processor, i.e. only for queries
+    that actually load the column; keep such columns deferred.
+
+    Other dialects store plain text: PostgreSQL already compresses large
+    values out of line (TOAST), and its search index expression needs text.
+    """
+    impl = Text
+    cache_ok = True
+
+    def __init__(self, threshold: int = COMPRESSION_THRESHOLD, level: int = COMPRESSION_LEVEL):
+        super().__init__()
+        self.threshold = threshold
+        self.level = level
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != "sqlite":
+            return value
+        return compress_text(value, self.threshold, self.level)
+
+    def process_result_value(self, value, dialect):
+        return decompress_text(value)
+
+
+def register_sqlite_functions(engine) -> None:
+    """
+    Register SQLITE_TEXT_FUNCTION on every new SQLite connection, for the
+    search index rebuild to decompress task text in SQL.
+
+    Args:
+        engine: SQLAlchemy engine
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def create_text_function(dbapi_connection, connection_record):
+        dbapi_connection.create_function(SQLITE_TEXT_FUNCTION, 1, decompress_text, deterministic=True)
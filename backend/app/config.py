@@ -1,6 +1,7 @@
 # app/config.py
 import os
 from dotenv import load_dotenv
+from app.db_profiles import resolve_profile, engine_options
 
 load_dotenv()
 
@@ -9,3 +10,49 @@ class Config:
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "default-jwt-key")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///trackly.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Engine profile: "auto" picks sqlite-wal for SQLite and server otherwise
+    # (see app/db_profiles.py for sqlite-default, sqlite-wal and server)
+    DB_ENGINE_PROFILE = resolve_profile(os.getenv("DB_ENGINE_PROFILE", "auto"), SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(DB_ENGINE_PROFILE, {
+        "pool_size": int(os.environ["DB_POOL_SIZE"]) if os.getenv("DB_POOL_SIZE") else None,
+        "max_overflow": int(os.environ["DB_MAX_OVERFLOW"]) if os.getenv("DB_MAX_OVERFLOW") else None,
+    })
+
+    # Per-user task board cache ("memory" or "none"); entries are per worker
+    # process and are checked against the list's change marker on every read,
+    # so other workers' writes are never served from it
+    TASK_CACHE_BACKEND = os.getenv("TASK_CACHE_BACKEND", "memory")
+    TASK_CACHE_MAX_ENTRIES = int(os.getenv("TASK_CACHE_MAX_ENTRIES", "1024"))
+    TASK_CACHE_TTL = float(os.getenv("TASK_CACHE_TTL", "60"))
+
+    # Per-user token_version cache used to serve /auth/refresh and /auth/me
+    # from JWT claims; TTL bounds how long another worker may accept claims
+    # from before a profile or password change
+    TOKEN_VERSION_CACHE_BACKEND = os.getenv("TOKEN_VERSION_CACHE_BACKEND", "memory")
+    TOKEN_VERSION_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_VERSION_CACHE_MAX_ENTRIES", "10000"))
+    TOKEN_VERSION_CACHE_TTL = float(os.getenv("TOKEN_VERSION_CACHE_TTL", "30"))
+
+    # Password hashing: werkzeug method string (cost parameters included), and
+    # a process pool sized by workers plus a bounded wait queue (503 when full).
+    # PASSWORD_HASH_WORKERS=0 hashes in the request thread.
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+    PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32"))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+
+    # Request instrumentation: Server-Timing header and Prometheus /metrics,
+    # both off unless enabled. With METRICS_TOKEN set, /metrics answers only
+    # requests carrying "Authorization: Bearer <token>"; without it /metrics
+    # is open and should only be reachable from an internal network
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+
+    # Per-endpoint SQL statement budgets (@query_budget): "auto" raises when
+    # app.testing and logs a warning otherwise; also "warn", "raise" or "off"
+    QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "auto")
+
+    # Largest JSON request body validate_input accepts (413 above it); bulk
+    # requests carry up to 1000 operations
+    MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES", str(4 * 1024 * 1024)))
@@ -0,0 +1,84 @@
+# app/db_profiles.py
+from typing import Any, Dict
+from sqlalchemy import event
+
+# Named engine profiles. "pragmas" run on every new SQLite connection;
+# "engine_options" become SQLALCHEMY_ENGINE_OPTIONS.
+ENGINE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # SQLite as shipped: rollback journal, default pooling
+    "sqlite-default": {
+        "pragmas": {},
+        "engine_options": {},
+    },
+    # SQLite tuned for concurrent readers alongside a writer
+    "sqlite-wal": {
+        "pragmas": {
+            "journal_mode": "WAL",        # readers no longer block on the writer
+            "synchronous": "NORMAL",      # fsync at checkpoints only; safe with WAL
+            "busy_timeout": 5000,         # ms to wait for a lock before SQLITE_BUSY
+            "mmap_size": 268435456,       # 256 MiB memory-mapped reads
+            "cache_size": -65536,         # 64 MiB page cache (negative = KiB)
+            "temp_store": "MEMORY",
+        },
+        "engine_options": {},
+    },
+    # PostgreSQL / MySQL behind a connection pool
+    "server": {
+        "pragmas": {},
+        "engine_options": {
+            "pool_size": 10,
+            "max_overflow": 20,
+            "pool_timeout": 30,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        },
+    },
+}
+
+
+def resolve_profile(name: str, database_uri: str) -> str:
+    """
+    Resolve "auto" to a concrete profile for the database URI.
+    
+    Args:
+        name: Profile name from config, or "auto"
+        database_uri: SQLAlchemy database URI
+        
+    Returns:
+        Name of a profile in ENGINE_PROFILES
+        
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if name == "auto":
+        return "sqlite-wal" if database_uri.startswith("sqlite") else "server"
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE '{name}', expected one of: {', '.join(ENGINE_PROFILES)}")
+    return name
+
+
+def engine_options(name: str, overrides: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """Return SQLALCHEMY_ENGINE_OPTIONS for a profile, with optional overrides."""
+    options = dict(ENGINE_PROFILES[name]["engine_options"])
+    options.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    return options
+
+
+def apply_engine_profile(engine, name: str) -> None:
+    """
+    Register a connect-time listener that applies the profile's pragmas.
+    
+    Args:
+        engine: SQLAlchemy engine
+        name: Profile name in ENGINE_PROFILES
+    """
+    pragmas = ENGINE_PROFILES[name]["pragmas"]
+    if not pragmas or engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
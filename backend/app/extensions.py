@@ -2,7 +2,16 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
+from app.cache import UserCache
+from app.passwords import PasswordHasher
+from app.metrics import RequestMetrics
+from app.query_budget import QueryBudget
 
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate()
+task_cache = UserCache("TASK_CACHE")
+token_version_cache = UserCache("TOKEN_VERSION_CACHE")
+password_hasher = PasswordHasher()
+request_metrics = RequestMetrics()
+query_budgets = QueryBudget()
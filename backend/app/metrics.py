@@ -0,0 +1,176 @@
+# app/metrics.py
+import bisect
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+
+# Latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Server-Timing phases besides total, in header order
+PHASES = ("db", "validate", "serialize")
+
+
+@contextmanager
+def record_timing(phase: str):
+    """
+    Add the time spent in the block to the current request's `phase` timer.
+    A no-op outside a request.
+    """
+    if not has_request_context() or "request_timings" not in g:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        g.request_timings[phase] += time.perf_counter() - start
+
+
+class _EndpointStats:
+    """Aggregated timings for one (endpoint, method) pair."""
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.phase_seconds = {phase: 0.0 for phase in PHASES}
+        self.db_statements = 0
+
+    def observe(self, total: float, timings: Dict[str, float], db_statements: int):
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, total)] += 1
+        self.count += 1
+        self.total_seconds += total
+        for phase in PHASES:
+            self.phase_seconds[phase] += timings[phase]
+        self.db_statements += db_statements
+
+
+class RequestMetrics:
+    """
+    Per-request performance instrumentation.
+
+    For every request it measures SQL statement count and time (engine
+    cursor events), validation time (validate_input / validate_query),
+    serialization time (to_json) and total handler time. These are sent back
+    in a Server-Timing header and aggregated per blueprint endpoint into
+    latency histograms, exposed in Prometheus text format on /metrics.
+    Figures are per worker process.
+
+    Config: METRICS_ENABLED, SERVER_TIMING_ENABLED (both off by default) and
+    METRICS_TOKEN, the bearer token /metrics requires when set.
+    """
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self._collectors = {}
+
+    def init_app(self, app, engine):
+        if not app.config.get("METRICS_ENABLED", False):
+            return
+        self.server_timing = app.config.get("SERVER_TIMING_ENABLED", False)
+        self.token = app.config.get("METRICS_TOKEN")
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.add_url_rule("/metrics", "metrics", self.metrics_view, methods=["GET"])
+        app.extensions["request_metrics"] = self
+
+    def add_collector(self, name: str, collector):
+        """Register (or replace) a callable returning extra Prometheus text lines for /metrics."""
+        self._collectors[name] = collector
+
+    # SQL statement timing
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_time"].pop()
+        if has_request_context() and "request_timings" in g:
+            g.request_timings["db"] += time.perf_counter() - start
+            g.db_statements += 1
+
+    # Request lifecycle
+    @staticmethod
+    def _start_request():
+        g.request_start = time.perf_counter()
+        g.request_timings = {phase: 0.0 for phase in PHASES}
+        g.db_statements = 0
+
+    def _finish_request(self, response):
+        if "request_start" not in g:
+            return response
+        total = time.perf_counter() - g.request_start
+        timings = g.request_timings
+
+        if self.server_timing:
+            parts = [
+                f'db;dur={timings["db"] * 1000:.2f};desc="{g.db_statements} queries"',
+                f'validate;dur={timings["validate"] * 1000:.2f}',
+                f'serialize;dur={timings["serialize"] * 1000:.2f}',
+                f'total;dur={total * 1000:.2f}',
+            ]
+            response.headers["Server-Timing"] = ", ".join(parts)
+
+        key = (request.endpoint or "unmatched", request.method)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats()
+            stats.observe(total, timings, g.db_statements)
+        return response
+
+    # Prometheus exposition
+    def render(self) -> str:
+        lines: List[str] = [
+            "# HELP trackly_request_duration_seconds Request handling time.",
+            "# TYPE trackly_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            snapshot = sorted(self._stats.items())
+            for (endpoint, method), stats in snapshot:
+                labels = f'endpoint="{endpoint}",method="{method}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'trackly_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"trackly_request_duration_seconds_sum{{{labels}}} {stats.total_seconds:.6f}")
+                lines.append(f"trackly_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+            lines += [
+                "# HELP trackly_request_phase_seconds_total Time spent per request phase.",
+                "# TYPE trackly_request_phase_seconds_total counter",
+            ]
+            for (endpoint, method), stats in snapshot:
+                for phase in PHASES:
+                    lines.append(
+                        f'trackly_request_phase_seconds_total{{endpoint="{endpoint}",method="{method}",phase="{phase}"}} '
+                        f"{stats.phase_seconds[phase]:.6f}"
+                    )
+
+            lines += [
+                "# HELP trackly_db_statements_total SQL statements executed while handling requests.",
+                "# TYPE trackly_db_statements_total counter",
+            ]
+            for (endpoint, method), stats in snapshot:
+                lines.append(f'trackly_db_statements_total{{endpoint="{endpoint}",method="{method}"}} {stats.db_statements}')
+
+        for collector in self._collectors.values():
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+    def metrics_view(self):
+        if self.token is not None:
+            supplied = request.headers.get("Authorization", "")
+            if not hmac.compare_digest(supplied.encode(), f"Bearer {self.token}".encode()):
+                return Response("Unauthorized\n", status=401, mimetype="text/plain",
+                                headers={"WWW-Authenticate": "Bearer"})
+        return Response(self.render(), mimetype="text/plain; version=0.0.4")
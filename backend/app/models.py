@@ -3,8 +3,10 @@ from datetime import datetime, timezone
 from http import HTTPStatus
 from sqlalchemy.exc import IntegrityError
 import enum
-from app.extensions import db
+from app.extensions import db, password_hasher
 from app.errors import APIError
+from app.compression import CompressedText
+from app.search import install_search_ddl
 
 
 class TaskStatus(enum.Enum):
@@ -15,6 +17,10 @@ class TaskStatus(enum.Enum):
     WONT_DO = "wont_do"
 
 
+# Statuses for which a past due date no longer counts as overdue
+CLOSED_STATUSES = (TaskStatus.DONE, TaskStatus.WONT_DO)
+
+
 class TimestampMixin:
     created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
@@ -55,31 +61,88 @@ class User(TimestampMixin, CRUDMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    # Bumped on every profile or password change; embedded in access tokens
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Last task change sequence number handed out (see Task.change_seq)
+    task_change_seq = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
 
     # Relationship with tasks
     tasks = db.relationship('Task', backref='user', lazy=True)
 
     def set_password(self, password: str):
-        from werkzeug.security import generate_password_hash
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password: str) -> bool:
-        from werkzeug.security import check_password_hash
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+
+    def password_needs_rehash(self) -> bool:
+        return password_hasher.needs_rehash(self.password_hash)
 
 
 class Task(TimestampMixin, CRUDMixin, db.Model):
     __tablename__ = 'task'
+    __table_args__ = (
+        # Board index: every TaskService list/reorder query filters on user_id
+        # (and status) over live rows and orders by status, sort_order.
+        # Partial on is_deleted so soft-deleted rows never bloat the range scan;
+        # on PostgreSQL the table-view columns are INCLUDEd for index-only scans.
+        db.Index(
+            'ix_task_user_status_sort_order',
+            'user_id', 'status', 'sort_order',
+            sqlite_where=db.text('is_deleted = 0'),
+            postgresql_where=db.text('is_deleted = false'),
+            postgresql_include=['title', 'created_at', 'due_date'],
+        ),
+        # Rows created or updated after a point in time, per user (created_at
+        # list orders and filters)
+        db.Index('ix_task_user_created_at', 'user_id', 'created_at'),
+        db.Index('ix_task_user_updated_at', 'user_id', 'updated_at'),
+        # Delta sync: rows (including soft-deleted ones) changed after a
+        # sequence number, per user
+        db.Index('ix_task_user_change_seq', 'user_id', 'change_seq'),
+        # Due-date filters and due_date list orders over live rows
+        db.Index(
+            'ix_task_user_due_date',
+            'user_id', 'due_date',
+            sqlite_where=db.text('is_deleted = 0'),
+            postgresql_where=db.text('is_deleted = false'),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
-    why = db.Column(db.Text, nullable=True)
-    what = db.Column(db.Text, nullable=True)
-    how = db.Column(db.Text, nullable=True)
-    acceptance_criteria = db.Column(db.Text, nullable=True)
+    # Unbounded text is only needed by the full task view: deferred as one
+    # group, loaded (and decompressed) by queries that ask for it with
+    # undefer_group('text')
+    why = db.deferred(db.Column(CompressedText, nullable=True), group='text')
+    what = db.deferred(db.Column(CompressedText, nullable=True), group='text')
+    how = db.deferred(db.Column(CompressedText, nullable=True), group='text')
+    acceptance_criteria = db.deferred(db.Column(CompressedText, nullable=True), group='text')
     status = db.Column(db.Enum(TaskStatus), nullable=False, default=TaskStatus.BACKLOG)
     sort_order = db.Column(db.Float, nullable=False, default=1000.0)
     due_date = db.Column(db.DateTime(timezone=True), nullable=True)
     is_deleted = db.Column(db.Boolean, nullable=False, default=False)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # User.task_change_seq of the transaction that last wrote the row; a
+    # user's sequence only grows in commit order, unlike updated_at
+    change_seq = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+
+
+class UserTaskCounter(db.Model):
+    """
+    Live task counts per (user, status), kept in step with the task table by
+    TaskCounterService in the same transaction as every task write.
+    """
+    __tablename__ = 'user_task_counters'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    status = db.Column(db.Enum(TaskStatus), primary_key=True)
+    # Non-deleted tasks in this status column
+    live_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Of those, tasks that can become overdue: open status and a due date set
+    overdue_eligible_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+
+# Full-text search index (FTS5 on SQLite, GIN on PostgreSQL), see app/search.py
+install_search_ddl(Task.__table__)
@@ -0,0 +1,109 @@
+# app/passwords.py
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from werkzeug.security import generate_password_hash, check_password_hash
+from app.errors import APIError
+
+
+class PasswordHasher:
+    """
+    Password hashing on a bounded process pool.
+
+    Hashing is CPU-bound, so running it in the request thread lets a burst
+    of logins pin every worker. Here it runs on PASSWORD_HASH_WORKERS
+    processes; at most PASSWORD_HASH_QUEUE_LIMIT further calls may wait for
+    a free process, beyond that callers get a 503 straight away. A hash that
+    does not finish within PASSWORD_HASH_TIMEOUT seconds, or a pool whose
+    worker died, is also reported as a 503.
+    PASSWORD_HASH_WORKERS = 0 hashes inline (scripts, tests).
+
+    PASSWORD_HASH_METHOD is any werkzeug method string, e.g.
+    "scrypt:32768:8:1" or "pbkdf2:sha256:1000000"; stored hashes made with a
+    different method are reported by needs_rehash.
+    """
+    def __init__(self):
+        self.method = "scrypt"
+        self.workers = 0
+        self.queue_limit = 0
+        self.timeout = None
+        self._method_prefix = None
+        self._executor = None
+        self._slots = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.method = app.config.get("PASSWORD_HASH_METHOD", "scrypt")
+        self.workers = app.config.get("PASSWORD_HASH_WORKERS", 0)
+        self.queue_limit = app.config.get("PASSWORD_HASH_QUEUE_LIMIT", 0)
+        self.timeout = app.config.get("PASSWORD_HASH_TIMEOUT")
+        # Full method string with werkzeug's defaults filled in (e.g. "scrypt:32768:8:1")
+        self._method_prefix = generate_password_hash("", method=self.method).split("$", 1)[0]
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_limit) if self.workers else None
+        app.extensions["password_hasher"] = self
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created on first use so no processes are forked at import time
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                atexit.register(self._executor.shutdown, wait=False, cancel_futures=True)
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise self._unavailable()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._reset_executor(executor)
+            raise self._unavailable()
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Drop it if it has not started; a running hash keeps its slot until done
+            future.cancel()
+            raise self._unavailable()
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            raise self._unavailable()
+
+    @staticmethod
+    def _unavailable() -> APIError:
+        return APIError(
+            "Server is busy, please try again shortly",
+            status=HTTPStatus.SERVICE_UNAVAILABLE
+        )
+
+    def _reset_executor(self, broken: ProcessPoolExecutor):
+        # A broken pool rejects all further work; the next call starts a new
+        # one (unless another thread already did)
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Check a password against a stored hash."""
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether a stored hash was made with different cost parameters."""
+        if self._method_prefix is None:
+            return False
+        return password_hash.split("$", 1)[0] != self._method_prefix
@@ -0,0 +1,84 @@
+# app/query_budget.py
+import logging
+from functools import wraps
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# How many of the offending statements are quoted in a budget report
+REPORTED_STATEMENTS = 10
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in test mode when a view executes more SQL statements than its budget."""
+
+
+class QueryBudget:
+    """
+    Per-endpoint SQL statement budgets.
+
+    Views declare a ceiling with @query_budget(n). Statements are counted
+    through the engine's before_cursor_execute event while the view runs,
+    which catches lazy loads triggered by schema serialization. An overrun
+    logs a warning, or raises QueryBudgetExceeded in test mode.
+
+    Config: QUERY_BUDGET_MODE - "auto" (raise when app.testing, else warn),
+    "warn", "raise" or "off".
+    """
+    def init_app(self, app, engine):
+        if app.config.get("QUERY_BUDGET_MODE", "auto") == "off":
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        app.extensions["query_budget"] = self
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and "query_budget_statements" in g:
+            g.query_budget_statements.append(statement)
+
+    @staticmethod
+    def should_raise() -> bool:
+        mode = current_app.config.get("QUERY_BUDGET_MODE", "auto")
+        return mode == "raise" or (mode == "auto" and current_app.testing)
+
+    def check(self, max_statements: int, statements: list[str]):
+        if len(statements) <= max_statements:
+            return
+        message = (
+            f"{request.method} {request.path} executed {len(statements)} SQL statements "
+            f"(budget {max_statements})"
+        )
+        quoted = "\n".join(f"  {s}" for s in statements[:REPORTED_STATEMENTS])
+        if self.should_raise():
+            raise QueryBudgetExceeded(f"{message}:\n{quoted}")
+        logger.warning("Query budget exceeded: %s:\n%s", message, quoted)
+
+
+def query_budget(max_statements: int):
+    """
+    Decorator declaring the maximum number of SQL statements a view may run.
+
+    Place it above @jwt_required so the whole view is counted. Statements
+    issued after the view returns (a streamed response body) are not counted.
+    Nested budgets defer to the outermost one.
+
+    Args:
+        max_statements: Statement ceiling for one request
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            budget = current_app.extensions.get("query_budget")
+            if budget is None or "query_budget_statements" in g:
+                return fn(*args, **kwargs)
+
+            g.query_budget_statements = []
+            try:
+                response = fn(*args, **kwargs)
+            finally:
+                statements = g.pop("query_budget_statements")
+            budget.check(max_statements, statements)
+            return response
+        return wrapper
+    return decorator
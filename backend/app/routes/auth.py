@@ -1,10 +1,11 @@
 from http import HTTPStatus
 from flask import Blueprint
 from flask.views import MethodView
-from flask_jwt_extended import jwt_required
+from flask_jwt_extended import jwt_required, get_jwt
 from app.schemas import UserRegisterSchema, UserLoginSchema, UserProfileUpdateSchema, UserPasswordChangeSchema
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService
+from app.query_budget import query_budget
 from app.utils import validate_input, to_json, get_current_user_id
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
@@ -12,6 +13,7 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 class AuthAPI(MethodView):
     """User registration endpoint"""
     
+    @query_budget(3)
     @validate_input(UserRegisterSchema)
     def post(self, data: UserRegisterSchema):
         """Register a new user"""
@@ -24,6 +26,7 @@ class AuthAPI(MethodView):
 class AuthLoginAPI(MethodView):
     """User authentication endpoint"""
     
+    @query_budget(3)
     @validate_input(UserLoginSchema)
     def post(self, data: UserLoginSchema):
         """Authenticate user and return access token"""
@@ -33,24 +36,28 @@ class AuthLoginAPI(MethodView):
 class AuthRefreshAPI(MethodView):
     """Token refresh endpoint"""
     
+    @query_budget(2)
     @jwt_required()
     def post(self):
         """Refresh the access token for the current user"""
         user_id = get_current_user_id()
-        new_token, user_out = AuthService.refresh_user_token(user_id)
+        new_token, user_out = AuthService.refresh_user_token(user_id, get_jwt())
         return to_json({"access_token": new_token, "user": user_out})
 
 
 class UserProfileAPI(MethodView):
     """User profile management endpoint"""
     
+    @query_budget(2)
     @jwt_required()
     def get(self):
         """Get current user profile"""
         user_id = get_current_user_id()
-        user_profile = UserService.get_user_profile(user_id)
+        user_profile = UserService.get_user_profile(user_id, get_jwt())
         return to_json({"user": user_profile})
     
+    # User, email-uniqueness check (email changes only), UPDATE, reload
+    @query_budget(4)
     @jwt_required()
     @validate_input(UserProfileUpdateSchema)
     def put(self, data: UserProfileUpdateSchema):
@@ -63,6 +70,7 @@ class UserProfileAPI(MethodView):
 class UserPasswordAPI(MethodView):
     """User password change endpoint"""
     
+    @query_budget(3)
     @jwt_required()
     @validate_input(UserPasswordChangeSchema)
     def put(self, data: UserPasswordChangeSchema):
@@ -1,11 +1,22 @@
 from http import HTTPStatus
-from flask import Blueprint, jsonify
+from flask import Blueprint, g, jsonify, request
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required
 from flask_jwt_extended.exceptions import JWTExtendedException
-from app.schemas import TaskCreateSchema, TaskUpdateSchema, TaskReorderSchema
+from app.schemas import (
+    TaskCreateSchema, 
+    TaskUpdateSchema, 
+    TaskReorderSchema, 
+    TaskListQuerySchema, 
+    TaskChangesQuerySchema, 
+    TaskSearchQuerySchema,
+    TaskSummaryQuerySchema,
+    TaskBulkSchema,
+    TaskBatchReorderSchema,
+)
 from app.services.task_service import TaskService
-from app.utils import validate_input, to_json, get_current_user_id
+from app.query_budget import query_budget
+from app.utils import validate_input, validate_query, conditional_get, to_json, stream_json, get_current_user_id
 
 task_bp = Blueprint("task", __name__, url_prefix="/tasks")
 
@@ -21,13 +32,35 @@ class TaskAPI(MethodView):
         """Handle CORS preflight requests"""
         return jsonify({}), 200
     
+    # Marker query plus up to two ordered reads (due_date orders read tasks
+    # with and without a due date separately)
+    @query_budget(3)
     @jwt_required()
-    def get(self):
-        """Get all tasks for the logged-in user (table view with limited data)"""
+    # `overdue` depends on the clock as well as the stored rows, so those
+    # views are not ETag-validated
+    @conditional_get(lambda: None if "overdue" in request.args else TaskService.get_tasks_marker(get_current_user_id()))
+    @validate_query(TaskListQuerySchema)
+    def get(self, query: TaskListQuerySchema):
+        """Get tasks for the logged-in user (table view with limited data)
+        
+        Returns every task unless `limit` or `cursor` is given, in which case
+        one page is returned together with `next_cursor` (null on the last page).
+        With `stream=true` the full list is written out while it is read.
+        `status`, `due_after`, `due_before`, `overdue`, `created_after` and
+        `order_by` narrow and sort the list in the database in every mode.
+        """
         user_id = get_current_user_id()
-        tasks_out = TaskService.get_user_tasks(user_id)
-        return to_json({"tasks": tasks_out})
+        if query.stream:
+            return stream_json("tasks", TaskService.iter_user_tasks(user_id, filters=query))
+        
+        if query.limit is None and query.cursor is None:
+            tasks_out = TaskService.get_user_tasks(user_id, query, g.get("etag_marker"))
+            return to_json({"tasks": tasks_out})
+        
+        tasks_out, next_cursor = TaskService.get_user_tasks_page(user_id, query.limit, query.cursor, query)
+        return to_json({"tasks": tasks_out, "next_cursor": next_cursor})
     
+    @query_budget(5)
     @jwt_required()
     @validate_input(TaskCreateSchema)
     def post(self, data: TaskCreateSchema):
@@ -36,16 +69,68 @@ class TaskAPI(MethodView):
         task_out = TaskService.create_task(data, user_id)
         return to_json({"task": task_out}, status=HTTPStatus.CREATED)
 
+class TaskBulkAPI(MethodView):
+    """Bulk task operations endpoint"""
+    
+    @query_budget(8)
+    @jwt_required()
+    @validate_input(TaskBulkSchema)
+    def post(self, data: TaskBulkSchema):
+        """Apply a batch of create/update/delete operations in one transaction"""
+        user_id = get_current_user_id()
+        results = TaskService.bulk_apply(data, user_id)
+        return to_json({"results": results})
+
+class TaskChangesAPI(MethodView):
+    """Task delta sync endpoint"""
+    
+    @query_budget(1)
+    @jwt_required()
+    @validate_query(TaskChangesQuerySchema)
+    def get(self, query: TaskChangesQuerySchema):
+        """Get tasks changed since the previous sync, plus tombstones for deleted tasks"""
+        user_id = get_current_user_id()
+        tasks_out, deleted_ids, next_since = TaskService.get_task_changes(user_id, query.since)
+        return to_json({"tasks": tasks_out, "deleted": deleted_ids, "next_since": next_since})
+
+class TaskSearchAPI(MethodView):
+    """Task full-text search endpoint"""
+    
+    @query_budget(1)
+    @jwt_required()
+    @validate_query(TaskSearchQuerySchema)
+    def get(self, query: TaskSearchQuerySchema):
+        """Search the logged-in user's tasks by text, best matches first"""
+        user_id = get_current_user_id()
+        tasks_out, next_cursor = TaskService.search_tasks(user_id, query.q, query.limit, query.cursor)
+        return to_json({"tasks": tasks_out, "next_cursor": next_cursor})
+
+class TaskSummaryAPI(MethodView):
+    """Task board summary endpoint"""
+    
+    # No ETag: overdue and due-soon counts move with the clock
+    @query_budget(2)
+    @jwt_required()
+    @validate_query(TaskSummaryQuerySchema)
+    def get(self, query: TaskSummaryQuerySchema):
+        """Get task counts per status and of overdue and due-soon tasks"""
+        user_id = get_current_user_id()
+        summary = TaskService.get_task_summary(user_id, query.due_soon_days)
+        return to_json({"summary": summary})
+
 class SingleTaskAPI(MethodView):
     """Individual task endpoint"""
     
+    @query_budget(2)
     @jwt_required()
+    @conditional_get(lambda task_id: TaskService.get_task_marker(task_id, get_current_user_id()))
     def get(self, task_id: int):
         """Get full details for a specific task"""
         user_id = get_current_user_id()
         task_out = TaskService.get_task_by_id(task_id, user_id)
         return to_json({"task": task_out})
 
+    @query_budget(6)
     @jwt_required()
     @validate_input(TaskUpdateSchema)  
     def put(self, data: TaskUpdateSchema, task_id: int):
@@ -54,6 +139,7 @@ class SingleTaskAPI(MethodView):
         task_out = TaskService.update_task(task_id, data, user_id)
         return to_json({"task": task_out})
     
+    @query_budget(3)
     @jwt_required()
     def delete(self, task_id: int):
         """Soft delete a specific task"""
@@ -65,18 +151,48 @@ class SingleTaskAPI(MethodView):
 class TaskReorderAPI(MethodView):
     """Task reordering endpoint"""
     
+    @query_budget(8)
     @jwt_required()
     @validate_input(TaskReorderSchema)
     def post(self, data: TaskReorderSchema, task_id: int):
         """Reorder a task to a new position within a status column"""
         user_id = get_current_user_id()
-        task_out = TaskService.reorder_task(task_id, data.target_status, data.target_position, user_id)
+        task_out = TaskService.reorder_task(
+            task_id, data.target_status, data.target_position, user_id, data.after_task_id
+        )
         return to_json({"task": task_out})
 
+class TaskBatchReorderAPI(MethodView):
+    """Batch task reordering endpoint"""
+    
+    @query_budget(6)
+    @jwt_required()
+    @validate_input(TaskBatchReorderSchema)
+    def post(self, data: TaskBatchReorderSchema):
+        """Apply several reorder moves at once and return the final board"""
+        user_id = get_current_user_id()
+        tasks_out = TaskService.reorder_tasks_batch(data, user_id)
+        return to_json({"tasks": tasks_out})
+
 # Register the views
 task_view = TaskAPI.as_view("task_api")
 task_bp.add_url_rule("", view_func=task_view, methods=["GET", "POST", "OPTIONS"])
 
+bulk_view = TaskBulkAPI.as_view("task_bulk_api")
+task_bp.add_url_rule("/bulk", view_func=bulk_view, methods=["POST"])
+
+batch_reorder_view = TaskBatchReorderAPI.as_view("task_batch_reorder_api")
+task_bp.add_url_rule("/reorder", view_func=batch_reorder_view, methods=["POST"])
+
+changes_view = TaskChangesAPI.as_view("task_changes_api")
+task_bp.add_url_rule("/changes", view_func=changes_view, methods=["GET"])
+
+search_view = TaskSearchAPI.as_view("task_search_api")
+task_bp.add_url_rule("/search", view_func=search_view, methods=["GET"])
+
+summary_view = TaskSummaryAPI.as_view("task_summary_api")
+task_bp.add_url_rule("/summary", view_func=summary_view, methods=["GET"])
+
 single_task_view = SingleTaskAPI.as_view("single_task_api")
 task_bp.add_url_rule("/<int:task_id>", view_func=single_task_view, methods=["GET", "PUT", "DELETE"])
 
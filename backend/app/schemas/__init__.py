@@ -4,6 +4,8 @@ Schema definitions for API request/response validation
 """
 
 # Import all schemas for easy access
+from .common import IsoDatetime
+
 from .user_schemas import (
     Username,
     Password,
@@ -20,12 +22,28 @@ from .task_schemas import (
     TaskCreateSchema,
     TaskUpdateSchema,
     TaskTableSchema,
+    TaskChangeSchema,
     TaskOutSchema,
     TaskReorderSchema,
+    TaskReorderMoveSchema,
+    TaskBatchReorderSchema,
+    TaskListQuerySchema,
+    TaskChangesQuerySchema,
+    TaskSearchQuerySchema,
+    TaskSummaryQuerySchema,
+    TaskSummarySchema,
+    TaskBulkCreateOp,
+    TaskBulkUpdateOp,
+    TaskBulkDeleteOp,
+    TaskBulkSchema,
+    TaskBulkResultSchema,
 )
 
 # Make all schemas available at package level
 __all__ = [
+    # Shared types
+    "IsoDatetime",
+    
     # User schemas
     "Username",
     "Password", 
@@ -41,6 +59,19 @@ __all__ = [
     "TaskCreateSchema", 
     "TaskUpdateSchema",
     "TaskTableSchema",
+    "TaskChangeSchema",
     "TaskOutSchema",
     "TaskReorderSchema",
+    "TaskReorderMoveSchema",
+    "TaskBatchReorderSchema",
+    "TaskListQuerySchema",
+    "TaskChangesQuerySchema",
+    "TaskSearchQuerySchema",
+    "TaskSummaryQuerySchema",
+    "TaskSummarySchema",
+    "TaskBulkCreateOp",
+    "TaskBulkUpdateOp",
+    "TaskBulkDeleteOp",
+    "TaskBulkSchema",
+    "TaskBulkResultSchema",
 ]
\ No newline at end of file
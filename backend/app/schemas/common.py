@@ -0,0 +1,11 @@
+# app/schemas/common.py
+from pydantic import PlainSerializer
+from typing import Annotated
+from datetime import datetime
+
+# Datetime rendered with datetime.isoformat() in JSON output, so UTC values read
+# "+00:00" (pydantic's native encoder would emit "Z")
+IsoDatetime = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, when_used="json")
+]
@@ -1,7 +1,9 @@
 # app/schemas/task_schemas.py
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationInfo, field_validator
 from datetime import datetime
 from enum import Enum
+from typing import Annotated, List, Literal, Union
+from .common import IsoDatetime
 
 
 class TaskStatusEnum(str, Enum):
@@ -36,8 +38,8 @@ class TaskTableSchema(BaseModel):
     id: int
     title: str
     status: str
-    created_at: datetime
-    due_date: datetime | None
+    created_at: IsoDatetime
+    due_date: IsoDatetime | None
 
     model_config = ConfigDict(from_attributes=True)
     
@@ -54,6 +56,47 @@ class TaskTableSchema(BaseModel):
             return super().model_validate(obj_dict)
         return super().model_validate(obj)
 
+    @classmethod
+    def from_rows(cls, rows) -> List["TaskTableSchema"]:
+        """
+        Build table entries from (id, title, status, created_at, due_date, ...)
+        row tuples, validating the whole list in one pydantic-core call.
+        """
+        return _table_list_adapter.validate_python(
+            {"id": row[0], "title": row[1], "status": row[2].value, "created_at": row[3], "due_date": row[4]}
+            for row in rows
+        )
+
+
+_table_list_adapter = TypeAdapter(List[TaskTableSchema])
+
+
+class TaskChangeSchema(BaseModel):
+    id: int
+    title: str
+    status: str
+    sort_order: float
+    created_at: IsoDatetime
+    updated_at: IsoDatetime | None
+    due_date: IsoDatetime | None
+
+    model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def model_validate(cls, obj):
+        if hasattr(obj, 'status') and hasattr(obj.status, 'value'):
+            obj_dict = {
+                'id': obj.id,
+                'title': obj.title,
+                'status': obj.status.value,
+                'sort_order': obj.sort_order,
+                'created_at': obj.created_at,
+                'updated_at': obj.updated_at,
+                'due_date': obj.due_date
+            }
+            return super().model_validate(obj_dict)
+        return super().model_validate(obj)
+
 
 class TaskOutSchema(BaseModel):
     id: int
@@ -64,9 +107,9 @@ class TaskOutSchema(BaseModel):
     acceptance_criteria: str | None
     status: str  # Changed from TaskStatusEnum to str for better JSON serialization
     user_id: int
-    created_at: datetime
-    updated_at: datetime | None
-    due_date: datetime | None
+    created_at: IsoDatetime
+    updated_at: IsoDatetime | None
+    due_date: IsoDatetime | None
 
     model_config = ConfigDict(from_attributes=True)
     
@@ -83,5 +126,113 @@ class TaskOutSchema(BaseModel):
 class TaskReorderSchema(BaseModel):
     target_status: str = Field(..., description="Status column to move task to")
     target_position: int = Field(..., ge=0, description="0-based index position in target column")
+    after_task_id: int | None = Field(
+        None, description="Task in the target column to drop directly below; overrides target_position"
+    )
     
-    model_config = ConfigDict(str_strip_whitespace=True)
\ No newline at end of file
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+class TaskReorderMoveSchema(TaskReorderSchema):
+    task_id: int = Field(..., description="Task to move")
+
+
+class TaskBatchReorderSchema(BaseModel):
+    moves: List[TaskReorderMoveSchema] = Field(..., min_length=1, max_length=1000, description="Moves applied in order")
+
+
+class TaskListQuerySchema(BaseModel):
+    limit: int | None = Field(None, ge=1, le=500, description="Page size; enables cursor pagination")
+    cursor: str | None = Field(None, min_length=1, description="Opaque next_cursor from the previous page")
+    stream: bool = Field(False, description="Stream the full list as it is read from the database")
+    status: List[TaskStatusEnum] | None = Field(None, min_length=1, description="Comma-separated statuses to include")
+    due_after: datetime | None = Field(None, description="Only tasks due at or after this time")
+    due_before: datetime | None = Field(None, description="Only tasks due before this time")
+    overdue: bool | None = Field(None, description="Only tasks past their due date and not done/won't do (or the opposite)")
+    created_after: datetime | None = Field(None, description="Only tasks created after this time")
+    order_by: Literal["board", "created_at", "-created_at", "due_date", "-due_date"] = Field(
+        "board", description="Sort order; due_date orders list tasks without a due date last"
+    )
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @field_validator("stream")
+    @classmethod
+    def check_stream_not_paginated(cls, stream: bool, info: ValidationInfo) -> bool:
+        if stream and (info.data.get("limit") is not None or info.data.get("cursor") is not None):
+            raise ValueError("cannot be combined with limit or cursor")
+        return stream
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def split_statuses(cls, value):
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+    @property
+    def is_default_view(self) -> bool:
+        """True when no filter is set and the board order is requested."""
+        filters = (self.status, self.due_after, self.due_before, self.overdue, self.created_after)
+        return all(value is None for value in filters) and self.order_by == "board"
+
+
+class TaskChangesQuerySchema(BaseModel):
+    since: int | None = Field(None, ge=0, description="next_since of the previous sync; omit for a full sync")
+
+
+class TaskSearchQuerySchema(BaseModel):
+    q: str = Field(..., min_length=1, max_length=200, description="Words to search for in task text")
+    limit: int | None = Field(None, ge=1, le=100, description="Page size")
+    cursor: str | None = Field(None, min_length=1, description="Opaque next_cursor from the previous page")
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+class TaskSummaryQuerySchema(BaseModel):
+    due_soon_days: int = Field(7, ge=1, le=90, description="Days ahead that count as due soon")
+
+
+class TaskSummarySchema(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    overdue: int
+    due_soon: int
+    due_soon_days: int
+    as_of: IsoDatetime
+
+
+# Bulk operation schemas
+class TaskBulkCreateOp(BaseModel):
+    op: Literal["create"]
+    data: TaskCreateSchema
+
+
+class TaskBulkUpdateOp(BaseModel):
+    op: Literal["update"]
+    id: int
+    data: TaskUpdateSchema
+
+
+class TaskBulkDeleteOp(BaseModel):
+    op: Literal["delete"]
+    id: int
+
+
+TaskBulkOp = Annotated[
+    Union[TaskBulkCreateOp, TaskBulkUpdateOp, TaskBulkDeleteOp],
+    Field(discriminator="op")
+]
+
+
+class TaskBulkSchema(BaseModel):
+    operations: List[TaskBulkOp] = Field(..., min_length=1, max_length=1000, description="Operations applied in order")
+
+
+class TaskBulkResultSchema(BaseModel):
+    index: int
+    op: str
+    status: int
+    id: int | None = None
+    task: TaskOutSchema | None = None
+    error: str | None = None
@@ -1,7 +1,7 @@
 # app/schemas/user_schemas.py
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from typing import Annotated
-from datetime import datetime
+from .common import IsoDatetime
 
 # Define reusable annotated types
 Username = Annotated[
@@ -36,8 +36,8 @@ class UserOutSchema(BaseModel):
     id: int
     username: str
     email: EmailStr
-    created_at: datetime
-    updated_at: datetime | None = None
+    created_at: IsoDatetime
+    updated_at: IsoDatetime | None = None
 
     # Tell Pydantic to read attributes off the ORM object
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,124 @@
+# app/search.py
+import re
+from typing import List
+from sqlalchemy import DDL, column, event, func, literal_column, select, table, text
+from app.compression import SQLITE_TEXT_FUNCTION
+
+# Task columns covered by full-text search; title matches weigh most
+SEARCH_COLUMNS = ("title", "why", "what", "how", "acceptance_criteria")
+TITLE_WEIGHT = 10.0
+
+# SQLite: FTS column holding the owning user's token
+SEARCH_OWNER_COLUMN = "owner"
+
+# Terms beyond this are ignored
+MAX_SEARCH_TERMS = 16
+
+# SQLite: contentless FTS5 index (the text lives only in the task table,
+# where CompressedText may store it as zlib BLOBs, see app/compression.py).
+# It is written by SearchIndexService from TaskService's task writes, not
+# by triggers, so the schema does not depend on the task_text() function
+# the app registers on its own connections and any client can write to the
+# task table. Rows inserted or edited outside TaskService stay unindexed
+# until SearchIndexService.rebuild() (python rebuild_search_index.py).
+# contentless_delete (SQLite 3.43+) lets rows be replaced and deleted by
+# rowid alone; the only trigger drops the rows of hard-deleted tasks.
+# The owner column holds one token per user (owner_token()); every search
+# MATCHes it, so FTS5 only ranks the searching user's rows.
+_cols = ", ".join(SEARCH_COLUMNS + (SEARCH_OWNER_COLUMN,))
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5("
+    f"{_cols}, content='', contentless_delete=1, tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN "
+    "DELETE FROM task_fts WHERE rowid = old.id; END",
+]
+SQLITE_SEARCH_DROP = [
+    "DROP TABLE IF EXISTS task_fts",
+]
+# Index (or re-index) one task from its plain-text values
+SQLITE_SEARCH_UPSERT = (
+    f"INSERT OR REPLACE INTO task_fts(rowid, {_cols}) "
+    f"VALUES (:id, {', '.join(':' + name for name in SEARCH_COLUMNS)}, :{SEARCH_OWNER_COLUMN})"
+)
+# Index tasks straight from the table, decompressing in SQL; the caller
+# appends a WHERE clause to limit the rows
+SQLITE_SEARCH_REINDEX = (
+    f"INSERT INTO task_fts(rowid, {_cols}) SELECT id, "
+    + ", ".join(name if name == "title" else f"{SQLITE_TEXT_FUNCTION}({name})" for name in SEARCH_COLUMNS)
+    + ", 'u' || user_id FROM task"
+)
+
+# PostgreSQL: weighted tsvector expression in a GIN index led by user_id
+# (btree_gin supplies the integer operator class), so one index scan
+# answers "this user's rows matching the query"; the search query repeats
+# the exact expression so the planner can use the index
+POSTGRESQL_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', "
+    + " || ' ' || ".join(f"coalesce({name}, '')" for name in SEARCH_COLUMNS[1:])
+    + "), 'B')"
+)
+POSTGRESQL_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"CREATE INDEX IF NOT EXISTS ix_task_user_search ON task USING gin (user_id, ({POSTGRESQL_SEARCH_VECTOR}))",
+]
+
+
+def install_search_ddl(task_table):
+    """Create the dialect's search index whenever metadata creates the task table."""
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(task_table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in SQLITE_SEARCH_DROP:
+        event.listen(task_table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in POSTGRESQL_SEARCH_DDL:
+        event.listen(task_table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def search_terms(q: str) -> List[str]:
+    """Split free text into lowercase word terms (no operators pass through)."""
+    return re.findall(r"\w+", q.lower())[:MAX_SEARCH_TERMS]
+
+
+def owner_token(user_id: int) -> str:
+    """The token a user's rows carry in the SQLite FTS owner column."""
+    return f"u{user_id}"
+
+
+def ranked_matches(dialect_name: str, terms: List[str], user_id: int):
+    """
+    Subquery of (id, rank) for a user's tasks matching every term, the last
+    term as a prefix (search-as-you-type). Lower rank is a better match on
+    both dialects. Rows of other users are excluded by the index itself, not
+    filtered after ranking.
+
+    Args:
+        dialect_name: Name of the database dialect ("sqlite" or "postgresql")
+        terms: Non-empty list from search_terms()
+        user_id: ID of the user whose tasks are searched
+
+    Returns:
+        Subquery with `id` and `rank` columns, including soft-deleted tasks
+    """
+    if dialect_name == "postgresql":
+        task = table("task", *(column(name) for name in ("id", "user_id") + SEARCH_COLUMNS))
+        vector = literal_column(f"({POSTGRESQL_SEARCH_VECTOR})")
+        query = func.to_tsquery(literal_column("'english'"), " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+        return select(
+            task.c.id,
+            (-func.ts_rank_cd(vector, query)).label("rank"),
+        ).where(task.c.user_id == user_id, vector.op("@@")(query)).subquery("matches")
+
+    # Terms are \w-only, so double-quoting each one is a safe FTS5 phrase;
+    # the "- owner :" filter keeps them from matching the owner tokens
+    phrases = " ".join(f'"{term}"' for term in terms) + "*"
+    match = (
+        f"{SEARCH_OWNER_COLUMN} : {owner_token(user_id)} AND "
+        f"- {SEARCH_OWNER_COLUMN} : ({phrases})"
+    )
+    fts = table("task_fts", column("rowid"))
+    # The owner column carries no weight in the rank
+    weights = [TITLE_WEIGHT] + [1.0] * (len(SEARCH_COLUMNS) - 1) + [0.0]
+    return select(
+        fts.c.rowid.label("id"),
+        func.bm25(literal_column("task_fts"), *weights).label("rank"),
+    ).where(text("task_fts MATCH :match").bindparams(match=match)).subquery("matches")
@@ -1,12 +1,89 @@
 # backend/app/services/auth_service.py
+from datetime import datetime
 from http import HTTPStatus
+from typing import Any, Optional
 from flask_jwt_extended import create_access_token
+from sqlalchemy import select
+from app.extensions import db, token_version_cache
 from app.models import User
 from app.errors import APIError
 from app.schemas import UserRegisterSchema, UserLoginSchema, UserOutSchema
 
+# Profile fields carried in access tokens, next to the user's token_version
+USER_CLAIMS = ("username", "email", "created_at", "updated_at")
+VERSION_CLAIM = "ver"
+
 
 class AuthService:
+    @staticmethod
+    def issue_token(user: User) -> str:
+        """
+        Create an access token carrying the user's profile and token_version.
+        
+        Args:
+            user: The user to issue the token for
+            
+        Returns:
+            Encoded access token
+        """
+        claims = {
+            "username": user.username,
+            "email": user.email,
+            "created_at": user.created_at.isoformat(),
+            "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+            VERSION_CLAIM: user.token_version or 0,
+        }
+        return create_access_token(identity=str(user.id), additional_claims=claims)
+
+    @staticmethod
+    def current_token_version(user_id: int) -> Optional[int]:
+        """
+        Get a user's token_version, from the version cache when possible.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            The current token_version, or None if the user does not exist
+        """
+        version = token_version_cache.get(user_id)
+        if version is not None:
+            return version
+        
+        generation = token_version_cache.generation(user_id)
+        version = db.session.scalar(select(User.token_version).where(User.id == user_id))
+        if version is not None:
+            token_version_cache.set(user_id, version, generation)
+        return version
+
+    @staticmethod
+    def user_from_claims(user_id: int, claims: dict[str, Any]) -> Optional[UserOutSchema]:
+        """
+        Build the user's profile from verified token claims if they are current.
+        
+        Args:
+            user_id: ID of the authenticated user
+            claims: Claims of the verified access token
+            
+        Returns:
+            UserOutSchema built from the claims, or None if the token predates
+            the last profile/password change (or carries no profile claims)
+        """
+        if VERSION_CLAIM not in claims or any(name not in claims for name in USER_CLAIMS):
+            return None
+        if AuthService.current_token_version(user_id) != claims[VERSION_CLAIM]:
+            return None
+        
+        # Claims were signed by us, so skip re-validating them
+        updated_at = claims["updated_at"]
+        return UserOutSchema.model_construct(
+            id=user_id,
+            username=claims["username"],
+            email=claims["email"],
+            created_at=datetime.fromisoformat(claims["created_at"]),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        )
+
     @staticmethod
     def register_user(data: UserRegisterSchema) -> tuple[str, UserOutSchema]:
         """
@@ -28,7 +105,7 @@ class AuthService:
         user.set_password(data.password)
         user.save()
 
-        token = create_access_token(identity=str(user.id))
+        token = AuthService.issue_token(user)
         user_out = UserOutSchema.model_validate(user)
         
         return token, user_out
@@ -37,6 +114,7 @@ class AuthService:
     def authenticate_user(data: UserLoginSchema) -> tuple[str, UserOutSchema]:
         """
         Authenticate user and return access token and user data.
+        Re-hashes the password with the current cost parameters if needed.
         
         Args:
             data: Validated user login data
@@ -51,18 +129,28 @@ class AuthService:
         if not user or not user.check_password(data.password):
             raise APIError("Invalid credentials", status=HTTPStatus.UNAUTHORIZED)
 
-        token = create_access_token(identity=str(user.id))
+        # Transparently upgrade hashes made with older cost parameters
+        if user.password_needs_rehash():
+            user.set_password(data.password)
+            user.save()
+
+        token = AuthService.issue_token(user)
         user_out = UserOutSchema.model_validate(user)
         
         return token, user_out
 
     @staticmethod
-    def refresh_user_token(user_id: int) -> tuple[str, UserOutSchema]:
+    def refresh_user_token(user_id: int, claims: Optional[dict[str, Any]] = None) -> tuple[str, UserOutSchema]:
         """
         Refresh access token for authenticated user.
         
+        When the current token's claims are up to date (its token_version
+        matches), the new token and user data are built from them without
+        loading the user.
+        
         Args:
             user_id: ID of the authenticated user
+            claims: Claims of the verified access token
             
         Returns:
             tuple: (new_access_token, user_data)
@@ -70,11 +158,18 @@ class AuthService:
         Raises:
             APIError: If user not found
         """
+        if claims is not None:
+            user_out = AuthService.user_from_claims(user_id, claims)
+            if user_out is not None:
+                additional_claims = {name: claims[name] for name in USER_CLAIMS + (VERSION_CLAIM,)}
+                new_token = create_access_token(identity=str(user_id), additional_claims=additional_claims)
+                return new_token, user_out
+        
         user = User.query.get(user_id)
         if not user:
             raise APIError("User not found", status=HTTPStatus.NOT_FOUND)
         
-        new_token = create_access_token(identity=str(user.id))
+        new_token = AuthService.issue_token(user)
         user_out = UserOutSchema.model_validate(user)
         
         return new_token, user_out
\ No newline at end of file
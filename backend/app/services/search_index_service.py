@@ -0,0 +1,76 @@
+# backend/app/services/search_index_service.py
+from typing import Iterable, Optional
+from sqlalchemy import bindparam, text
+from app.extensions import db
+from app.models import Task
+from app.search import (
+    SEARCH_COLUMNS,
+    SEARCH_OWNER_COLUMN,
+    SQLITE_SEARCH_REINDEX,
+    SQLITE_SEARCH_UPSERT,
+    owner_token,
+)
+
+
+class SearchIndexService:
+    @staticmethod
+    def record(tasks: Iterable[Task]) -> None:
+        """
+        Index created tasks, or re-index tasks whose text changed.
+
+        SQLite only: the rows are written with a single INSERT OR REPLACE
+        executemany into task_fts, in the current session transaction, so the
+        index commits (or rolls back) together with the task write; the
+        caller commits. PostgreSQL indexes an expression over the task
+        columns itself, so nothing is sent there.
+
+        Args:
+            tasks: Flushed Task instances with their text columns loaded
+                (undefer_group('text')), so no per-task reload is issued
+        """
+        if db.session.get_bind().dialect.name != "sqlite":
+            return
+        rows = [
+            {
+                "id": task.id,
+                **{name: getattr(task, name) for name in SEARCH_COLUMNS},
+                SEARCH_OWNER_COLUMN: owner_token(task.user_id),
+            }
+            for task in tasks
+        ]
+        if rows:
+            db.session.execute(text(SQLITE_SEARCH_UPSERT), rows)
+
+    @staticmethod
+    def rebuild(user_ids: Optional[list[int]] = None) -> int:
+        """
+        Re-index tasks from the task table in bulk.
+
+        Their index rows are deleted and re-inserted with one INSERT ...
+        SELECT that decompresses the text in SQL, in the current session
+        transaction; the caller commits. Use after task writes that bypass
+        TaskService (bulk loads, manual SQL, other clients). No-op on
+        PostgreSQL.
+
+        Args:
+            user_ids: Restrict to these users' tasks (None for every task)
+
+        Returns:
+            Number of tasks indexed
+        """
+        if db.session.get_bind().dialect.name != "sqlite":
+            return 0
+        if user_ids is None:
+            db.session.execute(text("INSERT INTO task_fts(task_fts) VALUES ('delete-all')"))
+            return db.session.execute(text(SQLITE_SEARCH_REINDEX)).rowcount
+
+        user_filter = "WHERE user_id IN :user_ids"
+        params = {"user_ids": user_ids}
+        expanding = bindparam("user_ids", expanding=True)
+        db.session.execute(
+            text(f"DELETE FROM task_fts WHERE rowid IN (SELECT id FROM task {user_filter})").bindparams(expanding),
+            params
+        )
+        return db.session.execute(
+            text(f"{SQLITE_SEARCH_REINDEX} {user_filter}").bindparams(expanding), params
+        ).rowcount
@@ -0,0 +1,151 @@
+# backend/app/services/task_counter_service.py
+from collections import defaultdict
+from typing import Iterable, Optional
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models import CLOSED_STATUSES, Task, TaskStatus, UserTaskCounter
+
+# What a task contributes to the counters: (status, counts toward
+# overdue_eligible_count), or None for a deleted / not yet existing task
+CounterState = Optional[tuple[TaskStatus, bool]]
+
+
+def counter_state(status: TaskStatus, due_date, is_deleted: bool = False) -> CounterState:
+    """Counter contribution of a task with the given column values."""
+    if is_deleted:
+        return None
+    return status, due_date is not None and status not in CLOSED_STATUSES
+
+
+class TaskCounterService:
+    @staticmethod
+    def record(user_id: int, changes: Iterable[tuple[CounterState, CounterState]]) -> None:
+        """
+        Apply task state changes to a user's counters.
+
+        The net change per status is written with a single upsert executemany
+        in the current session transaction, so the counters commit (or roll
+        back) together with the task write; the caller commits. Nothing is
+        sent when the changes cancel out. The "before" states must be read
+        under a lock (TaskService._for_update) or come from a conditional
+        write, otherwise concurrent writers count the same change twice.
+
+        Args:
+            user_id: ID of the user owning the tasks
+            changes: (state before, state after) per task, from counter_state()
+        """
+        deltas = defaultdict(lambda: [0, 0])
+        for before, after in changes:
+            if before == after:
+                continue
+            if before is not None:
+                deltas[before[0]][0] -= 1
+                deltas[before[0]][1] -= before[1]
+            if after is not None:
+                deltas[after[0]][0] += 1
+                deltas[after[0]][1] += after[1]
+
+        # Sorted so concurrent writers lock counter rows in the same order
+        rows = [
+            {"user_id": user_id, "status": status, "live_count": live, "overdue_eligible_count": eligible}
+            for status, (live, eligible) in sorted(deltas.items(), key=lambda item: item[0].name)
+            if live or eligible
+        ]
+        if rows:
+            TaskCounterService._add(rows)
+
+    @staticmethod
+    def _add(rows: list[dict]) -> None:
+        """Add each row's counts to its counter, creating missing counters."""
+        table = UserTaskCounter.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            statement = dialect_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.status],
+                set_={
+                    "live_count": table.c.live_count + statement.excluded.live_count,
+                    "overdue_eligible_count": (
+                        table.c.overdue_eligible_count + statement.excluded.overdue_eligible_count
+                    ),
+                },
+            )
+            db.session.execute(statement, rows)
+            return
+
+        # No portable upsert: update in place, insert the counters that were missing
+        for row in rows:
+            result = db.session.execute(
+                update(table)
+                .where(table.c.user_id == row["user_id"], table.c.status == row["status"])
+                .values(
+                    live_count=table.c.live_count + row["live_count"],
+                    overdue_eligible_count=table.c.overdue_eligible_count + row["overdue_eligible_count"],
+                )
+            )
+            if result.rowcount == 0:
+                db.session.execute(insert(table), row)
+
+    @staticmethod
+    def get_counts(user_id: int) -> dict[TaskStatus, tuple[int, int]]:
+        """
+        Read a user's counters: one primary-key range read of at most one row
+        per status, however many tasks the user has.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Mapping of status to (live_count, overdue_eligible_count); statuses
+            without a counter row have no tasks
+        """
+        rows = db.session.execute(
+            select(
+                UserTaskCounter.status,
+                UserTaskCounter.live_count,
+                UserTaskCounter.overdue_eligible_count
+            ).where(UserTaskCounter.user_id == user_id)
+        )
+        return {status: (live, eligible) for status, live, eligible in rows}
+
+    @staticmethod
+    def rebuild(user_ids: Optional[list[int]] = None) -> int:
+        """
+        Recompute counters from the task table in bulk.
+
+        Existing counters are deleted and re-inserted with one INSERT ... SELECT
+        grouped by (user_id, status), in the current session transaction; the
+        caller commits. Use after writes that bypass TaskService (bulk loads,
+        manual SQL) or to repair drift.
+
+        Args:
+            user_ids: Restrict to these users (None for every user)
+
+        Returns:
+            Number of counter rows written
+        """
+        conditions = [Task.is_deleted == False]
+        clear = delete(UserTaskCounter)
+        if user_ids is not None:
+            conditions.append(Task.user_id.in_(user_ids))
+            clear = clear.where(UserTaskCounter.user_id.in_(user_ids))
+
+        counts = select(
+            Task.user_id,
+            Task.status,
+            func.count(),
+            func.sum(case(
+                (Task.due_date.is_not(None) & Task.status.notin_(CLOSED_STATUSES), 1),
+                else_=0
+            )),
+        ).where(*conditions).group_by(Task.user_id, Task.status)
+
+        db.session.execute(clear)
+        result = db.session.execute(
+            insert(UserTaskCounter).from_select(
+                ["user_id", "status", "live_count", "overdue_eligible_count"], counts
+            )
+        )
+        return result.rowcount
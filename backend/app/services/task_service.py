@@ -1,30 +1,188 @@
 # backend/app/services/task_service.py
+from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
-from typing import List
-from app.models import Task, TaskStatus
+from typing import Any, Iterator, List, Optional
+from sqlalchemy import and_, case, func, insert, or_, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import undefer_group
+from app.extensions import db, task_cache
+from app.models import CLOSED_STATUSES, Task, TaskStatus, User
 from app.errors import APIError
-from app.schemas import TaskCreateSchema, TaskUpdateSchema, TaskOutSchema, TaskTableSchema
+from app.search import SEARCH_COLUMNS, search_terms, ranked_matches
+from app.services.search_index_service import SearchIndexService
+from app.services.task_counter_service import TaskCounterService, counter_state
+from app.schemas import (
+    TaskCreateSchema, 
+    TaskUpdateSchema, 
+    TaskOutSchema, 
+    TaskTableSchema, 
+    TaskChangeSchema, 
+    TaskBulkSchema, 
+    TaskBulkResultSchema,
+    TaskBatchReorderSchema,
+    TaskListQuerySchema,
+    TaskSummarySchema,
+)
+from app.utils import encode_cursor, decode_cursor
+
+# Page size used when a cursor is supplied without an explicit limit
+DEFAULT_PAGE_SIZE = 100
+
+# Spacing between consecutive sort_order values after a rebalance
+SORT_ORDER_GAP = 1000.0
+
+# Rows fetched per round trip when streaming the task list
+STREAM_CHUNK_SIZE = 500
+
+# Page size of search results when no limit is given
+DEFAULT_SEARCH_PAGE_SIZE = 20
+
+# Columns of the table view, in TaskTableSchema.from_rows order; list queries
+# select only these (plus sort keys) instead of loading Task entities
+TABLE_COLUMNS = (Task.id, Task.title, Task.status, Task.created_at, Task.due_date)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return an aware UTC datetime; naive values are taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
 
 
 class TaskService:
     @staticmethod
-    def get_user_tasks(user_id: int) -> List[TaskTableSchema]:
+    def get_user_tasks(
+        user_id: int, 
+        filters: Optional[TaskListQuerySchema] = None, 
+        marker: Optional[str] = None
+    ) -> List[TaskTableSchema]:
         """
         Get all non-deleted tasks for a user.
         
+        The unfiltered board is served from the per-user board cache when
+        the entry was stored under the current `marker` (get_tasks_marker);
+        every TaskService mutation also invalidates the user's entry in this
+        worker after it commits. Without a marker the board is read from the
+        database. Filtered or re-ordered views are read with SQL predicates
+        (see _list_statement) and bypass the cache.
+        
         Args:
             user_id: ID of the user
+            filters: Optional filters and order_by from the list query
+            marker: Current get_tasks_marker value, if the caller has it
             
         Returns:
             List of task table data
         """
-        try:
-            tasks = Task.query.filter_by(
+        if filters is not None and not filters.is_default_view:
+            rows = []
+            for _, statement in TaskService._list_segments(user_id, filters):
+                rows.extend(TaskService._fetch_rows(statement))
+            return TaskTableSchema.from_rows(rows)
+        
+        # An entry stored before another worker's write carries an older
+        # marker and counts as a miss, so it is never served under the new ETag
+        cached = task_cache.get(user_id, marker) if marker is not None else None
+        if cached is not None:
+            return cached
+        
+        generation = task_cache.generation(user_id)
+        rows = TaskService._fetch_rows(
+            select(*TABLE_COLUMNS).filter_by(
                 user_id=user_id, 
                 is_deleted=False
-            ).order_by(Task.status, Task.sort_order).all()
+            ).order_by(Task.status, Task.sort_order, Task.id)
+        )
+        tasks_out = TaskTableSchema.from_rows(rows)
+        task_cache.set(user_id, tasks_out, generation, marker)
+        return tasks_out
+
+    @staticmethod
+    def iter_user_tasks(
+        user_id: int, 
+        chunk_size: int = STREAM_CHUNK_SIZE, 
+        filters: Optional[TaskListQuerySchema] = None
+    ) -> Iterator[List[TaskTableSchema]]:
+        """
+        Stream all non-deleted tasks for a user in chunks.
+        
+        Rows are fetched `chunk_size` at a time with yield_per, so only one
+        chunk of row tuples and schemas is alive at any point.
+        
+        Args:
+            user_id: ID of the user
+            chunk_size: Number of rows per chunk
+            filters: Optional filters and order_by from the list query
+            
+        Yields:
+            Lists of task table data, in the requested order
+        """
+        for _, statement in TaskService._list_segments(user_id, filters):
+            result = db.session.connection().execute(statement, execution_options={"yield_per": chunk_size})
+            for partition in result.partitions():
+                yield TaskTableSchema.from_rows(partition)
+
+    @staticmethod
+    def get_user_tasks_page(
+        user_id: int, 
+        limit: Optional[int] = None, 
+        cursor: Optional[str] = None,
+        filters: Optional[TaskListQuerySchema] = None
+    ) -> tuple[List[TaskTableSchema], Optional[str]]:
+        """
+        Get one page of non-deleted tasks for a user using keyset pagination.
+        
+        Pages follow the requested order (board order by default: status,
+        sort_order, id) and continue strictly after the row encoded in the
+        cursor, so the cost of page N does not depend on N.
+        
+        Args:
+            user_id: ID of the user
+            limit: Maximum number of tasks to return
+            cursor: Opaque cursor returned as next_cursor by the previous page
+            filters: Optional filters and order_by from the list query
+            
+        Returns:
+            tuple: (task table data, next_cursor or None on the last page)
             
-            return [TaskTableSchema.model_validate(task) for task in tasks]
+        Raises:
+            APIError: If the cursor is invalid
+        """
+        limit = limit or DEFAULT_PAGE_SIZE
+        after = None
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                segment, *after = values
+                segment = int(segment)
+            except (TypeError, ValueError):
+                raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+        
+        # Fetch one extra row to learn whether another page exists
+        rows = []
+        for index, statement in TaskService._list_segments(user_id, filters, segment if cursor else None, after):
+            fetched = TaskService._fetch_rows(statement.limit(limit + 1 - len(rows)))
+            rows.extend((index, row) for row in fetched)
+            if len(rows) > limit:
+                break
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            index, last = rows[-1]
+            next_cursor = encode_cursor([index] + TaskService._cursor_values(last, filters, index))
+        
+        return TaskTableSchema.from_rows(row for _, row in rows), next_cursor
+
+    @staticmethod
+    def _fetch_rows(statement) -> list:
+        """
+        Run a task column SELECT on the session's connection, turning unknown
+        stored status values into a clear APIError. Column rows need none of
+        the ORM result machinery, so they skip it.
+        """
+        try:
+            return db.session.connection().execute(statement).all()
         except Exception as e:
             if "not among the defined enum values" in str(e):
                 raise APIError(
@@ -33,6 +191,334 @@ class TaskService:
                 )
             raise
 
+    @staticmethod
+    def _list_orderings(order_by: str) -> list:
+        """
+        Segments read in turn for a list order, as (predicate, sort columns, descending).
+        
+        due_date orders read tasks with a due date first and the rest second,
+        so tasks without one come last in both directions while each segment
+        is still served in index order.
+        """
+        descending = order_by.startswith("-")
+        if order_by in ("created_at", "-created_at"):
+            return [(None, (Task.created_at, Task.id), descending)]
+        if order_by in ("due_date", "-due_date"):
+            return [
+                (Task.due_date.isnot(None), (Task.due_date, Task.id), descending),
+                (Task.due_date.is_(None), (Task.id,), descending),
+            ]
+        return [(None, (Task.status, Task.sort_order, Task.id), False)]
+
+    @staticmethod
+    def _filter_predicates(filters: Optional[TaskListQuerySchema]) -> list:
+        """Translate list query filters into SQL predicates on indexed task columns."""
+        if filters is None:
+            return []
+        predicates = []
+        if filters.status:
+            predicates.append(Task.status.in_([TaskStatus(status.value) for status in filters.status]))
+        if filters.due_after is not None:
+            predicates.append(Task.due_date >= _as_utc(filters.due_after))
+        if filters.due_before is not None:
+            predicates.append(Task.due_date < _as_utc(filters.due_before))
+        if filters.created_after is not None:
+            predicates.append(Task.created_at > _as_utc(filters.created_after))
+        if filters.overdue is not None:
+            now = datetime.now(timezone.utc)
+            if filters.overdue:
+                predicates.append(and_(Task.due_date < now, Task.status.notin_(CLOSED_STATUSES)))
+            else:
+                predicates.append(or_(
+                    Task.due_date.is_(None), 
+                    Task.due_date >= now, 
+                    Task.status.in_(CLOSED_STATUSES)
+                ))
+        return predicates
+
+    @staticmethod
+    def _list_segments(
+        user_id: int, 
+        filters: Optional[TaskListQuerySchema], 
+        start_segment: Optional[int] = None, 
+        after: Optional[list] = None
+    ) -> Iterator[tuple[int, Any]]:
+        """
+        Yield (segment index, ordered SELECT) for a user's filtered task list,
+        resuming strictly after the cursor row `after` in `start_segment`.
+        
+        The statements select TABLE_COLUMNS followed by the order's sort
+        columns, so every row carries its own cursor values.
+        
+        Raises:
+            APIError: If the cursor does not fit the requested order
+        """
+        order_by = filters.order_by if filters else "board"
+        orderings = TaskService._list_orderings(order_by)
+        # Due-date filters exclude tasks without a due date; skip reading them
+        if filters is not None and (
+            filters.due_after is not None or filters.due_before is not None or filters.overdue
+        ):
+            orderings = orderings[:1]
+        # Board order also sorts (and pages) on sort_order; the other orders
+        # only use table columns
+        extra_columns = [Task.sort_order] if order_by == "board" else []
+        base = select(*TABLE_COLUMNS, *extra_columns).where(
+            Task.user_id == user_id,
+            Task.is_deleted == False,
+            *TaskService._filter_predicates(filters)
+        )
+        if start_segment is not None and not 0 <= start_segment < len(orderings):
+            raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+        
+        for index, (predicate, columns, descending) in enumerate(orderings):
+            if start_segment is not None and index < start_segment:
+                continue
+            statement = base if predicate is None else base.where(predicate)
+            if index == start_segment:
+                key = TaskService._decode_cursor_values(columns, after)
+                statement = statement.where(
+                    tuple_(*columns) < key if descending else tuple_(*columns) > key
+                )
+            order = [column.desc() if descending else column for column in columns]
+            yield index, statement.order_by(*order)
+
+    @staticmethod
+    def _cursor_values(row, filters: Optional[TaskListQuerySchema], segment: int) -> list:
+        """JSON-safe sort key of a list row for the given ordering segment."""
+        _, columns, _ = TaskService._list_orderings(filters.order_by if filters else "board")[segment]
+        values = []
+        for column in columns:
+            value = getattr(row, column.key)
+            if isinstance(value, TaskStatus):
+                value = value.name
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _decode_cursor_values(columns: tuple, values: Optional[list]) -> tuple:
+        """Inverse of _cursor_values; raises APIError on a malformed cursor."""
+        if not values or len(values) != len(columns):
+            raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+        try:
+            key = []
+            for column, value in zip(columns, values):
+                if column is Task.status:
+                    key.append(TaskStatus[value])
+                elif column in (Task.created_at, Task.due_date):
+                    key.append(datetime.fromisoformat(value))
+                elif column is Task.sort_order:
+                    key.append(float(value))
+                else:
+                    key.append(int(value))
+        except (KeyError, TypeError, ValueError):
+            raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+        return tuple(key)
+
+    @staticmethod
+    def search_tasks(
+        user_id: int, 
+        q: str, 
+        limit: Optional[int] = None, 
+        cursor: Optional[str] = None
+    ) -> tuple[List[TaskTableSchema], Optional[str]]:
+        """
+        Full-text search over a user's non-deleted tasks, best matches first.
+        
+        Every word in `q` must match (the last one as a prefix) in the title or
+        any text field, with title matches ranked higher. Uses the FTS5 index on
+        SQLite and the GIN tsvector index on PostgreSQL (see app/search.py),
+        both scoped to the user so only their rows are matched and ranked.
+        Pages are keyed on (rank, id) like get_user_tasks_page.
+        
+        Args:
+            user_id: ID of the user
+            q: Free-text query
+            limit: Maximum number of tasks to return
+            cursor: Opaque cursor returned as next_cursor by the previous page
+            
+        Returns:
+            tuple: (task table data, next_cursor or None on the last page)
+            
+        Raises:
+            APIError: If the cursor is invalid
+        """
+        terms = search_terms(q)
+        if not terms:
+            return [], None
+        limit = limit or DEFAULT_SEARCH_PAGE_SIZE
+        
+        matches = ranked_matches(db.session.get_bind().dialect.name, terms, user_id)
+        query = select(
+            Task.id, Task.title, Task.status, Task.created_at, Task.due_date, matches.c.rank
+        ).join(matches, matches.c.id == Task.id).where(
+            Task.user_id == user_id,
+            Task.is_deleted == False
+        )
+        
+        if cursor:
+            values = decode_cursor(cursor)
+            try:
+                rank, task_id = values
+                after = (float(rank), int(task_id))
+            except (TypeError, ValueError):
+                raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+            query = query.where(tuple_(matches.c.rank, Task.id) > after)
+        
+        # Fetch one extra row to learn whether another page exists
+        rows = db.session.execute(query.order_by(matches.c.rank, Task.id).limit(limit + 1)).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1].rank, rows[-1].id])
+        
+        return TaskTableSchema.from_rows(rows), next_cursor
+
+    @staticmethod
+    def get_task_summary(user_id: int, due_soon_days: int) -> TaskSummarySchema:
+        """
+        Count a user's non-deleted tasks per status, plus open tasks that are
+        overdue or due within the next `due_soon_days` days.
+        
+        Per-status counts come from the user_task_counters rows (at most one
+        per status), so they cost the same however many tasks the user has.
+        Overdue and due-soon depend on the clock and cannot be kept as
+        counters; they are counted over the (user_id, due_date) index range
+        ending at the due-soon horizon, and skipped entirely when the counters
+        show no open task with a due date.
+        
+        Args:
+            user_id: ID of the user
+            due_soon_days: Size of the due-soon window, starting now
+            
+        Returns:
+            TaskSummarySchema with every status present (zero when empty)
+        """
+        now = datetime.now(timezone.utc)
+        soon = now + timedelta(days=due_soon_days)
+        counts = TaskCounterService.get_counts(user_id)
+        
+        by_status = {status.value: 0 for status in TaskStatus}
+        for status, (live, _) in counts.items():
+            by_status[status.value] = live
+        
+        overdue = due_soon = 0
+        if any(eligible for _, eligible in counts.values()):
+            overdue, due_soon = db.session.execute(
+                select(
+                    func.sum(case((Task.due_date < now, 1), else_=0)),
+                    func.sum(case((Task.due_date >= now, 1), else_=0)),
+                ).where(
+                    Task.user_id == user_id,
+                    Task.is_deleted == False,
+                    Task.due_date < soon,
+                    Task.status.notin_(CLOSED_STATUSES)
+                )
+            ).one()
+        
+        return TaskSummarySchema(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            overdue=overdue or 0,
+            due_soon=due_soon or 0,
+            due_soon_days=due_soon_days,
+            as_of=now,
+        )
+
+    @staticmethod
+    def get_task_changes(
+        user_id: int, 
+        since: Optional[int] = None
+    ) -> tuple[List[TaskChangeSchema], List[int], int]:
+        """
+        Get tasks created, updated or soft-deleted after a change sequence number.
+        
+        Every task write stamps the rows it touches with the user's next
+        change sequence number (see advance_change_seq). Sequence numbers
+        become visible in commit order, unlike timestamps taken before the
+        commit, so a change can never land behind a next_since already
+        handed out.
+        
+        Args:
+            user_id: ID of the user
+            since: next_since of the previous sync (exclusive); None for a
+                full sync, which returns every live task and no tombstones
+            
+        Returns:
+            tuple: (changed live tasks, IDs of deleted tasks, next_since) where
+            next_since is the latest change seen, to pass as `since` next time
+        """
+        query = Task.query.filter(Task.user_id == user_id)
+        if since is None:
+            query = query.filter(Task.is_deleted == False)
+        else:
+            query = query.filter(Task.change_seq > since)
+        
+        try:
+            # Oldest change first, in (user_id, change_seq) index order
+            tasks = query.order_by(Task.change_seq, Task.id).all()
+        except Exception as e:
+            if "not among the defined enum values" in str(e):
+                raise APIError(
+                    "Database contains corrupted task status data. Please contact support.",
+                    status=HTTPStatus.INTERNAL_SERVER_ERROR
+                )
+            raise
+        
+        changed = [TaskChangeSchema.model_validate(task) for task in tasks if not task.is_deleted]
+        deleted = [task.id for task in tasks if task.is_deleted]
+        next_since = tasks[-1].change_seq if tasks else since or 0
+        
+        return changed, deleted, next_since
+
+    @staticmethod
+    def get_tasks_marker(user_id: int) -> str:
+        """
+        Cheap change marker for a user's task list.
+        
+        The user's task change sequence (advance_change_seq): every create,
+        update, reorder or soft delete advances it in the writing
+        transaction, in commit order, so it is a single primary-key read
+        however many tasks the user has. Task rows written outside
+        TaskService without advancing it do not change the marker.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Marker string
+        """
+        change_seq = db.session.execute(
+            select(User.task_change_seq).where(User.id == user_id)
+        ).scalar()
+        return f"{user_id}:{change_seq}"
+
+    @staticmethod
+    def get_task_marker(task_id: int, user_id: int) -> Optional[str]:
+        """
+        Cheap change marker for a single task.
+        
+        Args:
+            task_id: ID of the task
+            user_id: ID of the user (for authorization)
+            
+        Returns:
+            Marker string, or None if the task does not exist
+        """
+        row = db.session.execute(
+            select(Task.created_at, Task.updated_at).filter_by(
+                id=task_id, 
+                user_id=user_id, 
+                is_deleted=False
+            )
+        ).first()
+        if row is None:
+            return None
+        return f"{task_id}:{row.created_at}:{row.updated_at}"
+
     @staticmethod
     def get_task_by_id(task_id: int, user_id: int) -> TaskOutSchema:
         """
@@ -49,7 +535,7 @@ class TaskService:
             APIError: If task not found or database error
         """
         try:
-            task = Task.query.filter_by(
+            task = Task.query.options(undefer_group("text")).filter_by(
                 id=task_id, 
                 user_id=user_id, 
                 is_deleted=False
@@ -67,6 +553,68 @@ class TaskService:
         
         return TaskOutSchema.model_validate(task)
 
+    @staticmethod
+    def _task_out(task: Task) -> TaskOutSchema:
+        """
+        Full view of a task just committed by save(). The commit expired it;
+        reloading the TaskOutSchema fields by name fetches the deferred text
+        in the same single SELECT the implicit refresh would have issued.
+        """
+        db.session.refresh(task, list(TaskOutSchema.model_fields))
+        return TaskOutSchema.model_validate(task)
+
+    @staticmethod
+    def advance_change_seq(user_id: Optional[int] = None) -> Optional[int]:
+        """
+        Advance a user's task change sequence; every task row the current
+        transaction writes is stamped with the new value (Task.change_seq).
+        
+        The UPDATE holds the user row's lock (the database write lock on
+        SQLite) until commit, so a user's task writes commit in sequence
+        order. Task writes call this before anything else, which also makes
+        every writer take its locks user row first, then task rows.
+        
+        Args:
+            user_id: ID of the user (None advances every user's sequence,
+                for maintenance writes across all boards)
+            
+        Returns:
+            The new sequence number, or None when advancing every user
+        """
+        # updated_at is pinned: it records profile changes, and would
+        # otherwise take its onupdate value on every task write
+        statement = update(User).values(
+            task_change_seq=User.task_change_seq + 1, 
+            updated_at=User.updated_at
+        )
+        if user_id is None:
+            db.session.execute(statement.execution_options(synchronize_session=False))
+            return None
+        return db.session.execute(
+            statement.where(User.id == user_id)
+            .returning(User.task_change_seq)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+
+    @staticmethod
+    def _for_update(statement):
+        """
+        Lock the task rows `statement` reads until the transaction ends, so
+        the state a counter delta is computed from cannot change before the
+        write commits. PostgreSQL gets SELECT ... FOR UPDATE. SQLite has no
+        row locks (FOR UPDATE is not rendered), so the database write lock is
+        taken up front with BEGIN IMMEDIATE, which also serializes the read
+        behind any write still in flight.
+        """
+        connection = db.session.connection()
+        if connection.dialect.name == "sqlite":
+            driver_connection = connection.connection.driver_connection
+            if not driver_connection.in_transaction:
+                # Transaction control like the BEGIN pysqlite issues itself,
+                # so it goes to the driver and is not counted as a query
+                driver_connection.execute("BEGIN IMMEDIATE")
+        return statement.with_for_update()
+
     @staticmethod
     def create_task(data: TaskCreateSchema, user_id: int) -> TaskOutSchema:
         """
@@ -87,11 +635,18 @@ class TaskService:
             acceptance_criteria=data.acceptance_criteria,
             status=TaskStatus(data.status),
             due_date=data.due_date,
-            user_id=user_id
+            user_id=user_id,
+            change_seq=TaskService.advance_change_seq(user_id)
         )
+        TaskCounterService.record(user_id, [(None, counter_state(task.status, task.due_date))])
+        # The search index row is keyed on the new task's id
+        db.session.add(task)
+        db.session.flush()
+        SearchIndexService.record([task])
         task.save()
+        task_cache.invalidate(user_id)
         
-        return TaskOutSchema.model_validate(task)
+        return TaskService._task_out(task)
 
     @staticmethod
     def update_task(task_id: int, data: TaskUpdateSchema, user_id: int) -> TaskOutSchema:
@@ -109,12 +664,19 @@ class TaskService:
         Raises:
             APIError: If task not found or database error
         """
+        update_data = data.model_dump(exclude_unset=True)
+        # A text change re-indexes the task, which needs all of its text
+        text_changed = any(update_data.get(name) is not None for name in SEARCH_COLUMNS)
+        change_seq = TaskService.advance_change_seq(user_id)
         try:
-            task = Task.query.filter_by(
+            query = Task.query.filter_by(
                 id=task_id, 
                 user_id=user_id, 
                 is_deleted=False
-            ).first()
+            )
+            if text_changed:
+                query = query.options(undefer_group("text"))
+            task = TaskService._for_update(query).first()
         except Exception as e:
             raise APIError(
                 "Database error - task may have corrupted data",
@@ -122,19 +684,26 @@ class TaskService:
             )
         
         if not task:
+            db.session.rollback()
             raise APIError("Task not found", status=HTTPStatus.NOT_FOUND)
         
+        before = counter_state(task.status, task.due_date)
+        
         # Update fields if provided
-        update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             if hasattr(task, field) and value is not None:
                 if field == 'status':
                     task.status = TaskStatus(value)
                 else:
                     setattr(task, field, value)
-            
+        task.change_seq = change_seq
+        
+        TaskCounterService.record(user_id, [(before, counter_state(task.status, task.due_date))])
+        if text_changed:
+            SearchIndexService.record([task])
         task.save()
-        return TaskOutSchema.model_validate(task)
+        task_cache.invalidate(user_id)
+        return TaskService._task_out(task)
 
     @staticmethod
     def delete_task(task_id: int, user_id: int) -> None:
@@ -148,20 +717,532 @@ class TaskService:
         Raises:
             APIError: If task not found
         """
-        task = Task.query.filter_by(
-            id=task_id, 
-            user_id=user_id, 
-            is_deleted=False
+        change_seq = TaskService.advance_change_seq(user_id)
+        # Conditional on is_deleted: of two concurrent deletes only one
+        # matches the row, and only that one adjusts the counters
+        row = db.session.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id, Task.is_deleted == False)
+            .values(is_deleted=True, updated_at=datetime.now(timezone.utc), change_seq=change_seq)
+            .returning(Task.status, Task.due_date)
+            .execution_options(synchronize_session=False)
         ).first()
         
-        if not task:
+        if row is None:
+            db.session.rollback()
             raise APIError("Task not found", status=HTTPStatus.NOT_FOUND)
         
-        task.is_deleted = True
-        task.save()
+        try:
+            TaskCounterService.record(user_id, [(counter_state(row.status, row.due_date), None)])
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise APIError(
+                "Database error",
+                status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                original=e
+            )
+        task_cache.invalidate(user_id)
+
+    @staticmethod
+    def bulk_apply(data: TaskBulkSchema, user_id: int) -> List[TaskBulkResultSchema]:
+        """
+        Apply a list of create/update/delete operations in one transaction.
+        
+        Operations are checked in order (an update after a delete of the same
+        task is rejected), then written with one batched INSERT, one
+        executemany UPDATE and one soft-delete UPDATE, plus one executemany
+        into the search index for created tasks and changed text. Every
+        UPDATE row sets the same columns (those written by any update op,
+        with the current values filled in), so the ORM sends a single
+        executemany rather than one statement per run of rows with matching
+        keys. Operations that fail their checks are reported per item and
+        skipped; a database error rolls back the whole batch.
+        
+        Args:
+            data: Validated bulk operations
+            user_id: ID of the user (for authorization)
+            
+        Returns:
+            One result per operation, in request order
+            
+        Raises:
+            APIError: If the batch cannot be written
+        """
+        operations = data.operations
+        results: List[Optional[TaskBulkResultSchema]] = [None] * len(operations)
+        change_seq = TaskService.advance_change_seq(user_id)
+        # Taken with the user row locked, like the change sequence
+        now = datetime.now(timezone.utc)
+        
+        # Same rule as update_task: unset and null fields are left alone
+        update_values = {
+            index: {
+                field: value 
+                for field, value in op.data.model_dump(exclude_unset=True).items() 
+                if value is not None
+            }
+            for index, op in enumerate(operations) if op.op == "update"
+        }
+        update_fields = sorted({field for values in update_values.values() for field in values})
+        
+        referenced_ids = {op.id for op in operations if op.op != "create"}
+        # Current values of every referenced live task: status and due_date
+        # for the counters, plus the columns the update rows will set. They
+        # are replayed op by op below.
+        current = {}
+        if referenced_ids:
+            selected = ["status", "due_date", *(f for f in update_fields if f not in ("status", "due_date"))]
+            current = {
+                row.id: {field: row._mapping[field] for field in selected}
+                for row in db.session.execute(TaskService._for_update(
+                    select(Task.id, *(Task.__table__.c[field] for field in selected)).where(
+                        Task.id.in_(referenced_ids),
+                        Task.user_id == user_id,
+                        Task.is_deleted == False
+                    )
+                ))
+            }
+        start_states = {
+            task_id: counter_state(values["status"], values["due_date"]) for task_id, values in current.items()
+        }
+        live_ids = set(current)
+        
+        create_rows, create_indexes = [], []
+        updated_ids: dict[int, None] = {}
+        reindex_ids = set()
+        update_indexes = []
+        delete_ids = []
+        
+        for index, op in enumerate(operations):
+            if op.op == "create":
+                try:
+                    status = TaskStatus(op.data.status)
+                except ValueError:
+                    results[index] = TaskBulkResultSchema(
+                        index=index, op=op.op, status=HTTPStatus.BAD_REQUEST, error="Invalid status"
+                    )
+                    continue
+                create_rows.append({
+                    **op.data.model_dump(exclude={"status"}),
+                    "status": status,
+                    "user_id": user_id,
+                    "change_seq": change_seq,
+                })
+                create_indexes.append(index)
+                continue
+            
+            if op.id not in live_ids:
+                results[index] = TaskBulkResultSchema(
+                    index=index, op=op.op, status=HTTPStatus.NOT_FOUND, id=op.id, error="Task not found"
+                )
+                continue
+            
+            if op.op == "update":
+                values = update_values[index]
+                if "status" in values:
+                    try:
+                        values["status"] = TaskStatus(values["status"])
+                    except ValueError:
+                        results[index] = TaskBulkResultSchema(
+                            index=index, op=op.op, status=HTTPStatus.BAD_REQUEST, id=op.id, error="Invalid status"
+                        )
+                        continue
+                current[op.id].update(values)
+                updated_ids[op.id] = None
+                if any(name in values for name in SEARCH_COLUMNS):
+                    reindex_ids.add(op.id)
+                update_indexes.append(index)
+            else:
+                live_ids.discard(op.id)
+                delete_ids.append(op.id)
+                results[index] = TaskBulkResultSchema(
+                    index=index, op=op.op, status=HTTPStatus.OK, id=op.id
+                )
+        
+        indexed: List[Task] = []
+        try:
+            if create_rows:
+                # One multi-row INSERT (render_nulls keeps every row on the same
+                # column set). RETURNING order is not guaranteed, but ids are
+                # assigned in VALUES order, so sorting by id lines the rows up
+                # with create_rows; asking SQLAlchemy to sort by parameter order
+                # degrades to row-by-row inserts on SQLite
+                created = sorted(
+                    db.session.scalars(
+                        insert(Task).returning(Task).options(undefer_group("text"))
+                        .execution_options(render_nulls=True),
+                        create_rows
+                    ).all(),
+                    key=lambda task: task.id
+                )
+                indexed.extend(created)
+                for index, task in zip(create_indexes, created):
+                    results[index] = TaskBulkResultSchema(
+                        index=index, op="create", status=HTTPStatus.CREATED, 
+                        id=task.id, task=TaskOutSchema.model_validate(task)
+                    )
+            
+            if updated_ids:
+                update_rows = [
+                    {
+                        "id": task_id, "updated_at": now, "change_seq": change_seq, 
+                        **{f: current[task_id][f] for f in update_fields}
+                    }
+                    for task_id in updated_ids
+                ]
+                db.session.execute(update(Task), update_rows)
+                updated = Task.query.options(undefer_group("text")).filter(
+                    Task.id.in_(updated_ids)
+                ).execution_options(populate_existing=True).all()
+                indexed.extend(task for task in updated if task.id in reindex_ids)
+                updated_out = {task.id: TaskOutSchema.model_validate(task) for task in updated}
+                for index in update_indexes:
+                    task_id = operations[index].id
+                    results[index] = TaskBulkResultSchema(
+                        index=index, op="update", status=HTTPStatus.OK, 
+                        id=task_id, task=updated_out[task_id]
+                    )
+            
+            if delete_ids:
+                db.session.execute(
+                    update(Task)
+                    .where(Task.id.in_(delete_ids))
+                    .values(is_deleted=True, updated_at=now, change_seq=change_seq)
+                    .execution_options(synchronize_session=False)
+                )
+            
+            SearchIndexService.record(indexed)
+            TaskCounterService.record(user_id, [
+                *((None, counter_state(row["status"], row["due_date"])) for row in create_rows),
+                *(
+                    (
+                        before, 
+                        counter_state(current[task_id]["status"], current[task_id]["due_date"]) 
+                        if task_id in live_ids else None
+                    )
+                    for task_id, before in start_states.items()
+                ),
+            ])
+            db.session.commit()
+            task_cache.invalidate(user_id)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise APIError(
+                "Database error during bulk operation",
+                status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                original=e
+            )
+        
+        return results
+
+    @staticmethod
+    def _sort_order_for_position(
+        user_id: int, 
+        status: TaskStatus, 
+        position: int, 
+        exclude_task_id: int, 
+        after_task_id: Optional[int] = None
+    ) -> float:
+        """
+        Compute the sort_order for a task dropped at `position` in a status
+        column, or directly below task `after_task_id` when one is given.
+        
+        Only the sort_order values of the one or two neighbouring rows are read
+        from the board index. With `after_task_id` that is a keyset seek on
+        (sort_order, id) from the named task, so the cost does not grow with
+        column size or drop depth. A bare `position` skips that many index
+        entries with OFFSET, so it costs O(position); dropping at the top or
+        past the end reads a single entry either way.
+        
+        Args:
+            user_id: ID of the user owning the column
+            status: Status column the task is dropped into
+            position: 0-based index position in the column (excluding the task)
+            exclude_task_id: ID of the task being moved
+            after_task_id: Task in the column to drop directly below (overrides position)
+            
+        Returns:
+            New sort_order value
+            
+        Raises:
+            APIError: If after_task_id is not another live task in the column
+        """
+        column = Task.query.with_entities(Task.sort_order).filter_by(
+            user_id=user_id,
+            status=status,
+            is_deleted=False
+        ).filter(Task.id != exclude_task_id)
+        
+        if after_task_id is not None:
+            # The named task and the next one, in one seek; the named task
+            # must come back first or it is not in this column
+            anchor_order = select(Task.sort_order).where(Task.id == after_task_id).scalar_subquery()
+            seek = column.with_entities(Task.id, Task.sort_order).filter(
+                tuple_(Task.sort_order, Task.id) >= tuple_(anchor_order, after_task_id)
+            ).order_by(Task.sort_order, Task.id).limit(2)
+            
+            def read_neighbours():
+                rows = seek.all()
+                if not rows or rows[0].id != after_task_id:
+                    raise APIError(
+                        "Task to drop after is not in the target column", status=HTTPStatus.CONFLICT
+                    )
+                return [row.sort_order for row in rows]
+        else:
+            if position <= 0:
+                # Moving to beginning
+                first = column.order_by(Task.sort_order).limit(1).scalar()
+                return first - SORT_ORDER_GAP if first is not None else SORT_ORDER_GAP
+            
+            def read_neighbours():
+                # Neighbours on either side of the drop position
+                return [
+                    row.sort_order
+                    for row in column.order_by(Task.sort_order, Task.id).offset(position - 1).limit(2)
+                ]
+        
+        neighbours = read_neighbours()
+        
+        if len(neighbours) == 2:
+            # Moving to middle - find fractional position
+            before_order, after_order = neighbours
+            new_sort_order = (before_order + after_order) / 2.0
+            if before_order < new_sort_order < after_order:
+                return new_sort_order
+            
+            # No representable value left between the neighbours (or they tie):
+            # respace the column and retry against the fresh gaps
+            TaskService.rebalance_sort_order(user_id, status, exclude_task_id)
+            before_order, after_order = read_neighbours()
+            return (before_order + after_order) / 2.0
+        
+        if len(neighbours) == 1:
+            # Dropped right after the last task
+            return neighbours[0] + SORT_ORDER_GAP
+        
+        # Position is past the end of the column - append after the last task
+        last = column.order_by(Task.sort_order.desc()).limit(1).scalar()
+        return last + SORT_ORDER_GAP if last is not None else SORT_ORDER_GAP
 
     @staticmethod
-    def reorder_task(task_id: int, target_status: str, target_position: int, user_id: int) -> TaskOutSchema:
+    def reorder_tasks_batch(data: TaskBatchReorderSchema, user_id: int) -> List[TaskTableSchema]:
+        """
+        Apply several reorder moves in one transaction.
+        
+        The (id, status, sort_order) of every task in the affected columns is
+        read once; moves are replayed in order on that in-memory snapshot with
+        the same position and after_task_id semantics as reorder_task, new sort_order values are
+        computed per column, and only the rows that changed are written with a
+        single executemany UPDATE.
+        
+        Args:
+            data: Validated list of moves
+            user_id: ID of the user (for authorization)
+            
+        Returns:
+            The final board in table view
+            
+        Raises:
+            APIError: If a task is not found, a status is invalid, an
+                after_task_id is not in its target column or the write fails
+        """
+        moves = data.moves
+        try:
+            targets = [TaskStatus(move.target_status) for move in moves]
+        except ValueError:
+            raise APIError("Invalid status", status=HTTPStatus.BAD_REQUEST)
+        
+        moved_ids = {move.task_id for move in moves}
+        change_seq = TaskService.advance_change_seq(user_id)
+        moved_rows = db.session.execute(TaskService._for_update(
+            select(Task.id, Task.status, Task.due_date).where(
+                Task.id.in_(moved_ids),
+                Task.user_id == user_id,
+                Task.is_deleted == False
+            )
+        )).all()
+        if len(moved_rows) != len(moved_ids):
+            db.session.rollback()
+            raise APIError("Task not found", status=HTTPStatus.NOT_FOUND)
+        location = {row.id: row.status for row in moved_rows}
+        due_dates = {row.id: row.due_date for row in moved_rows}
+        start_location = dict(location)
+        
+        # Snapshot of the affected columns, in board order
+        statuses = set(location.values()) | set(targets)
+        columns = {status: [] for status in statuses}
+        current_orders = {}
+        rows = db.session.execute(
+            select(Task.id, Task.status, Task.sort_order).filter_by(
+                user_id=user_id, 
+                is_deleted=False
+            ).where(Task.status.in_(statuses)).order_by(Task.status, Task.sort_order, Task.id)
+        )
+        for row in rows:
+            columns[row.status].append(row.id)
+            current_orders[row.id] = row.sort_order
+        
+        for move, target_status in zip(moves, targets):
+            columns[location[move.task_id]].remove(move.task_id)
+            target_column = columns[target_status]
+            position = move.target_position
+            if move.after_task_id is not None:
+                try:
+                    position = target_column.index(move.after_task_id) + 1
+                except ValueError:
+                    db.session.rollback()
+                    raise APIError(
+                        "Task to drop after is not in the target column", status=HTTPStatus.CONFLICT
+                    )
+            target_column.insert(min(position, len(target_column)), move.task_id)
+            location[move.task_id] = target_status
+        
+        # Every row carries the same keys so the ORM sends one executemany
+        # rather than one UPDATE per run of rows with matching key sets
+        now = datetime.now(timezone.utc)
+        update_rows = []
+        for status, column in columns.items():
+            new_orders = TaskService._column_sort_orders(column, current_orders, moved_ids)
+            for task_id, sort_order in new_orders.items():
+                if task_id in moved_ids or sort_order != current_orders[task_id]:
+                    update_rows.append({
+                        "id": task_id, "status": status, "sort_order": sort_order, 
+                        "updated_at": now, "change_seq": change_seq
+                    })
+        
+        try:
+            if update_rows:
+                db.session.execute(update(Task), update_rows)
+            TaskCounterService.record(user_id, [
+                (
+                    counter_state(start_location[task_id], due_dates[task_id]),
+                    counter_state(location[task_id], due_dates[task_id])
+                )
+                for task_id in moved_ids
+            ])
+            db.session.commit()
+            task_cache.invalidate(user_id)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise APIError(
+                "Database error during reorder",
+                status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                original=e
+            )
+        
+        return TaskService.get_user_tasks(user_id)
+
+    @staticmethod
+    def _column_sort_orders(column: List[int], current_orders: dict[int, float], moved_ids: set[int]) -> dict[int, float]:
+        """
+        Compute sort_order values for a column in its final order.
+        
+        Tasks that were not moved keep their value and act as anchors; each run
+        of moved tasks is spread evenly across the gap between its anchors. If
+        the result is not strictly increasing (tied anchors or an exhausted
+        gap) the whole column is respaced to multiples of SORT_ORDER_GAP.
+        
+        Args:
+            column: Task IDs in final board order
+            current_orders: Current sort_order of every task in the snapshot
+            moved_ids: IDs of the tasks that were moved
+            
+        Returns:
+            Mapping of task ID to its new sort_order for every task in the column
+        """
+        orders = {}
+        run = []
+        lower = None
+        for task_id in column + [None]:
+            if task_id is not None and task_id in moved_ids:
+                run.append(task_id)
+                continue
+            
+            upper = current_orders[task_id] if task_id is not None else None
+            for k, run_id in enumerate(run):
+                if lower is None and upper is None:
+                    orders[run_id] = (k + 1) * SORT_ORDER_GAP
+                elif lower is None:
+                    orders[run_id] = upper - (len(run) - k) * SORT_ORDER_GAP
+                elif upper is None:
+                    orders[run_id] = lower + (k + 1) * SORT_ORDER_GAP
+                else:
+                    orders[run_id] = lower + (upper - lower) * (k + 1) / (len(run) + 1)
+            run = []
+            
+            if task_id is not None:
+                orders[task_id] = upper
+                lower = upper
+        
+        values = [orders[task_id] for task_id in column]
+        if any(a >= b for a, b in zip(values, values[1:])):
+            return {task_id: (i + 1) * SORT_ORDER_GAP for i, task_id in enumerate(column)}
+        return orders
+
+    @staticmethod
+    def rebalance_sort_order(
+        user_id: Optional[int] = None, 
+        status: Optional[TaskStatus] = None, 
+        exclude_task_id: Optional[int] = None
+    ) -> int:
+        """
+        Renumber sort_order to evenly spaced values with a single UPDATE.
+        
+        Each (user_id, status) column keeps its current order (ties broken by id)
+        and is respaced to SORT_ORDER_GAP, 2 * SORT_ORDER_GAP, ... and gets a
+        fresh updated_at and its user's current change sequence number. The
+        statement runs in the current session transaction; the caller first
+        advances the affected users' sequences (advance_change_seq) and
+        commits afterwards.
+        
+        Args:
+            user_id: Restrict to one user's board (None for every user)
+            status: Restrict to one status column (None for every column)
+            exclude_task_id: Task to leave untouched, e.g. the one being moved
+            
+        Returns:
+            Number of rows renumbered
+        """
+        conditions = [Task.is_deleted == False]
+        if user_id is not None:
+            conditions.append(Task.user_id == user_id)
+        if status is not None:
+            conditions.append(Task.status == status)
+        if exclude_task_id is not None:
+            conditions.append(Task.id != exclude_task_id)
+        
+        ranked = select(
+            Task.id.label("id"),
+            func.row_number().over(
+                partition_by=(Task.user_id, Task.status),
+                order_by=(Task.sort_order, Task.id)
+            ).label("position")
+        ).where(*conditions).subquery()
+        
+        # updated_at and change_seq move too, so ETags and delta sync pick up
+        # the new values
+        result = db.session.execute(
+            update(Task)
+            .where(Task.id == ranked.c.id)
+            .values(
+                sort_order=ranked.c.position * SORT_ORDER_GAP,
+                updated_at=datetime.now(timezone.utc),
+                change_seq=select(User.task_change_seq).where(User.id == Task.user_id).scalar_subquery()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        task_cache.invalidate(user_id)
+        return result.rowcount
+
+    @staticmethod
+    def reorder_task(
+        task_id: int, 
+        target_status: str, 
+        target_position: int, 
+        user_id: int, 
+        after_task_id: Optional[int] = None
+    ) -> TaskOutSchema:
         """
         Reorder a task to a new position within its status column.
         
@@ -170,68 +1251,56 @@ class TaskService:
             target_status: Status column to move to (can be same as current)
             target_position: 0-based index position in the target column
             user_id: ID of the user (for authorization)
+            after_task_id: Task in the target column to drop directly below;
+                overrides target_position and costs the same at any depth
             
         Returns:
             Updated task data
             
         Raises:
-            APIError: If task not found or database error
+            APIError: If task not found, after_task_id is not in the target
+                column, or database error
         """
-        from app.extensions import db
-        
         try:
+            # Validate target status
+            try:
+                target_status_enum = TaskStatus(target_status)
+            except ValueError:
+                raise APIError("Invalid status", status=HTTPStatus.BAD_REQUEST)
+            
             # Get the task to reorder
-            task = Task.query.filter_by(
+            change_seq = TaskService.advance_change_seq(user_id)
+            task = TaskService._for_update(Task.query.filter_by(
                 id=task_id, 
                 user_id=user_id, 
                 is_deleted=False
-            ).first()
+            )).first()
             
             if not task:
+                db.session.rollback()
                 raise APIError("Task not found", status=HTTPStatus.NOT_FOUND)
             
-            # Validate target status
-            try:
-                target_status_enum = TaskStatus(target_status)
-            except ValueError:
-                raise APIError("Invalid status", status=HTTPStatus.BAD_REQUEST)
-            
-            # Get all tasks in target status column ordered by sort_order
-            target_tasks = Task.query.filter_by(
-                user_id=user_id,
-                status=target_status_enum,
-                is_deleted=False
-            ).filter(Task.id != task_id).order_by(Task.sort_order).all()
+            new_sort_order = TaskService._sort_order_for_position(
+                user_id, target_status_enum, target_position, task_id, after_task_id
+            )
             
-            # Calculate new sort_order based on target position
-            if target_position <= 0:
-                # Moving to beginning
-                if target_tasks:
-                    new_sort_order = target_tasks[0].sort_order - 1000.0
-                else:
-                    new_sort_order = 1000.0
-                    
-            elif target_position >= len(target_tasks):
-                # Moving to end
-                if target_tasks:
-                    new_sort_order = target_tasks[-1].sort_order + 1000.0
-                else:
-                    new_sort_order = 1000.0
-                    
-            else:
-                # Moving to middle - find fractional position
-                before_task = target_tasks[target_position - 1]
-                after_task = target_tasks[target_position]
-                new_sort_order = (before_task.sort_order + after_task.sort_order) / 2.0
+            if target_status_enum != task.status:
+                TaskCounterService.record(user_id, [(
+                    counter_state(task.status, task.due_date),
+                    counter_state(target_status_enum, task.due_date)
+                )])
             
             # Update task
             task.status = target_status_enum
             task.sort_order = new_sort_order
+            task.change_seq = change_seq
             task.save()
+            task_cache.invalidate(user_id)
             
-            return TaskOutSchema.model_validate(task)
+            return TaskService._task_out(task)
             
         except APIError:
+            db.session.rollback()
             raise
         except Exception as e:
             raise APIError(
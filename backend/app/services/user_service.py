@@ -1,19 +1,24 @@
 # backend/app/services/user_service.py
 from http import HTTPStatus
-from flask_jwt_extended import create_access_token
+from typing import Any, Optional
+from app.extensions import token_version_cache
 from app.models import User
 from app.errors import APIError
+from app.services.auth_service import AuthService
 from app.schemas import UserOutSchema, UserProfileUpdateSchema, UserPasswordChangeSchema
 
 
 class UserService:
     @staticmethod
-    def get_user_profile(user_id: int) -> UserOutSchema:
+    def get_user_profile(user_id: int, claims: Optional[dict[str, Any]] = None) -> UserOutSchema:
         """
         Get user profile information.
         
+        Served from the access token's claims when they are up to date.
+        
         Args:
             user_id: ID of the authenticated user
+            claims: Claims of the verified access token
             
         Returns:
             UserOutSchema: User profile data
@@ -21,6 +26,11 @@ class UserService:
         Raises:
             APIError: If user not found
         """
+        if claims is not None:
+            user_out = AuthService.user_from_claims(user_id, claims)
+            if user_out is not None:
+                return user_out
+        
         user = User.query.get(user_id)
         if not user:
             raise APIError("User not found", status=HTTPStatus.NOT_FOUND)
@@ -57,7 +67,10 @@ class UserService:
         if data.username:
             user.username = data.username
         
+        # Tokens carrying the old profile must no longer be trusted
+        user.token_version = (user.token_version or 0) + 1
         user.save()
+        token_version_cache.invalidate(user_id)
         return UserOutSchema.model_validate(user)
 
     @staticmethod
@@ -91,6 +104,8 @@ class UserService:
         
         # Set new password
         user.set_password(data.new_password)
+        user.token_version = (user.token_version or 0) + 1
         user.save()
+        token_version_cache.invalidate(user_id)
         
         return UserOutSchema.model_validate(user)
\ No newline at end of file
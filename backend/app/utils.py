@@ -1,85 +1,237 @@
 # backend/app/utils.py
 from datetime import datetime, date
+import base64
+import binascii
+import hashlib
 import json
 import logging
-from functools import wraps
-from typing import Any, Dict, Optional, Union, Type
-from flask import request, Response
+from functools import lru_cache, wraps
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, Type
+from flask import current_app, g, request, Response, stream_with_context
 from flask_jwt_extended import get_jwt_identity
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from werkzeug.exceptions import RequestEntityTooLarge
 from http import HTTPStatus
 from app.errors import APIError
+from app.metrics import record_timing
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _to_plain(obj):
+    """
+    Recursively convert Pydantic models, dicts, lists, and datetimes into
+    plain JSON-compatible Python values.
+    """
+    if isinstance(obj, BaseModel):
+        return _to_plain(obj.model_dump())
+    if isinstance(obj, dict):
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_to_plain(v) for v in obj]
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    # add more type checks here if needed
+    return obj
+
+@lru_cache(maxsize=None)
+def _json_adapter(tp) -> TypeAdapter:
+    """
+    Cached TypeAdapter for a model type (or list of it), used to encode
+    responses and to validate request bodies natively.
+    """
+    return TypeAdapter(tp)
+
+def encode_json(data) -> bytes:
+    """
+    Encode response data to JSON bytes.
+    
+    Pydantic models and homogeneous lists of models are encoded in a single
+    pass by pydantic-core through cached per-schema adapters; dicts are
+    stitched together around them. Anything else goes through json.dumps.
+    The decoded document is identical to the one the plain path produces.
+    """
+    if isinstance(data, BaseModel):
+        return _json_adapter(type(data)).dump_json(data)
+    if isinstance(data, dict) and all(isinstance(k, str) for k in data):
+        return b"{" + b",".join(
+            json.dumps(k).encode() + b":" + encode_json(v) for k, v in data.items()
+        ) + b"}"
+    if isinstance(data, list) and data and isinstance(data[0], BaseModel):
+        model_type = type(data[0])
+        if all(type(item) is model_type for item in data):
+            return _json_adapter(List[model_type]).dump_json(data)
+    return json.dumps(_to_plain(data)).encode()
+
 def to_json(data, status=HTTPStatus.OK):
     """
-    Recursively serialize Pydantic models, dicts, lists, and datetimes into JSON.
-    """
-    def serialize(obj):
-        if isinstance(obj, BaseModel):
-            return serialize(obj.model_dump())
-        if isinstance(obj, dict):
-            return {k: serialize(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [serialize(v) for v in obj]
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        # add more type checks here if needed
-        return obj
-
-    plain = serialize(data)
-    body = json.dumps(plain)
+    Serialize Pydantic models, dicts, lists, and datetimes into a JSON response.
+    """
+    with record_timing("serialize"):
+        body = encode_json(data)
     return Response(body, status=status, mimetype="application/json")
 
+def stream_json(key: str, chunks: Iterable[list], status=HTTPStatus.OK):
+    """
+    Stream {"<key>": [...]} as a JSON response, encoding one chunk at a time.
+    
+    Args:
+        key: Name of the array field in the response object
+        chunks: Iterable of lists of items (e.g. Pydantic models) to emit in order
+        status: HTTP status code
+        
+    Returns:
+        Streaming JSON response
+    """
+    def generate() -> Iterator[bytes]:
+        yield b"{" + json.dumps(key).encode() + b":["
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            # Drop the surrounding brackets of each encoded chunk
+            body = encode_json(chunk)[1:-1]
+            yield body if first else b"," + body
+            first = False
+        yield b"]}"
+
+    return Response(stream_with_context(generate()), status=status, mimetype="application/json")
+
+def conditional_get(marker_fn):
+    """
+    Decorator adding strong ETag validation to a GET view.
+    
+    `marker_fn` receives the view's URL kwargs and returns a cheap string that
+    changes whenever the response would (or None to skip validation). The
+    ETag is derived from it and the request path/query, and is computed before
+    the view runs, so a matching If-None-Match is answered with 304 without
+    loading or serialising anything. The marker is left in `g.etag_marker`
+    for the view, e.g. to check a cached copy against it without another
+    query.
+    
+    Args:
+        marker_fn: Callable returning the change marker for the current user
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            marker = marker_fn(**kwargs)
+            g.etag_marker = marker
+            if marker is None:
+                return fn(*args, **kwargs)
+            
+            etag = hashlib.sha1(f"{marker}|{request.full_path}".encode()).hexdigest()
+            if request.if_none_match.contains(etag):
+                response = Response(status=HTTPStatus.NOT_MODIFIED)
+            else:
+                response = fn(*args, **kwargs)
+            
+            response.set_etag(etag)
+            # Responses are per user; make clients revalidate on every use
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+    return decorator
+
+def _call_with_validated(fn, validated: BaseModel, args, kwargs):
+    """
+    Call a view with the validated model injected as the first argument after
+    `self` for MethodView methods, or as the first argument otherwise.
+    """
+    # Detect MethodView: args[0] is `self`
+    if args and hasattr(args[0], fn.__name__):
+        self_obj, *rest = args
+        return fn(self_obj, validated, *rest, **kwargs)
+
+    # Else, function-based view: pass validated first
+    return fn(validated, *args, **kwargs)
+
 def validate_input(schema: Type[BaseModel]):
     """
-    Decorator to validate request.json against a Pydantic schema.
+    Decorator to validate the JSON request body against a Pydantic schema.
     Works on both function-based and MethodView methods.
     Injects the validated model instance as the first argument after `self` (if present).
     
+    The raw body bytes go straight to pydantic-core (JSON parsing and
+    validation in one pass, through a cached per-schema validator), after
+    the body size is checked against MAX_REQUEST_BODY_BYTES.
+    
     Args:
         schema: Pydantic model class for validation
         
     Raises:
-        APIError: If validation fails or request format is invalid
+        APIError: If the body is too large, not JSON, or fails validation
     """
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
+            if not request.is_json:
+                raise APIError(
+                    "Content-Type must be application/json", 
+                    status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+                )
+            
+            # Checked against Content-Length before anything is read, and
+            # while reading for chunked bodies
+            limit = current_app.config["MAX_REQUEST_BODY_BYTES"]
+            request.max_content_length = limit
             try:
-                # Extract JSON payload
-                payload = request.get_json()
-                if payload is None:
-                    raise APIError(
-                        "Request must contain valid JSON", 
-                        status=HTTPStatus.BAD_REQUEST
-                    )
-                
-                # Validate/parse into Pydantic model
-                validated = schema.model_validate(payload)
-
-                # Detect MethodView: args[0] is `self`
-                if args and hasattr(args[0], fn.__name__):
-                    self_obj, *rest = args
-                    return fn(self_obj, validated, *rest, **kwargs)
-
-                # Else, function-based view: pass validated first
-                return fn(validated, *args, **kwargs)
-                
+                body = request.get_data()
+            except RequestEntityTooLarge:
+                raise APIError(
+                    f"Request body exceeds {limit} bytes", 
+                    status=HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+                )
+            
+            try:
+                with record_timing("validate"):
+                    validated = _json_adapter(schema).validate_json(body)
             except ValidationError as e:
+                errors = e.errors()
+                if len(errors) == 1 and not errors[0]["loc"]:
+                    # The document itself is unusable rather than a field
+                    if errors[0]["type"] == "json_invalid":
+                        raise APIError("Invalid JSON format", status=HTTPStatus.BAD_REQUEST)
+                    if errors[0]["input"] is None:
+                        raise APIError("Request must contain valid JSON", status=HTTPStatus.BAD_REQUEST)
                 logger.warning(f"Validation error in {fn.__name__}: {e}")
                 raise APIError(
                     f"Validation error: {format_validation_error(e)}", 
                     status=HTTPStatus.BAD_REQUEST
                 )
-            except json.JSONDecodeError:
+
+            return _call_with_validated(fn, validated, args, kwargs)
+
+        return wrapper
+    return decorator
+
+def validate_query(schema: Type[BaseModel]):
+    """
+    Decorator to validate request.args (query string) against a Pydantic schema.
+    Injects the validated model the same way as validate_input.
+    
+    Args:
+        schema: Pydantic model class for validation
+        
+    Raises:
+        APIError: If validation fails
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                with record_timing("validate"):
+                    validated = schema.model_validate(request.args.to_dict())
+            except ValidationError as e:
+                logger.warning(f"Query validation error in {fn.__name__}: {e}")
                 raise APIError(
-                    "Invalid JSON format", 
+                    f"Validation error: {format_validation_error(e)}", 
                     status=HTTPStatus.BAD_REQUEST
                 )
 
+            return _call_with_validated(fn, validated, args, kwargs)
+
         return wrapper
     return decorator
 
@@ -166,9 +318,46 @@ def success_response(
     
     return to_json(response_data, status=status)
 
+def encode_cursor(values: list) -> str:
+    """
+    Encode keyset pagination values into an opaque URL-safe cursor.
+    
+    Args:
+        values: JSON-serializable sort key of the last row on the page
+        
+    Returns:
+        Opaque cursor string
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Opaque cursor string from a previous page
+        
+    Returns:
+        The list of sort key values
+        
+    Raises:
+        APIError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+    if not isinstance(values, list):
+        raise APIError("Invalid cursor", status=HTTPStatus.BAD_REQUEST)
+    return values
+
 def paginate_query(query, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
     """
     Helper function to paginate SQLAlchemy queries.
+    Uses OFFSET and a COUNT per page; prefer keyset cursors (encode_cursor /
+    decode_cursor) for large or frequently paged collections.
     
     Args:
         query: SQLAlchemy query object
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Latency and allocation benchmark for every auth and task endpoint.
+Run this script from the backend directory:
+
+    python benchmarks/bench_endpoints.py run [--users N] [--tasks-per-user N] [--output results.json]
+    python benchmarks/bench_endpoints.py compare baseline.json results.json [--threshold 0.15]
+
+`run` builds the app with create_app() against a temporary SQLite database,
+seeds the requested dataset with seed_test_tasks.seed_dataset(), then drives
+each route through the Flask test client. It reports p50/p95/p99 latency per scenario plus the peak memory
+allocated while handling one request (tracemalloc, measured in a separate
+pass so tracing does not skew the timings), and saves everything as JSON.
+
+`compare` checks a results file against a stored baseline and exits
+non-zero when a metric regressed by more than the threshold.
+"""
+
+import sys
+import os
+import argparse
+import json
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import Task, User, TaskStatus
+from app.services.auth_service import AuthService
+from seed_test_tasks import seed_dataset
+
+PASSWORD = "bench-password"
+# Users whose tokens are issued and who are picked for requests
+MAX_ACTIVE_USERS = 100
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "peak_alloc_kb")
+
+
+def bounded_int(low: int, high: int):
+    """argparse type accepting integers in [low, high]."""
+    def parse(value: str) -> int:
+        number = int(value)
+        if not low <= number <= high:
+            raise argparse.ArgumentTypeError(f"must be between {low} and {high}")
+        return number
+    return parse
+
+
+def make_config(database_uri: str, task_cache: bool):
+    """Config subclass pinned to the benchmark database."""
+    return type("BenchConfig", (Config,), {
+        "SQLALCHEMY_DATABASE_URI": database_uri,
+        "TASK_CACHE_BACKEND": "memory" if task_cache else "none",
+    })
+
+
+class BenchContext:
+    """Tokens, passwords and live task IDs of the active users."""
+    def __init__(self, client, user_ids: list[int], rng: random.Random):
+        self.client = client
+        self.rng = rng
+        self.user_ids = user_ids[:MAX_ACTIVE_USERS]
+        self.passwords = {u: PASSWORD for u in self.user_ids}
+        self.emails = {}
+        self.tokens = {}
+        for user in User.query.filter(User.id.in_(self.user_ids)):
+            self.emails[user.id] = user.email
+            self.tokens[user.id] = AuthService.issue_token(user)
+        self.task_ids = {u: [] for u in self.user_ids}
+        rows = db.session.execute(
+            select(Task.user_id, Task.id).where(Task.user_id.in_(self.user_ids), Task.is_deleted == False)
+        )
+        for user_id, task_id in rows:
+            self.task_ids[user_id].append(task_id)
+        self.counter = 0
+
+    def user(self) -> int:
+        return self.rng.choice(self.user_ids)
+
+    def headers(self, user_id: int) -> dict:
+        return {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    def task(self, user_id: int) -> int:
+        """A live task of the user, creating one if the user has none left."""
+        if not self.task_ids[user_id]:
+            response = self.client.post("/tasks", json={"title": "Refill"}, headers=self.headers(user_id))
+            self.task_ids[user_id].append(response.get_json()["task"]["id"])
+        return self.rng.choice(self.task_ids[user_id])
+
+    def unique(self) -> int:
+        self.counter += 1
+        return self.counter
+
+
+# Scenarios: each builds one request (untimed) and returns
+# (method, path, request kwargs, expected status)
+
+def register(ctx):
+    n = ctx.unique()
+    body = {"username": f"bench{n}", "email": f"bench{n}@example.com", "password": PASSWORD}
+    return "POST", "/auth/register", {"json": body}, 201
+
+
+def login(ctx):
+    u = ctx.user()
+    return "POST", "/auth/login", {"json": {"email": ctx.emails[u], "password": ctx.passwords[u]}}, 200
+
+
+def refresh(ctx):
+    return "POST", "/auth/refresh", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def get_profile(ctx):
+    return "GET", "/auth/me", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def update_profile(ctx):
+    u = ctx.user()
+    body = {"username": f"user{u}-{ctx.unique()}"}
+    return "PUT", "/auth/me", {"json": body, "headers": ctx.headers(u)}, 200
+
+
+def change_password(ctx):
+    u = ctx.user()
+    new_password = f"{PASSWORD}-{ctx.unique()}"
+    body = {"current_password": ctx.passwords[u], "new_password": new_password, "confirm_password": new_password}
+    ctx.passwords[u] = new_password
+    return "PUT", "/auth/me/password", {"json": body, "headers": ctx.headers(u)}, 200
+
+
+def list_tasks(ctx):
+    return "GET", "/tasks", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def list_tasks_not_modified(ctx):
+    u = ctx.user()
+    etag = ctx.client.get("/tasks", headers=ctx.headers(u)).headers["ETag"]
+    return "GET", "/tasks", {"headers": {**ctx.headers(u), "If-None-Match": etag}}, 304
+
+
+def list_tasks_page(ctx):
+    return "GET", "/tasks?limit=50", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def list_tasks_filtered(ctx):
+    query = {"status": "backlog,in_progress", "overdue": "true", "order_by": "due_date"}
+    return "GET", "/tasks", {"query_string": query, "headers": ctx.headers(ctx.user())}, 200
+
+
+def list_tasks_stream(ctx):
+    return "GET", "/tasks?stream=true", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def task_changes(ctx):
+    u = ctx.user()
+    # Roughly the last 50 writes of the user
+    with ctx.client.application.app_context():
+        latest = db.session.scalar(select(User.task_change_seq).where(User.id == u))
+    since = max(latest - 50, 0)
+    return "GET", "/tasks/changes", {"query_string": {"since": since}, "headers": ctx.headers(u)}, 200
+
+
+def search_tasks(ctx):
+    q = ctx.rng.choice(["dolor", "ullamco lab", "task 12", "consequat"])
+    return "GET", "/tasks/search", {"query_string": {"q": q}, "headers": ctx.headers(ctx.user())}, 200
+
+
+def task_summary(ctx):
+    return "GET", "/tasks/summary", {"headers": ctx.headers(ctx.user())}, 200
+
+
+def create_task(ctx):
+    body = {"title": f"Bench task {ctx.unique()}", "what": "What " * 40}
+    return "POST", "/tasks", {"json": body, "headers": ctx.headers(ctx.user())}, 201
+
+
+def bulk_tasks(ctx):
+    u = ctx.user()
+    operations = [{"op": "create", "data": {"title": f"Bulk task {ctx.unique()}"}} for _ in range(40)]
+    operations += [{"op": "update", "id": ctx.task(u), "data": {"status": "in_review"}} for _ in range(10)]
+    return "POST", "/tasks/bulk", {"json": {"operations": operations}, "headers": ctx.headers(u)}, 200
+
+
+def bulk_tasks_large(ctx):
+    u = ctx.user()
+    text = {"why": "Because " * 20, "what": "Something " * 60, "how": "Step by step\n" * 10}
+    operations = [{"op": "create", "data": {"title": f"Import {ctx.unique()}", **text}} for _ in range(900)]
+    operations += [{"op": "update", "id": ctx.task(u), "data": {"status": "in_review"}} for _ in range(100)]
+    return "POST", "/tasks/bulk", {"json": {"operations": operations}, "headers": ctx.headers(u)}, 200
+
+
+def get_task(ctx):
+    u = ctx.user()
+    return "GET", f"/tasks/{ctx.task(u)}", {"headers": ctx.headers(u)}, 200
+
+
+def update_task(ctx):
+    u = ctx.user()
+    body = {"title": f"Updated {ctx.unique()}", "status": ctx.rng.choice(list(TaskStatus)).value}
+    return "PUT", f"/tasks/{ctx.task(u)}", {"json": body, "headers": ctx.headers(u)}, 200
+
+
+def delete_task(ctx):
+    u = ctx.user()
+    task_id = ctx.task(u)
+    ctx.task_ids[u].remove(task_id)
+    return "DELETE", f"/tasks/{task_id}", {"headers": ctx.headers(u)}, 200
+
+
+def reorder_task(ctx):
+    u = ctx.user()
+    body = {"target_status": ctx.rng.choice(list(TaskStatus)).value, "target_position": ctx.rng.randint(0, 20)}
+    return "POST", f"/tasks/{ctx.task(u)}/reorder", {"json": body, "headers": ctx.headers(u)}, 200
+
+
+def batch_reorder(ctx):
+    u = ctx.user()
+    moves = [
+        {
+            "task_id": ctx.task(u),
+            "target_status": ctx.rng.choice(list(TaskStatus)).value,
+            "target_position": ctx.rng.randint(0, 20),
+        }
+        for _ in range(10)
+    ]
+    return "POST", "/tasks/reorder", {"json": {"moves": moves}, "headers": ctx.headers(u)}, 200
+
+
+# (name, builder, uses password hashing)
+SCENARIOS = [
+    ("POST /auth/register", register, True),
+    ("POST /auth/login", login, True),
+    ("POST /auth/refresh", refresh, False),
+    ("GET /auth/me", get_profile, False),
+    ("PUT /auth/me", update_profile, False),
+    ("PUT /auth/me/password", change_password, True),
+    ("GET /tasks", list_tasks, False),
+    ("GET /tasks (304)", list_tasks_not_modified, False),
+    ("GET /tasks?limit=50", list_tasks_page, False),
+    ("GET /tasks?stream=true", list_tasks_stream, False),
+    ("GET /tasks (filtered)", list_tasks_filtered, False),
+    ("GET /tasks/changes", task_changes, False),
+    ("GET /tasks/search", search_tasks, False),
+    ("GET /tasks/summary", task_summary, False),
+    ("POST /tasks", create_task, False),
+    ("POST /tasks/bulk", bulk_tasks, False),
+    ("POST /tasks/bulk (1000 ops)", bulk_tasks_large, False),
+    ("GET /tasks/<id>", get_task, False),
+    ("PUT /tasks/<id>", update_task, False),
+    ("POST /tasks/<id>/reorder", reorder_task, False),
+    ("POST /tasks/reorder", batch_reorder, False),
+    ("DELETE /tasks/<id>", delete_task, False),
+]
+
+
+def send(ctx, builder):
+    """Build and send one request; return (seconds, response)."""
+    method, path, kwargs, expected = builder(ctx)
+    start = time.perf_counter()
+    response = ctx.client.open(path, method=method, **kwargs)
+    response.get_data()  # drain streamed bodies inside the timing
+    elapsed = time.perf_counter() - start
+    if response.status_code != expected:
+        raise RuntimeError(f"{method} {path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return elapsed
+
+
+def measure_allocations(ctx, builder, requests: int) -> float:
+    """Median peak of traced allocations while handling one request, in KiB."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(requests):
+            method, path, kwargs, expected = builder(ctx)
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            ctx.client.open(path, method=method, **kwargs).get_data()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(peaks) / 1024
+
+
+def summarize(samples: list[float]) -> dict:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "requests": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+    }
+
+
+def run(args) -> int:
+    rng = random.Random(args.seed)
+    tmp_dir = tempfile.mkdtemp(prefix="trackly-bench-")
+    try:
+        app = create_app(make_config(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}", args.task_cache))
+        with app.app_context():
+            db.create_all()
+            start = time.perf_counter()
+            user_ids, _ = seed_dataset(args.users, args.tasks_per_user, password=PASSWORD, rng=rng)
+            print(f"📊 Seeded {args.users} users x {args.tasks_per_user} tasks in {time.perf_counter() - start:.1f}s")
+            ctx = BenchContext(app.test_client(), user_ids, rng)
+
+        only = set(args.only or [])
+        results = {}
+        print(f"\n{'scenario':<26} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'alloc KiB':>10}")
+        for name, builder, hashing in SCENARIOS:
+            if only and name not in only:
+                continue
+            requests = args.hash_requests if hashing else args.requests
+            for _ in range(args.warmup):
+                send(ctx, builder)
+            samples = [send(ctx, builder) for _ in range(requests)]
+            stats = summarize(samples)
+            stats["peak_alloc_kb"] = round(measure_allocations(ctx, builder, args.alloc_requests), 1)
+            results[name] = stats
+            print(f"{name:<26} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+                  f"{stats['p99_ms']:>9.2f} {stats['peak_alloc_kb']:>10.1f}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "users": args.users,
+            "tasks_per_user": args.tasks_per_user,
+            "requests": args.requests,
+            "task_cache": args.task_cache,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    for key in ("users", "tasks_per_user", "task_cache"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"⚠️  Dataset differs: {key} {baseline['meta'].get(key)} -> {current['meta'].get(key)}")
+
+    regressions = 0
+    print(f"{'scenario':<26} {'metric':<14} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<26} (not in baseline)")
+            continue
+        for metric in METRICS:
+            if metric not in base or metric not in stats:
+                continue
+            before, after = base[metric], stats[metric]
+            change = (after - before) / before if before else 0.0
+            # Ignore sub-noise differences on very fast endpoints
+            min_delta = args.min_delta_kb if metric == "peak_alloc_kb" else args.min_delta_ms
+            regressed = change > args.threshold and after - before > min_delta
+            if regressed or args.verbose:
+                marker = "❌" if regressed else "  "
+                print(f"{name:<26} {metric:<14} {before:>10.2f} {after:>10.2f} {change:>+7.0%} {marker}")
+            regressions += regressed
+
+    if regressions:
+        print(f"\n❌ {regressions} regression(s) above {args.threshold:.0%}")
+        return 1
+    print(f"\n✅ No regressions above {args.threshold:.0%}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="seed a dataset and benchmark every endpoint")
+    run_parser.add_argument("--users", type=bounded_int(1, 10_000), default=10)
+    run_parser.add_argument("--tasks-per-user", type=bounded_int(10, 100_000), default=100)
+    run_parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    run_parser.add_argument("--hash-requests", type=int, default=20,
+                            help="timed requests for scenarios that hash passwords")
+    run_parser.add_argument("--alloc-requests", type=int, default=10, help="requests traced for allocations")
+    run_parser.add_argument("--warmup", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--no-task-cache", dest="task_cache", action="store_false",
+                            help="disable the task board cache")
+    run_parser.add_argument("--only", action="append", metavar="SCENARIO", help="run only this scenario (repeatable)")
+    run_parser.add_argument("--output", default="bench_endpoints.json")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15, help="relative slowdown that fails")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    compare_parser.add_argument("--min-delta-kb", type=float, default=16.0)
+    compare_parser.add_argument("--verbose", action="store_true", help="print every metric")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
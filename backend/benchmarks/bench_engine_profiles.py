@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Concurrent read/write throughput of the SQLite engine profiles.
+Run this script from the backend directory: python benchmarks/bench_engine_profiles.py [seconds]
+
+For each profile a fresh file database is seeded, then reader threads load
+task boards while writer threads update tasks and commit, all through the
+app's engine. Reports completed operations per second and lock errors.
+"""
+
+import sys
+import os
+import random
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import OperationalError
+from app import create_app
+from app.config import Config
+from app.db_profiles import engine_options
+from app.extensions import db
+from app.models import Task, User, TaskStatus
+
+PROFILES = ["sqlite-default", "sqlite-wal"]
+USERS = 50
+TASKS_PER_USER = 200
+READERS = 8
+WRITERS = 2
+
+
+def make_config(profile: str, database_uri: str):
+    """Config subclass pinned to one profile and database."""
+    return type(f"BenchConfig[{profile}]", (Config,), {
+        "SQLALCHEMY_DATABASE_URI": database_uri,
+        "DB_ENGINE_PROFILE": profile,
+        "SQLALCHEMY_ENGINE_OPTIONS": engine_options(profile),
+        "TASK_CACHE_BACKEND": "none",
+    })
+
+
+def seed():
+    statuses = list(TaskStatus)
+    db.session.execute(insert(User), [
+        {"id": u, "username": f"user{u}", "email": f"user{u}@example.com", "password_hash": "x"}
+        for u in range(1, USERS + 1)
+    ])
+    db.session.execute(insert(Task), [
+        {
+            "title": f"Task {u}-{i}",
+            "what": "Details " * 50,
+            "status": statuses[i % len(statuses)],
+            "sort_order": 1000.0 * (i + 1),
+            "user_id": u,
+        }
+        for u in range(1, USERS + 1)
+        for i in range(TASKS_PER_USER)
+    ])
+    db.session.commit()
+
+
+def run_profile(profile: str, seconds: float) -> dict:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    app = create_app(make_config(profile, f"sqlite:///{path}"))
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def reader():
+        rng = random.Random()
+        with app.app_context():
+            engine = db.engine
+            while time.perf_counter() < stop:
+                try:
+                    with engine.connect() as conn:
+                        conn.execute(
+                            select(Task.id, Task.title, Task.status, Task.created_at, Task.due_date)
+                            .filter_by(user_id=rng.randint(1, USERS), is_deleted=False)
+                            .order_by(Task.status, Task.sort_order)
+                        ).fetchall()
+                    key = "reads"
+                except OperationalError:
+                    key = "errors"
+                with lock:
+                    counts[key] += 1
+
+    def writer():
+        rng = random.Random()
+        with app.app_context():
+            engine = db.engine
+            while time.perf_counter() < stop:
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(
+                            update(Task)
+                            .where(Task.id == rng.randint(1, USERS * TASKS_PER_USER))
+                            .values(sort_order=rng.random() * 1e6)
+                        )
+                    key = "writes"
+                except OperationalError:
+                    key = "errors"
+                with lock:
+                    counts[key] += 1
+
+    with app.app_context():
+        db.create_all()
+        seed()
+
+    threads = [threading.Thread(target=reader) for _ in range(READERS)]
+    threads += [threading.Thread(target=writer) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with app.app_context():
+        db.engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+    return {key: value / seconds for key, value in counts.items()}
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    print(f"📊 {READERS} readers + {WRITERS} writers for {seconds:.0f}s per profile")
+    for profile in PROFILES:
+        result = run_profile(profile, seconds)
+        print(
+            f"   {profile:<15} reads/s {result['reads']:9.1f}   "
+            f"writes/s {result['writes']:8.1f}   errors/s {result['errors']:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
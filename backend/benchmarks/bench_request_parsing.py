@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for request body parsing: the previous path (json.loads into
+Python objects, then model_validate) against validate_input's single pass
+(raw bytes straight into pydantic-core via validate_json), on bulk payloads.
+Run this script from the backend directory: python benchmarks/bench_request_parsing.py [operation_count]
+"""
+
+import sys
+import os
+import json
+import timeit
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas import TaskBulkSchema
+from app.utils import _json_adapter
+
+
+def build_body(count: int) -> bytes:
+    """A /tasks/bulk body of `count` operations, mostly creates carrying task text."""
+    operations = []
+    for i in range(count):
+        if i % 10 == 9:
+            operations.append({"op": "delete", "id": i})
+        elif i % 10 == 8:
+            operations.append({"op": "update", "id": i, "data": {"status": "in_review", "due_date": "2026-11-01"}})
+        else:
+            operations.append({"op": "create", "data": {
+                "title": f"Imported task {i} – ünïcode",
+                "why": "Because " * 20,
+                "what": "Something " * 60,
+                "how": "Step by step\n" * 10,
+                "acceptance_criteria": "- works\n- is fast\n",
+                "status": "backlog",
+            }})
+    return json.dumps({"operations": operations}).encode()
+
+
+def two_pass(body: bytes):
+    """The previous validate_input body: request.get_json() then model_validate."""
+    return TaskBulkSchema.model_validate(json.loads(body))
+
+
+def single_pass(body: bytes):
+    """validate_input as it is now."""
+    return _json_adapter(TaskBulkSchema).validate_json(body)
+
+
+def peak_kb(parse, body: bytes) -> float:
+    tracemalloc.start()
+    parse(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    body = build_body(count)
+    print(f"📊 Parsing a bulk body of {count} operations ({len(body) / 1024:.0f} KiB)")
+
+    if two_pass(body) != single_pass(body):
+        print("❌ validate_json result differs from the two-pass path")
+        sys.exit(1)
+
+    runs = 20
+    for name, parse in (("two-pass", two_pass), ("single-pass", single_pass)):
+        seconds = min(timeit.repeat(lambda: parse(body), number=runs, repeat=3)) / runs
+        print(f"   {name:<11} {seconds * 1000:8.2f} ms   peak {peak_kb(parse, body):8.0f} KiB")
+
+    print("✅ Both paths produce the same model")
+
+
+if __name__ == "__main__":
+    main()
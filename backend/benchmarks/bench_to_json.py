@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for response serialization: the plain path (model_dump, walk,
+json.dumps) against encode_json (native pydantic-core encoding).
+Run this script from the backend directory: python benchmarks/bench_to_json.py [task_count]
+"""
+
+import sys
+import os
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas import TaskTableSchema, TaskOutSchema
+from app.utils import encode_json, _to_plain
+
+
+def build_payloads(count: int) -> dict:
+    """Build list-view and detail-view payloads shaped like the task endpoints."""
+    now = datetime.now(timezone.utc)
+    table = [
+        TaskTableSchema(
+            id=i,
+            title=f"Task number {i} – ünïcode",
+            status="in_progress",
+            created_at=now - timedelta(minutes=i),
+            due_date=now + timedelta(days=i % 30) if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+    full = [
+        TaskOutSchema(
+            id=i,
+            title=f"Task number {i}",
+            why="Because " * 20,
+            what="Something " * 40,
+            how=None,
+            acceptance_criteria="- works\n- is fast\n",
+            status="backlog",
+            user_id=1,
+            created_at=now,
+            updated_at=now if i % 2 else None,
+            due_date=None,
+        )
+        for i in range(count)
+    ]
+    return {"table view": {"tasks": table}, "full tasks": {"tasks": full}}
+
+
+def plain_json(data) -> bytes:
+    """The previous to_json body: three passes over the data."""
+    return json.dumps(_to_plain(data)).encode()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"📊 Serializing {count} tasks")
+
+    for name, payload in build_payloads(count).items():
+        if json.loads(plain_json(payload)) != json.loads(encode_json(payload)):
+            print(f"❌ {name}: encode_json output differs from the plain path")
+            sys.exit(1)
+
+        runs = 20
+        plain = min(timeit.repeat(lambda: plain_json(payload), number=runs, repeat=3)) / runs
+        fast = min(timeit.repeat(lambda: encode_json(payload), number=runs, repeat=3)) / runs
+        print(f"   {name:<11} plain {plain * 1000:8.2f} ms   native {fast * 1000:8.2f} ms   {plain / fast:5.1f}x")
+
+    print("✅ Outputs decode identically")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN-based check that every TaskService query on the task table is an index
+range scan (no full table scan, no temporary sort).
+Run this script from the backend directory: python benchmarks/explain_task_queries.py
+
+It builds the app against a throwaway SQLite database, seeds a few users with
+tasks, drives each TaskService method while recording the SQL it emits, then
+runs EXPLAIN QUERY PLAN on every recorded SELECT. Exits non-zero on failure.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_db_fd, DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_db_fd)
+os.environ["DATABASE_URI"] = f"sqlite:///{DB_PATH}"
+
+from sqlalchemy import event, insert
+from app import create_app
+from app.extensions import db
+from app.models import Task, User, TaskStatus
+from app.schemas import TaskCreateSchema, TaskUpdateSchema, TaskBatchReorderSchema, TaskListQuerySchema
+from app.services.task_service import TaskService
+from app.services.task_counter_service import TaskCounterService
+
+USERS = 20
+TASKS_PER_USER = 500
+
+
+def seed():
+    """Bulk-insert users and tasks so the planner sees a realistic table."""
+    statuses = list(TaskStatus)
+    now = datetime.now(timezone.utc)
+    db.session.execute(insert(User), [
+        {"id": u, "username": f"user{u}", "email": f"user{u}@example.com", "password_hash": "x"}
+        for u in range(1, USERS + 1)
+    ])
+    db.session.execute(insert(Task), [
+        {
+            "title": f"Task {u}-{i}",
+            "status": statuses[i % len(statuses)],
+            "sort_order": 1000.0 * (i + 1),
+            "due_date": now + timedelta(days=i % 60 - 30) if i % 3 == 0 else None,
+            "is_deleted": i % 10 == 0,
+            "user_id": u,
+        }
+        for u in range(1, USERS + 1)
+        for i in range(TASKS_PER_USER)
+    ])
+    TaskCounterService.rebuild()
+    db.session.commit()
+
+
+def record_queries(fn):
+    """Run fn and return the (statement, parameters) of every SELECT on task it issued."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM task" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def check_plan(statement, parameters) -> tuple[list[str], list[str]]:
+    """Return (problems, plan details) for the query plan of a single statement."""
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    details = [row[-1] for row in rows]
+    problems = []
+    for detail in details:
+        if detail.startswith("SCAN task"):
+            problems.append(f"full scan: {detail}")
+        if "TEMP B-TREE" in detail:
+            problems.append(f"sort not served by index: {detail}")
+    return problems, details
+
+
+def main() -> int:
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        seed()
+
+        user_id = 1
+        task_id = Task.query.filter_by(user_id=user_id, is_deleted=False).first().id
+        # A task deep in the in_progress column to drop another one below
+        after_task_id = Task.query.filter_by(
+            user_id=user_id, status=TaskStatus.IN_PROGRESS, is_deleted=False
+        ).order_by(Task.sort_order.desc()).offset(5).first().id
+
+        by_due_date = TaskListQuerySchema(order_by="-due_date")
+        scenarios = {
+            "get_user_tasks": lambda: TaskService.get_user_tasks(user_id),
+            "get_user_tasks_page (first)": lambda: TaskService.get_user_tasks_page(user_id, 50),
+            "get_user_tasks_page (next)": lambda: TaskService.get_user_tasks_page(
+                user_id, 50, TaskService.get_user_tasks_page(user_id, 50)[1]
+            ),
+            "get_user_tasks (status filter)": lambda: TaskService.get_user_tasks(
+                user_id, TaskListQuerySchema(status="backlog,done")
+            ),
+            "get_user_tasks (due range)": lambda: TaskService.get_user_tasks(
+                user_id, TaskListQuerySchema(
+                    due_after="2026-01-01T00:00:00Z", due_before="2027-01-01T00:00:00Z", order_by="due_date"
+                )
+            ),
+            "get_user_tasks_page (overdue, by due_date)": lambda: TaskService.get_user_tasks_page(
+                user_id, 50, None, TaskListQuerySchema(overdue=True, order_by="due_date")
+            ),
+            "get_user_tasks_page (next, by -due_date)": lambda: TaskService.get_user_tasks_page(
+                user_id, 50, TaskService.get_user_tasks_page(user_id, 50, None, by_due_date)[1], by_due_date
+            ),
+            "get_user_tasks_page (created_after, by -created_at)": lambda: TaskService.get_user_tasks_page(
+                user_id, 50, None, TaskListQuerySchema(created_after="2026-01-01T00:00:00Z", order_by="-created_at")
+            ),
+            "get_task_changes": lambda: TaskService.get_task_changes(user_id, 100),
+            "get_task_changes (full sync)": lambda: TaskService.get_task_changes(user_id),
+            "get_task_summary": lambda: TaskService.get_task_summary(user_id, 7),
+            "get_task_marker": lambda: TaskService.get_task_marker(task_id, user_id),
+            "get_task_by_id": lambda: TaskService.get_task_by_id(task_id, user_id),
+            "create_task": lambda: TaskService.create_task(TaskCreateSchema(title="New task"), user_id),
+            "update_task": lambda: TaskService.update_task(task_id, TaskUpdateSchema(title="Renamed"), user_id),
+            "reorder_task (middle)": lambda: TaskService.reorder_task(task_id, "in_progress", 10, user_id),
+            "reorder_task (top)": lambda: TaskService.reorder_task(task_id, "done", 0, user_id),
+            "reorder_task (bottom)": lambda: TaskService.reorder_task(task_id, "backlog", 10**6, user_id),
+            "reorder_task (after task)": lambda: TaskService.reorder_task(
+                task_id, "in_progress", 0, user_id, after_task_id
+            ),
+            "reorder_tasks_batch": lambda: TaskService.reorder_tasks_batch(
+                TaskBatchReorderSchema(moves=[
+                    {"task_id": task_id, "target_status": "in_review", "target_position": 3}
+                ]),
+                user_id
+            ),
+            "delete_task": lambda: TaskService.delete_task(task_id, user_id),
+        }
+
+        failures = 0
+        for name, scenario in scenarios.items():
+            queries = record_queries(scenario)
+            for statement, parameters in queries:
+                problems, details = check_plan(statement, parameters)
+                status = "❌" if problems else "✅"
+                print(f"{status} {name}: {' | '.join(details)}")
+                for problem in problems:
+                    print(f"     {problem}")
+                failures += bool(problems)
+
+    os.unlink(DB_PATH)
+
+    if failures:
+        print(f"\n❌ {failures} task queries are not index range scans")
+        return 1
+    print("\n✅ All task queries are served by index range scans")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Maintenance script to respace sort_order for every task board column
+Run this script from the backend directory: python migrations/rebalance_sort_order.py
+
+Repeated drag-and-drop into the same slot halves the gap between neighbouring
+sort_order values each time. reorder_task respaces a column on demand when the
+gap runs out; this script does the same for the whole table in one UPDATE,
+e.g. during a maintenance window.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.extensions import db
+from app.services.task_service import TaskService
+
+def rebalance_sort_order():
+    """Renumber sort_order per (user, status) column, preserving current order"""
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            TaskService.advance_change_seq()
+            updated = TaskService.rebalance_sort_order()
+            db.session.commit()
+            print(f"✅ Rebalanced sort_order for {updated} tasks")
+        except Exception as e:
+            print(f"❌ Rebalance failed: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    rebalance_sort_order()
@@ -0,0 +1,32 @@
+"""Add partial task index on (user_id, due_date) for due-date filters
+
+Revision ID: 0a6d4e2f8c51
+Revises: f3c9d2a7b418
+Create Date: 2026-10-17 19:48:03.517240
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6d4e2f8c51'
+down_revision = 'f3c9d2a7b418'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_task_user_due_date',
+            ['user_id', 'due_date'],
+            unique=False,
+            sqlite_where=sa.text('is_deleted = 0'),
+            postgresql_where=sa.text('is_deleted = false'),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_user_due_date')
@@ -0,0 +1,33 @@
+"""Add partial board index on task (user_id, status, sort_order)
+
+Revision ID: 5c1e8b2d9f47
+Revises: a0eb4dc50c91
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e8b2d9f47'
+down_revision = 'a0eb4dc50c91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_task_user_status_sort_order',
+            ['user_id', 'status', 'sort_order'],
+            unique=False,
+            sqlite_where=sa.text('is_deleted = 0'),
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_include=['title', 'created_at', 'due_date'],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_user_status_sort_order')
@@ -0,0 +1,59 @@
+"""Add user_task_counters with per-status live and overdue-eligible counts
+
+Revision ID: 7d2b5e9a1c36
+Revises: 0a6d4e2f8c51
+Create Date: 2026-10-17 20:21:44.902315
+
+The table is filled from the existing tasks; afterwards TaskService keeps it
+in step. repair_task_counters.py recomputes it the same way.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2b5e9a1c36'
+down_revision = '0a6d4e2f8c51'
+branch_labels = None
+depends_on = None
+
+STATUSES = ('BACKLOG', 'IN_PROGRESS', 'IN_REVIEW', 'DONE', 'WONT_DO')
+CLOSED = ('DONE', 'WONT_DO')
+
+
+def upgrade():
+    # The taskstatus type already exists on PostgreSQL (task.status)
+    status_type = sa.Enum(*STATUSES, name='taskstatus').with_variant(
+        postgresql.ENUM(*STATUSES, name='taskstatus', create_type=False), 'postgresql'
+    )
+    counters = op.create_table('user_task_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', status_type, nullable=False),
+        sa.Column('live_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('overdue_eligible_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'status')
+    )
+
+    task = sa.table('task',
+        sa.column('user_id', sa.Integer()),
+        sa.column('status', status_type),
+        sa.column('due_date', sa.DateTime(timezone=True)),
+        sa.column('is_deleted', sa.Boolean()),
+    )
+    eligible = sa.and_(task.c.due_date.is_not(None), task.c.status.notin_(CLOSED))
+    op.execute(counters.insert().from_select(
+        ['user_id', 'status', 'live_count', 'overdue_eligible_count'],
+        sa.select(
+            task.c.user_id,
+            task.c.status,
+            sa.func.count(),
+            sa.func.sum(sa.case((eligible, 1), else_=0)),
+        ).where(task.c.is_deleted == sa.false()).group_by(task.c.user_id, task.c.status)
+    ))
+
+
+def downgrade():
+    op.drop_table('user_task_counters')
@@ -0,0 +1,28 @@
+"""Add task indexes on (user_id, created_at) and (user_id, updated_at) for delta sync
+
+Revision ID: 9b3f6a1c7d20
+Revises: 5c1e8b2d9f47
+Create Date: 2026-10-17 14:03:52.118604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3f6a1c7d20'
+down_revision = '5c1e8b2d9f47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.create_index('ix_task_user_created_at', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_task_user_updated_at', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.drop_index('ix_task_user_updated_at')
+        batch_op.drop_index('ix_task_user_created_at')
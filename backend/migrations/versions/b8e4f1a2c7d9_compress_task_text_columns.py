@@ -0,0 +1,170 @@
+"""Compress long task text values and index search through a plain-text view
+
+Revision ID: b8e4f1a2c7d9
+Revises: 7d2b5e9a1c36
+Create Date: 2026-10-17 21:02:37.118540
+
+SQLite only: why/what/how/acceptance_criteria values of COMPRESSION_THRESHOLD
+bytes or more are rewritten as zlib BLOBs in chunks of CHUNK_SIZE rows, and
+task_fts is rebuilt over the task_search_content view, which decompresses
+through the task_text() function the app registers on every connection.
+The stored text size is printed before and after. PostgreSQL keeps plain
+text (TOAST compresses it) and is left untouched.
+
+The statements and compression settings mirror app/search.py and
+app/compression.py as of this revision.
+
+"""
+import zlib
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e4f1a2c7d9'
+down_revision = '7d2b5e9a1c36'
+branch_labels = None
+depends_on = None
+
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 6
+CHUNK_SIZE = 1000
+TEXT_COLUMNS = ('why', 'what', 'how', 'acceptance_criteria')
+
+SEARCH_COLUMNS = "title, why, what, how, acceptance_criteria"
+PLAIN_COLUMNS = ("title, task_text(why) AS why, task_text(what) AS what, task_text(how) AS how, "
+                 "task_text(acceptance_criteria) AS acceptance_criteria")
+NEW_PLAIN = ("new.title, task_text(new.why), task_text(new.what), task_text(new.how), "
+             "task_text(new.acceptance_criteria)")
+OLD_PLAIN = ("old.title, task_text(old.why), task_text(old.what), task_text(old.how), "
+             "task_text(old.acceptance_criteria)")
+NEW_VALUES = "new.title, new.why, new.what, new.how, new.acceptance_criteria"
+OLD_VALUES = "old.title, old.why, old.what, old.how, old.acceptance_criteria"
+TOKENIZE = "tokenize='porter unicode61 remove_diacritics 2'"
+
+DROP_SEARCH = [
+    "DROP TRIGGER IF EXISTS task_fts_au",
+    "DROP TRIGGER IF EXISTS task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_fts_ai",
+    "DROP TABLE IF EXISTS task_fts",
+    "DROP VIEW IF EXISTS task_search_content",
+]
+
+# task_fts over the decompressing view (this revision)
+VIEW_SEARCH = [
+    f"CREATE VIEW task_search_content AS SELECT id, {PLAIN_COLUMNS} FROM task",
+    f"CREATE VIRTUAL TABLE task_fts USING fts5("
+    f"{SEARCH_COLUMNS}, content='task_search_content', content_rowid='id', {TOKENIZE})",
+    f"CREATE TRIGGER task_fts_ai AFTER INSERT ON task BEGIN "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_PLAIN}); END",
+    f"CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_PLAIN}); END",
+    f"CREATE TRIGGER task_fts_au AFTER UPDATE OF {SEARCH_COLUMNS} ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_PLAIN}); "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_PLAIN}); END",
+    "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+]
+
+# task_fts straight over the task table (revision f3c9d2a7b418)
+TABLE_SEARCH = [
+    f"CREATE VIRTUAL TABLE task_fts USING fts5("
+    f"{SEARCH_COLUMNS}, content='task', content_rowid='id', {TOKENIZE})",
+    f"CREATE TRIGGER task_fts_ai AFTER INSERT ON task BEGIN "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_VALUES}); END",
+    f"CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); END",
+    f"CREATE TRIGGER task_fts_au AFTER UPDATE OF {SEARCH_COLUMNS} ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_VALUES}); END",
+    "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+]
+
+
+def compress(value):
+    if not isinstance(value, str):
+        return value
+    encoded = value.encode('utf-8')
+    if len(encoded) < COMPRESSION_THRESHOLD:
+        return value
+    packed = zlib.compress(encoded, COMPRESSION_LEVEL)
+    return packed if len(packed) < len(encoded) else value
+
+
+def decompress(value):
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+
+def rewrite_rows(bind, convert):
+    """Apply convert to every text value, CHUNK_SIZE rows at a time; return rows changed."""
+    columns = ", ".join(TEXT_COLUMNS)
+    assignments = ", ".join(f"{name} = :{name}" for name in TEXT_COLUMNS)
+    select_chunk = sa.text(f"SELECT id, {columns} FROM task WHERE id > :after ORDER BY id LIMIT :limit")
+    update_row = sa.text(f"UPDATE task SET {assignments} WHERE id = :id")
+    changed = 0
+    after = 0
+    while True:
+        rows = bind.execute(select_chunk, {"after": after, "limit": CHUNK_SIZE}).all()
+        if not rows:
+            return changed
+        updates = []
+        for row in rows:
+            values = {name: convert(getattr(row, name)) for name in TEXT_COLUMNS}
+            if any(values[name] is not getattr(row, name) for name in TEXT_COLUMNS):
+                updates.append({"id": row.id, **values})
+        if updates:
+            bind.execute(update_row, updates)
+            changed += len(updates)
+        after = rows[-1].id
+
+
+def text_size(bind):
+    """(stored bytes of the text columns, database size in bytes, free pages in bytes)."""
+    stored = bind.execute(sa.text(
+        "SELECT COALESCE(SUM(" + " + ".join(
+            f"COALESCE(LENGTH(CAST({name} AS BLOB)), 0)" for name in TEXT_COLUMNS
+        ) + "), 0) FROM task"
+    )).scalar()
+    page_size = bind.exec_driver_sql("PRAGMA page_size").scalar()
+    pages = bind.exec_driver_sql("PRAGMA page_count").scalar()
+    free = bind.exec_driver_sql("PRAGMA freelist_count").scalar()
+    return stored, pages * page_size, free * page_size
+
+
+def report(label, before, after, changed):
+    mib = 1024 * 1024
+    change = after[0] / before[0] - 1 if before[0] else 0
+    print(f"{label}: rewrote {changed} tasks; text columns {before[0] / mib:.1f} MiB -> "
+          f"{after[0] / mib:.1f} MiB ({change:+.0%}); database file {before[1] / mib:.1f} MiB -> "
+          f"{after[1] / mib:.1f} MiB with {after[2] / mib:.1f} MiB free (VACUUM returns it to the filesystem)")
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+    bind.connection.driver_connection.create_function('task_text', 1, decompress, deterministic=True)
+
+    before = text_size(bind)
+    # Drop the search triggers first so the rewrite does not reindex every row
+    for statement in DROP_SEARCH:
+        op.execute(statement)
+    changed = rewrite_rows(bind, compress)
+    for statement in VIEW_SEARCH:
+        op.execute(statement)
+    report("Compressed task text", before, text_size(bind), changed)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    before = text_size(bind)
+    for statement in DROP_SEARCH:
+        op.execute(statement)
+    changed = rewrite_rows(bind, decompress)
+    for statement in TABLE_SEARCH:
+        op.execute(statement)
+    report("Decompressed task text", before, text_size(bind), changed)
@@ -0,0 +1,58 @@
+"""Add per-user task change sequence numbers for delta sync
+
+Revision ID: c5a9e3d7f140
+Revises: b8e4f1a2c7d9
+Create Date: 2026-10-17 22:14:09.530271
+
+Existing rows are numbered per user in (updated_at or created_at, id)
+order, and each user's task_change_seq is set to the highest number given
+out, so clients that sync from now on see every later change.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a9e3d7f140'
+down_revision = 'b8e4f1a2c7d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('user', sa.Column('task_change_seq', sa.BigInteger(), server_default='0', nullable=False))
+    op.add_column('task', sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False))
+
+    task = sa.table('task',
+        sa.column('id', sa.Integer()),
+        sa.column('user_id', sa.Integer()),
+        sa.column('created_at', sa.DateTime(timezone=True)),
+        sa.column('updated_at', sa.DateTime(timezone=True)),
+        sa.column('change_seq', sa.BigInteger()),
+    )
+    user = sa.table('user',
+        sa.column('id', sa.Integer()),
+        sa.column('task_change_seq', sa.BigInteger()),
+    )
+    numbered = sa.select(
+        task.c.id.label('id'),
+        sa.func.row_number().over(
+            partition_by=task.c.user_id,
+            order_by=(sa.func.coalesce(task.c.updated_at, task.c.created_at), task.c.id)
+        ).label('seq')
+    ).subquery()
+    op.execute(task.update().where(task.c.id == numbered.c.id).values(change_seq=numbered.c.seq))
+    op.execute(user.update().values(task_change_seq=sa.func.coalesce(
+        sa.select(sa.func.max(task.c.change_seq)).where(task.c.user_id == user.c.id).scalar_subquery(), 0
+    )))
+
+    op.create_index('ix_task_user_change_seq', 'task', ['user_id', 'change_seq'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_task_user_change_seq', table_name='task')
+    # Plain ALTER TABLE ... DROP COLUMN: a batch table rebuild on SQLite
+    # would drop the full-text search triggers on task
+    op.drop_column('task', 'change_seq')
+    op.drop_column('user', 'task_change_seq')
@@ -0,0 +1,107 @@
+"""Scope the full-text search index to the owning user
+
+Revision ID: d2f8a6c4e1b3
+Revises: c5a9e3d7f140
+Create Date: 2026-10-17 23:08:41.274903
+
+SQLite: task_fts gains an owner column holding 'u' || user_id, which every
+search MATCHes, and is rebuilt. PostgreSQL: the GIN index on the tsvector
+expression is replaced by one on (user_id, tsvector), which needs the
+btree_gin extension (CREATE EXTENSION requires the appropriate privilege).
+The statements mirror app/search.py as of this revision.
+
+"""
+import zlib
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f8a6c4e1b3'
+down_revision = 'c5a9e3d7f140'
+branch_labels = None
+depends_on = None
+
+TOKENIZE = "tokenize='porter unicode61 remove_diacritics 2'"
+TEXT_COLUMNS = "title, why, what, how, acceptance_criteria"
+PLAIN_COLUMNS = ("title, task_text(why) AS why, task_text(what) AS what, task_text(how) AS how, "
+                 "task_text(acceptance_criteria) AS acceptance_criteria")
+NEW_PLAIN = ("new.title, task_text(new.why), task_text(new.what), task_text(new.how), "
+             "task_text(new.acceptance_criteria)")
+OLD_PLAIN = ("old.title, task_text(old.why), task_text(old.what), task_text(old.how), "
+             "task_text(old.acceptance_criteria)")
+
+DROP_SEARCH = [
+    "DROP TRIGGER IF EXISTS task_fts_au",
+    "DROP TRIGGER IF EXISTS task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_fts_ai",
+    "DROP TABLE IF EXISTS task_fts",
+    "DROP VIEW IF EXISTS task_search_content",
+]
+
+
+def view_search(columns, plain, new, old, watched):
+    """task_fts over the decompressing task_search_content view."""
+    return [
+        f"CREATE VIEW task_search_content AS SELECT id, {plain} FROM task",
+        f"CREATE VIRTUAL TABLE task_fts USING fts5("
+        f"{columns}, content='task_search_content', content_rowid='id', {TOKENIZE})",
+        f"CREATE TRIGGER task_fts_ai AFTER INSERT ON task BEGIN "
+        f"INSERT INTO task_fts(rowid, {columns}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN "
+        f"INSERT INTO task_fts(task_fts, rowid, {columns}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER task_fts_au AFTER UPDATE OF {watched} ON task BEGIN "
+        f"INSERT INTO task_fts(task_fts, rowid, {columns}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO task_fts(rowid, {columns}) VALUES (new.id, {new}); END",
+        "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+    ]
+
+
+# With the owner column (this revision)
+OWNER_SEARCH = view_search(
+    f"{TEXT_COLUMNS}, owner",
+    f"{PLAIN_COLUMNS}, 'u' || user_id AS owner",
+    f"{NEW_PLAIN}, 'u' || new.user_id",
+    f"{OLD_PLAIN}, 'u' || old.user_id",
+    f"{TEXT_COLUMNS}, user_id",
+)
+# Without it (revision b8e4f1a2c7d9)
+UNSCOPED_SEARCH = view_search(TEXT_COLUMNS, PLAIN_COLUMNS, NEW_PLAIN, OLD_PLAIN, TEXT_COLUMNS)
+
+POSTGRESQL_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(why, '') || ' ' || coalesce(what, '') || ' ' || "
+    "coalesce(how, '') || ' ' || coalesce(acceptance_criteria, '')), 'B')"
+)
+
+
+def decompress(value):
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+
+def rebuild_sqlite(statements):
+    bind = op.get_bind()
+    # The rebuild reads the view, which decompresses through task_text()
+    bind.connection.driver_connection.create_function('task_text', 1, decompress, deterministic=True)
+    for statement in DROP_SEARCH + statements:
+        op.execute(statement)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        rebuild_sqlite(OWNER_SEARCH)
+    elif dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_task_user_search ON task USING gin (user_id, ({POSTGRESQL_VECTOR}))")
+        op.execute("DROP INDEX IF EXISTS ix_task_search")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        rebuild_sqlite(UNSCOPED_SEARCH)
+    elif dialect == 'postgresql':
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_task_search ON task USING gin (({POSTGRESQL_VECTOR}))")
+        op.execute("DROP INDEX IF EXISTS ix_task_user_search")
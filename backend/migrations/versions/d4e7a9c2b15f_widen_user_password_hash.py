@@ -0,0 +1,33 @@
+"""Widen user.password_hash to 256 characters
+
+Revision ID: d4e7a9c2b15f
+Revises: 9b3f6a1c7d20
+Create Date: 2026-10-17 16:41:07.583920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e7a9c2b15f'
+down_revision = '9b3f6a1c7d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # scrypt hashes with their method prefix are ~160 characters
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.alter_column('password_hash',
+               existing_type=sa.String(length=128),
+               type_=sa.String(length=256),
+               existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.alter_column('password_hash',
+               existing_type=sa.String(length=256),
+               type_=sa.String(length=128),
+               existing_nullable=False)
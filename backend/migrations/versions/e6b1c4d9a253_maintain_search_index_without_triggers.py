@@ -0,0 +1,97 @@
+"""Maintain the SQLite search index from the app instead of triggers
+
+Revision ID: e6b1c4d9a253
+Revises: d2f8a6c4e1b3
+Create Date: 2026-10-17 23:41:16.802417
+
+SQLite only: the insert/update triggers indexed through task_text(), a
+function only the app's connections have, so any other client writing to
+the task table failed with "no such function: task_text". task_fts becomes
+a contentless FTS5 table (contentless_delete, SQLite 3.43+) written by
+SearchIndexService; the remaining delete trigger calls no function. The
+task_search_content view is dropped. Tasks written outside the app are not
+indexed until rebuild_search_index.py runs.
+
+The statements mirror app/search.py as of this revision.
+
+"""
+import sqlite3
+import zlib
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b1c4d9a253'
+down_revision = 'd2f8a6c4e1b3'
+branch_labels = None
+depends_on = None
+
+TOKENIZE = "tokenize='porter unicode61 remove_diacritics 2'"
+COLUMNS = "title, why, what, how, acceptance_criteria, owner"
+PLAIN_COLUMNS = ("title, task_text(why) AS why, task_text(what) AS what, task_text(how) AS how, "
+                 "task_text(acceptance_criteria) AS acceptance_criteria, 'u' || user_id AS owner")
+NEW_PLAIN = ("new.title, task_text(new.why), task_text(new.what), task_text(new.how), "
+             "task_text(new.acceptance_criteria), 'u' || new.user_id")
+OLD_PLAIN = ("old.title, task_text(old.why), task_text(old.what), task_text(old.how), "
+             "task_text(old.acceptance_criteria), 'u' || old.user_id")
+
+DROP_SEARCH = [
+    "DROP TRIGGER IF EXISTS task_fts_au",
+    "DROP TRIGGER IF EXISTS task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_fts_ai",
+    "DROP TABLE IF EXISTS task_fts",
+    "DROP VIEW IF EXISTS task_search_content",
+]
+
+# Contentless index written by the app (this revision)
+APP_SEARCH = [
+    f"CREATE VIRTUAL TABLE task_fts USING fts5({COLUMNS}, content='', contentless_delete=1, {TOKENIZE})",
+    "CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN DELETE FROM task_fts WHERE rowid = old.id; END",
+    f"INSERT INTO task_fts(rowid, {COLUMNS}) SELECT id, title, task_text(why), task_text(what), "
+    f"task_text(how), task_text(acceptance_criteria), 'u' || user_id FROM task",
+]
+
+# External-content index over the decompressing view (revision d2f8a6c4e1b3)
+TRIGGER_SEARCH = [
+    f"CREATE VIEW task_search_content AS SELECT id, {PLAIN_COLUMNS} FROM task",
+    f"CREATE VIRTUAL TABLE task_fts USING fts5("
+    f"{COLUMNS}, content='task_search_content', content_rowid='id', {TOKENIZE})",
+    f"CREATE TRIGGER task_fts_ai AFTER INSERT ON task BEGIN "
+    f"INSERT INTO task_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_PLAIN}); END",
+    f"CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_PLAIN}); END",
+    f"CREATE TRIGGER task_fts_au AFTER UPDATE OF title, why, what, how, acceptance_criteria, user_id ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_PLAIN}); "
+    f"INSERT INTO task_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_PLAIN}); END",
+    "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+]
+
+
+def decompress(value):
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+
+def rebuild_sqlite(statements):
+    bind = op.get_bind()
+    # Both indexes are filled through task_text()
+    bind.connection.driver_connection.create_function('task_text', 1, decompress, deterministic=True)
+    for statement in DROP_SEARCH + statements:
+        op.execute(statement)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    if sqlite3.sqlite_version_info < (3, 43, 0):
+        raise RuntimeError(
+            f"SQLite {sqlite3.sqlite_version} has no FTS5 contentless_delete tables; 3.43 or later is required"
+        )
+    rebuild_sqlite(APP_SEARCH)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    rebuild_sqlite(TRIGGER_SEARCH)
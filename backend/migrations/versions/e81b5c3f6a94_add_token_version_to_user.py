@@ -0,0 +1,26 @@
+"""Add token_version column to user table
+
+Revision ID: e81b5c3f6a94
+Revises: d4e7a9c2b15f
+Create Date: 2026-10-17 18:22:45.906113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e81b5c3f6a94'
+down_revision = 'd4e7a9c2b15f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('token_version')
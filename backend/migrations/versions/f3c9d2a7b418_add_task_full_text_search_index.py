@@ -0,0 +1,67 @@
+"""Add full-text search index on task text columns
+
+Revision ID: f3c9d2a7b418
+Revises: e81b5c3f6a94
+Create Date: 2026-10-17 19:05:12.381664
+
+SQLite gets an FTS5 external-content table (task_fts) kept in sync by
+triggers, PostgreSQL a GIN index over a weighted tsvector expression.
+The statements mirror app/search.py as of this revision.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c9d2a7b418'
+down_revision = 'e81b5c3f6a94'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = "title, why, what, how, acceptance_criteria"
+NEW_VALUES = "new.title, new.why, new.what, new.how, new.acceptance_criteria"
+OLD_VALUES = "old.title, old.why, old.what, old.how, old.acceptance_criteria"
+
+SQLITE_UPGRADE = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS task_fts USING fts5("
+    f"{SEARCH_COLUMNS}, content='task', content_rowid='id', tokenize='porter unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS task_fts_ai AFTER INSERT ON task BEGIN "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_VALUES}); END",
+    f"CREATE TRIGGER IF NOT EXISTS task_fts_ad AFTER DELETE ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); END",
+    f"CREATE TRIGGER IF NOT EXISTS task_fts_au AFTER UPDATE OF {SEARCH_COLUMNS} ON task BEGIN "
+    f"INSERT INTO task_fts(task_fts, rowid, {SEARCH_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES}); "
+    f"INSERT INTO task_fts(rowid, {SEARCH_COLUMNS}) VALUES (new.id, {NEW_VALUES}); END",
+    # Index the rows that already exist
+    "INSERT INTO task_fts(task_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS task_fts_au",
+    "DROP TRIGGER IF EXISTS task_fts_ad",
+    "DROP TRIGGER IF EXISTS task_fts_ai",
+    "DROP TABLE IF EXISTS task_fts",
+]
+
+POSTGRESQL_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(why, '') || ' ' || coalesce(what, '') || ' ' || "
+    "coalesce(how, '') || ' ' || coalesce(acceptance_criteria, '')), 'B')"
+)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_task_search ON task USING gin (({POSTGRESQL_VECTOR}))")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_task_search")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Re-index task text for full-text search (SQLite only).
+Run this script from the backend directory:
+
+    python rebuild_search_index.py
+    python rebuild_search_index.py --user 42 --user 43
+
+TaskService writes the search index along with every task it creates or
+edits; the database has no triggers that do it, so tasks inserted or edited
+any other way (seed scripts, manual SQL, other clients) are missing from
+search results or found by their old text until this runs. Deleting task
+rows needs no rebuild. PostgreSQL indexes the task table itself and needs
+none of this.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app
+from app.extensions import db
+from app.services.search_index_service import SearchIndexService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-index task text for full-text search.")
+    parser.add_argument("--user", type=int, action="append", dest="user_ids", help="only this user (repeatable)")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if db.engine.dialect.name != "sqlite":
+            print(f"ℹ️  Nothing to rebuild on {db.engine.dialect.name}")
+            return
+        start = time.perf_counter()
+        indexed = SearchIndexService.rebuild(args.user_ids)
+        db.session.commit()
+        elapsed = time.perf_counter() - start
+
+    print(f"✅ Re-indexed {indexed} tasks in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Recompute user_task_counters from the task table.
+Run this script from the backend directory:
+
+    python repair_task_counters.py
+    python repair_task_counters.py --user 42 --user 43
+    python repair_task_counters.py --dry-run
+
+TaskService keeps the counters in step with every task write; run this after
+loading tasks outside it (seed scripts, manual SQL) or to repair drift. The
+counters are rebuilt with one grouped INSERT ... SELECT, and the number of
+counters that differed from the recomputed values is reported.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import select
+from app import create_app
+from app.extensions import db
+from app.models import UserTaskCounter
+from app.services.task_counter_service import TaskCounterService
+
+
+def read_counters(user_ids: list | None) -> dict:
+    """Map (user_id, status) to (live_count, overdue_eligible_count), skipping empty counters."""
+    query = select(
+        UserTaskCounter.user_id,
+        UserTaskCounter.status,
+        UserTaskCounter.live_count,
+        UserTaskCounter.overdue_eligible_count
+    )
+    if user_ids is not None:
+        query = query.where(UserTaskCounter.user_id.in_(user_ids))
+    return {
+        (user_id, status): (live, eligible)
+        for user_id, status, live, eligible in db.session.execute(query)
+        if live or eligible
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute per-user task status counters.")
+    parser.add_argument("--user", type=int, action="append", dest="user_ids", help="only this user (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        start = time.perf_counter()
+        before = read_counters(args.user_ids)
+        written = TaskCounterService.rebuild(args.user_ids)
+        after = read_counters(args.user_ids)
+        if args.dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+        elapsed = time.perf_counter() - start
+
+    drifted = sorted(
+        (key for key in before.keys() | after.keys() if before.get(key) != after.get(key)),
+        key=lambda key: (key[0], key[1].name)
+    )
+    for user_id, status in drifted[:20]:
+        print(f"   user {user_id} {status.value}: {before.get((user_id, status), (0, 0))} -> "
+              f"{after.get((user_id, status), (0, 0))}")
+    if len(drifted) > 20:
+        print(f"   ... and {len(drifted) - 20} more")
+
+    if args.dry_run:
+        print(f"🔍 {len(drifted)} of {written} counters drifted (dry run, nothing written) in {elapsed:.1f}s")
+    else:
+        print(f"✅ Rebuilt {written} counters ({len(drifted)} had drifted) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
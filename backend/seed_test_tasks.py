@@ -1,96 +1,291 @@
 #!/usr/bin/env python3
 """
-Seed script to create test tasks for testing delete functionality.
-Run this script to add 3 test tasks to the database.
+Synthetic data generator for development and load testing.
+Run this script from the backend directory:
+
+    python seed_test_tasks.py --users 100 --tasks-per-user 10000
+    python seed_test_tasks.py --existing-users --tasks-per-user 50 --deleted-share 0.2
+
+Users and tasks are written with bulk INSERT executemany in large chunks,
+without ORM objects or per-row existence checks. Status, due dates, text
+sizes and the soft-deleted share follow configurable distributions, and
+every (user, status) column gets evenly spaced sort_order values so boards
+are ready for reordering. All seeded users share the same password. The
+per-user status counters and the search index are rebuilt in bulk once the
+tasks are in.
 """
 
 import sys
 import os
-from datetime import datetime
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import func, insert, select, update
 from app import create_app
+from app.extensions import db, password_hasher
 from app.models import Task, User, TaskStatus
+from app.services.task_service import SORT_ORDER_GAP, TaskService
+from app.services.search_index_service import SearchIndexService
+from app.services.task_counter_service import TaskCounterService
 
-def seed_test_tasks():
-    """Create test tasks for the authenticated user."""
-    app = create_app()
-    
-    with app.app_context():
-        # Get the first user (you'll need to be logged in as this user)
-        user = User.query.first()
-        if not user:
-            print("❌ No users found in database. Please register a user first.")
-            return
-        
-        print(f"🔍 Adding test tasks for user: {user.username} (ID: {user.id})")
-        
-        test_tasks = [
-            {
-                "title": "Fix bug in login flow",
-                "why": "Users can't log in after registration",
-                "what": "Investigate auth token handling",
-                "how": "Check JWT creation and frontend login logic",
-                "acceptance_criteria": "New users can log in immediately",
-                "status": TaskStatus.BACKLOG
-            },
-            {
-                "title": "Design new dashboard layout",
-                "why": "Current layout looks too sparse",
-                "what": "Sketch new layout with more informative widgets",
-                "how": "Use Figma or similar tool",
-                "acceptance_criteria": "Includes sections for upcoming tasks and stats",
-                "status": TaskStatus.IN_PROGRESS
-            },
+DEFAULT_PASSWORD = "password123"
+DEFAULT_CHUNK_SIZE = 10000
+
+# Default shape of the generated data; seed_dataset() takes overrides per key
+DEFAULT_DISTRIBUTIONS = {
+    # Relative weights per status value
+    "status": {"backlog": 35, "in_progress": 20, "in_review": 10, "done": 30, "wont_do": 5},
+    # Share of tasks with a due date, spread uniformly over (min, max) days from now
+    "due_date_share": 0.3,
+    "due_in_days": (-30, 90),
+    # created_at spread uniformly over this many days before now
+    "created_within_days": 180,
+    # (min, max) characters per text field; 0 characters stores NULL
+    "text_chars": {
+        "why": (0, 150),
+        "what": (20, 600),
+        "how": (0, 300),
+        "acceptance_criteria": (0, 200),
+    },
+    # Share of soft-deleted tasks
+    "deleted_share": 0.05,
+}
+
+# Distinct texts generated per field and sampled for every row
+TEXT_POOL_SIZE = 512
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud "
+    "exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. "
+)
+
+
+def text_pool(rng: random.Random, min_chars: int, max_chars: int) -> list:
+    """Texts with lengths uniform in [min_chars, max_chars]; None for empty."""
+    base = LOREM * (max_chars // len(LOREM) + 2)
+    pool = []
+    for _ in range(TEXT_POOL_SIZE):
+        length = rng.randint(min_chars, max_chars)
+        offset = rng.randrange(len(LOREM))
+        pool.append(base[offset:offset + length] or None)
+    return pool
+
+
+def create_users(count: int, password: str) -> list:
+    """Bulk-insert `count` users sharing one password hash; return their IDs."""
+    password_hash = password_hasher.hash(password)
+    run_id = uuid.uuid4().hex[:8]
+    user_ids = []
+    for start in range(0, count, DEFAULT_CHUNK_SIZE):
+        rows = [
             {
-                "title": "Add drag-and-drop support",
-                "why": "Improve task prioritization",
-                "what": "Implement drag-and-drop between columns",
-                "how": "Use react-beautiful-dnd or equivalent",
-                "acceptance_criteria": "Tasks can be moved smoothly between columns",
-                "status": TaskStatus.DONE
+                "username": f"seed-{run_id}-{i}",
+                "email": f"seed-{run_id}-{i}@example.com",
+                "password_hash": password_hash,
             }
+            for i in range(start, min(start + DEFAULT_CHUNK_SIZE, count))
         ]
-        
-        created_tasks = []
-        for task_data in test_tasks:
-            # Check if task already exists
-            existing_task = Task.query.filter_by(
-                title=task_data["title"],
-                user_id=user.id,
-                is_deleted=False
-            ).first()
-            
-            if existing_task:
-                print(f"⚠️  Task '{task_data['title']}' already exists, skipping...")
-                continue
-            
-            # Create new task
-            task = Task(
-                title=task_data["title"],
-                why=task_data["why"],
-                what=task_data["what"],
-                how=task_data["how"],
-                acceptance_criteria=task_data["acceptance_criteria"],
-                status=task_data["status"],
-                user_id=user.id,
-                created_at=datetime.utcnow()
+        user_ids.extend(db.session.execute(insert(User).returning(User.id), rows).scalars())
+    db.session.commit()
+    return sorted(user_ids)
+
+
+def generate_tasks(user_ids: list, tasks_per_user: int, distributions: dict, rng: random.Random,
+                   last_sort_orders: dict | None = None):
+    """
+    Yield task rows for each user, with sort_order spaced per status column.
+    New tasks go after the (user_id, status) sort_order in last_sort_orders.
+    """
+    last_sort_orders = last_sort_orders or {}
+    statuses = [TaskStatus(value) for value in distributions["status"]]
+    weights = list(distributions["status"].values())
+    pools = {
+        field: text_pool(rng, low, high)
+        for field, (low, high) in distributions["text_chars"].items()
+    }
+    due_share = distributions["due_date_share"]
+    due_low, due_high = distributions["due_in_days"]
+    deleted_share = distributions["deleted_share"]
+    created_span = distributions["created_within_days"] * 86400
+    now = datetime.now(timezone.utc)
+
+    for user_id in user_ids:
+        # Draw each attribute for the whole user at once; far cheaper than
+        # per-row random calls at millions of rows
+        drawn_statuses = rng.choices(statuses, weights, k=tasks_per_user)
+        texts = {field: rng.choices(pool, k=tasks_per_user) for field, pool in pools.items()}
+        positions = dict.fromkeys(statuses, 0)
+        for i, status in enumerate(drawn_statuses):
+            positions[status] += 1
+            yield {
+                "title": f"Task {i + 1}",
+                "why": texts["why"][i],
+                "what": texts["what"][i],
+                "how": texts["how"][i],
+                "acceptance_criteria": texts["acceptance_criteria"][i],
+                "status": status,
+                "sort_order": last_sort_orders.get((user_id, status), 0.0) + positions[status] * SORT_ORDER_GAP,
+                "due_date": (
+                    now + timedelta(days=rng.uniform(due_low, due_high))
+                    if rng.random() < due_share else None
+                ),
+                "is_deleted": rng.random() < deleted_share,
+                "user_id": user_id,
+                "created_at": now - timedelta(seconds=rng.random() * created_span),
+            }
+
+
+def insert_tasks(rows, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Insert task rows with one Core executemany (and commit) per chunk; return the row count."""
+    table = Task.__table__
+    total = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            db.session.execute(insert(table), chunk)
+            db.session.commit()
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(table), chunk)
+        db.session.commit()
+        total += len(chunk)
+    return total
+
+
+def seed_dataset(users: int, tasks_per_user: int, distributions: dict | None = None,
+                 existing_users: bool = False, password: str = DEFAULT_PASSWORD,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, rng: random.Random | None = None) -> tuple:
+    """
+    Seed users and tasks into the current app's database.
+
+    Args:
+        users: Number of users to create (ignored with existing_users)
+        tasks_per_user: Tasks generated for every user
+        distributions: Overrides for DEFAULT_DISTRIBUTIONS keys
+        existing_users: Add tasks to every existing user instead of creating users
+        password: Password shared by the created users
+        chunk_size: Rows per executemany INSERT
+        rng: Random source, for repeatable datasets
+
+    Returns:
+        (user IDs, number of tasks inserted)
+    """
+    rng = rng or random.Random()
+    distributions = {**DEFAULT_DISTRIBUTIONS, **(distributions or {})}
+    last_sort_orders = {}
+    if existing_users:
+        user_ids = list(db.session.execute(select(User.id).order_by(User.id)).scalars())
+        last_sort_orders = {
+            (user_id, status): sort_order
+            for user_id, status, sort_order in db.session.execute(
+                select(Task.user_id, Task.status, func.max(Task.sort_order)).group_by(Task.user_id, Task.status)
             )
-            
-            task.save()
-            created_tasks.append(task)
-            print(f"✅ Created task: '{task.title}' (Status: {task.status.value})")
-        
-        if created_tasks:
-            print(f"\n🎉 Successfully created {len(created_tasks)} test tasks!")
-            print("\n📋 Test Tasks Created:")
-            for task in created_tasks:
-                print(f"   • {task.title} ({task.status.value})")
-            print(f"\n🔗 You can now test delete functionality in the UI with user: {user.username}")
-        else:
-            print("\n⚠️  No new tasks were created (they may already exist)")
+        }
+    else:
+        user_ids = create_users(users, password)
+    rows = generate_tasks(user_ids, tasks_per_user, distributions, rng, last_sort_orders)
+    task_count = insert_tasks(rows, chunk_size)
+    # The inserts bypass TaskService: advance the change sequences and
+    # stamp the new rows (change_seq 0) so list markers and delta sync see
+    # them, then recompute the counters and search index rows they skipped
+    TaskService.advance_change_seq()
+    db.session.execute(
+        update(Task).where(Task.change_seq == 0).values(
+            change_seq=select(User.task_change_seq).where(User.id == Task.user_id).scalar_subquery()
+        )
+    )
+    TaskCounterService.rebuild(None if existing_users else user_ids)
+    SearchIndexService.rebuild(None if existing_users else user_ids)
+    db.session.commit()
+    return user_ids, task_count
+
+
+def parse_weights(value: str) -> dict:
+    """Parse "backlog=40,done=60" into {"backlog": 40.0, "done": 60.0}."""
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        TaskStatus(name.strip())
+        weights[name.strip()] = float(weight)
+    return weights
+
+
+def parse_range(value: str) -> tuple:
+    """Parse "low:high" into a (low, high) tuple of numbers."""
+    low, _, high = value.partition(":")
+    return float(low), float(high)
+
+
+def parse_text_chars(value: str) -> dict:
+    """Parse "what=100:4000,how=0:0" into per-field (min, max) character ranges."""
+    sizes = dict(DEFAULT_DISTRIBUTIONS["text_chars"])
+    for item in value.split(","):
+        field, _, bounds = item.partition("=")
+        if field not in sizes:
+            raise argparse.ArgumentTypeError(f"unknown text field {field!r}")
+        low, high = parse_range(bounds)
+        sizes[field] = (int(low), int(high))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-generate synthetic users and tasks.")
+    parser.add_argument("--users", type=int, default=1, help="users to create")
+    parser.add_argument("--existing-users", action="store_true", help="add tasks to every existing user instead")
+    parser.add_argument("--tasks-per-user", type=int, default=100)
+    parser.add_argument("--status-weights", type=parse_weights, help='e.g. "backlog=40,in_progress=20,done=40"')
+    parser.add_argument("--due-date-share", type=float, help="share of tasks with a due date (0-1)")
+    parser.add_argument("--due-in-days", type=parse_range, help='due date range around now, e.g. "-30:90"')
+    parser.add_argument("--created-within-days", type=int, help="spread of created_at before now")
+    parser.add_argument("--text-chars", type=parse_text_chars, help='per-field sizes, e.g. "what=100:4000,how=0:0"')
+    parser.add_argument("--deleted-share", type=float, help="share of soft-deleted tasks (0-1)")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="password of the created users")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per INSERT executemany")
+    parser.add_argument("--seed", type=int, help="random seed for a repeatable dataset")
+    args = parser.parse_args()
+
+    option_keys = {
+        "status_weights": "status",
+        "due_date_share": "due_date_share",
+        "due_in_days": "due_in_days",
+        "created_within_days": "created_within_days",
+        "text_chars": "text_chars",
+        "deleted_share": "deleted_share",
+    }
+    distributions = {
+        key: getattr(args, option) for option, key in option_keys.items() if getattr(args, option) is not None
+    }
+
+    app = create_app()
+    with app.app_context():
+        start = time.perf_counter()
+        user_ids, task_count = seed_dataset(
+            args.users,
+            args.tasks_per_user,
+            distributions,
+            existing_users=args.existing_users,
+            password=args.password,
+            chunk_size=args.chunk_size,
+            rng=random.Random(args.seed),
+        )
+        elapsed = time.perf_counter() - start
+
+    if not user_ids:
+        print("❌ No users found in database. Please register a user first.")
+        return
+    print(f"✅ Seeded {task_count} tasks for {len(user_ids)} users in {elapsed:.1f}s "
+          f"({task_count / elapsed:,.0f} tasks/s)")
+    if not args.existing_users:
+        print(f"🔑 Seeded users log in with password: {args.password}")
+
 
 if __name__ == "__main__":
-    seed_test_tasks()
\ No newline at end of file
+    main()
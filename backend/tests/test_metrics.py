@@ -0,0 +1,62 @@
+# backend/tests/test_metrics.py
+"""
+Request instrumentation is opt-in, and /metrics can be held behind a bearer
+token. Run from the backend directory:
+
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+
+
+class MetricsConfig(Config):
+    TESTING = True
+    TASK_CACHE_BACKEND = "memory"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
+
+
+class MetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.apps = []
+
+    def tearDown(self):
+        for app in self.apps:
+            with app.app_context():
+                db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def client(self, **config):
+        database_uri = "sqlite:///" + os.path.join(self.tmpdir.name, f"metrics{len(self.apps)}.db")
+        app = create_app(type("Config", (MetricsConfig,), {"SQLALCHEMY_DATABASE_URI": database_uri, **config}))
+        with app.app_context():
+            db.create_all()
+        self.apps.append(app)
+        return app.test_client()
+
+    def test_instrumentation_is_off_by_default(self):
+        self.assertFalse(Config.METRICS_ENABLED)
+        self.assertFalse(Config.SERVER_TIMING_ENABLED)
+        client = self.client(METRICS_ENABLED=False, SERVER_TIMING_ENABLED=False)
+        self.assertEqual(client.get("/metrics").status_code, 404)
+        response = client.post("/auth/login", json={"email": "nobody@example.com", "password": "secret1"})
+        self.assertNotIn("Server-Timing", response.headers)
+
+    def test_metrics_token(self):
+        client = self.client(METRICS_ENABLED=True, SERVER_TIMING_ENABLED=True, METRICS_TOKEN="s3cret")
+        self.assertIn("Server-Timing", client.get("/metrics").headers)
+        self.assertEqual(client.get("/metrics").status_code, 401)
+        self.assertEqual(client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code, 401)
+        response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("trackly_request_duration_seconds", response.get_data(as_text=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
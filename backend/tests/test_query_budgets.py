@@ -0,0 +1,158 @@
+# backend/tests/test_query_budgets.py
+"""
+Drive every route with QUERY_BUDGET_MODE=raise, so a view that executes
+more SQL statements than its @query_budget fails here instead of logging a
+warning in production. Run from the backend directory:
+
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+from sqlalchemy import update
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import Task
+
+
+class BudgetConfig(Config):
+    TESTING = True
+    QUERY_BUDGET_MODE = "raise"
+    TASK_CACHE_BACKEND = "memory"
+    # Cheap inline hashing; the budgets only count SQL
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
+
+
+class QueryBudgetTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        database_uri = "sqlite:///" + os.path.join(cls.tmpdir.name, "budget.db")
+        cls.app = create_app(type("Config", (BudgetConfig,), {"SQLALCHEMY_DATABASE_URI": database_uri}))
+        with cls.app.app_context():
+            db.create_all()
+        cls.client = cls.app.test_client()
+        cls.users = count(1)
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.engine.dispose()
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        n = next(self.users)
+        self.email = f"user{n}@example.com"
+        response = self.request("POST", "/auth/register", 201, json={
+            "username": f"user{n}", "email": self.email, "password": "secret1"
+        }, auth=False)
+        self.headers = {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+
+    def request(self, method, path, expected, auth=True, headers=None, **kwargs):
+        """Send a request; QueryBudgetExceeded propagates because TESTING is set."""
+        all_headers = {**(self.headers if auth else {}), **(headers or {})}
+        response = self.client.open(path, method=method, headers=all_headers, **kwargs)
+        response.get_data()
+        self.assertEqual(response.status_code, expected, response.get_data(as_text=True)[:200])
+        return response
+
+    def create_tasks(self, n, **fields):
+        return [
+            self.request("POST", "/tasks", 201, json={"title": f"Task {i}", **fields}).get_json()["task"]["id"]
+            for i in range(n)
+        ]
+
+    def test_auth_routes(self):
+        self.request("POST", "/auth/login", 200, json={"email": self.email, "password": "secret1"}, auth=False)
+        self.request("POST", "/auth/refresh", 200)
+        self.request("GET", "/auth/me", 200)
+        self.request("PUT", "/auth/me", 200, json={"username": "renamed"})
+
+    def test_profile_email_change(self):
+        self.request("PUT", "/auth/me", 200, json={"username": "moved", "email": f"new-{self.email}"})
+        # The old token's claims are stale now, so /auth/me reads the user
+        self.request("GET", "/auth/me", 200)
+
+    def test_password_change(self):
+        self.request("PUT", "/auth/me/password", 200, json={
+            "current_password": "secret1", "new_password": "secret2", "confirm_password": "secret2"
+        })
+
+    def test_task_list_views(self):
+        due = (datetime.now(timezone.utc) + timedelta(days=2)).isoformat()
+        self.create_tasks(3, due_date=due)
+        self.create_tasks(2)
+        etag = self.request("GET", "/tasks", 200).headers["ETag"]
+        self.request("GET", "/tasks", 304, headers={"If-None-Match": etag})
+        self.request("GET", "/tasks", 200)
+        self.request("GET", "/tasks?limit=2", 200)
+        self.request("GET", "/tasks?order_by=due_date&limit=4", 200)
+        self.request("GET", "/tasks?order_by=-due_date", 200)
+        self.request("GET", "/tasks?status=backlog,in_progress&overdue=false", 200)
+        self.request("GET", "/tasks?stream=true", 200)
+        since = self.request("GET", "/tasks/changes", 200).get_json()["next_since"]
+        self.request("GET", "/tasks/changes", 200, query_string={"since": since - 2})
+        self.request("GET", "/tasks/search?q=task", 200)
+        self.request("GET", "/tasks/summary", 200)
+
+    def test_single_task_routes(self):
+        task_id, = self.create_tasks(1, why="Because", due_date="2030-01-01T00:00:00Z")
+        etag = self.request("GET", f"/tasks/{task_id}", 200).headers["ETag"]
+        self.request("GET", f"/tasks/{task_id}", 304, headers={"If-None-Match": etag})
+        self.request("PUT", f"/tasks/{task_id}", 200, json={"title": "Changed", "status": "done"})
+        self.request("DELETE", f"/tasks/{task_id}", 200)
+        self.request("DELETE", f"/tasks/{task_id}", 404)
+
+    def test_bulk_mixed_fields(self):
+        ids = self.create_tasks(5)
+        operations = [
+            {"op": "create", "data": {"title": "New", "why": "Because"}},
+            {"op": "create", "data": {"title": "Also new", "due_date": "2030-01-01T00:00:00Z"}},
+            {"op": "update", "id": ids[0], "data": {"title": "Renamed"}},
+            {"op": "update", "id": ids[1], "data": {"status": "done"}},
+            {"op": "update", "id": ids[2], "data": {"due_date": "2030-01-01T00:00:00Z", "what": "Text"}},
+            {"op": "update", "id": ids[0], "data": {"status": "in_review"}},
+            {"op": "delete", "id": ids[3]},
+            {"op": "update", "id": ids[3], "data": {"title": "Gone"}},
+        ]
+        self.request("POST", "/tasks/bulk", 200, json={"operations": operations})
+
+    def test_reorder(self):
+        ids = self.create_tasks(4)
+        self.request("POST", f"/tasks/{ids[0]}/reorder", 200, json={"target_status": "backlog", "target_position": 2})
+        self.request("POST", f"/tasks/{ids[1]}/reorder", 200, json={"target_status": "in_progress", "target_position": 0})
+        self.request("POST", f"/tasks/{ids[2]}/reorder", 200, json={
+            "target_status": "backlog", "target_position": 0, "after_task_id": ids[3]
+        })
+        self.request("POST", "/tasks/reorder", 200, json={"moves": [
+            {"task_id": ids[2], "target_status": "done", "target_position": 0},
+            {"task_id": ids[3], "target_status": "backlog", "target_position": 1},
+            {"task_id": ids[0], "target_status": "done", "target_position": 0, "after_task_id": ids[2]},
+        ]})
+
+    def test_reorder_into_exhausted_gap(self):
+        ids = self.create_tasks(2, status="done") + self.create_tasks(1)
+        # Tied neighbours force the rebalance path; moving across columns
+        # also writes the status counters
+        with self.app.app_context():
+            db.session.execute(update(Task).where(Task.id.in_(ids[:2])).values(sort_order=5.0))
+            db.session.commit()
+        self.request("POST", f"/tasks/{ids[2]}/reorder", 200, json={"target_status": "done", "target_position": 1})
+
+    def test_reorder_after_task_into_exhausted_gap(self):
+        ids = self.create_tasks(2, status="done") + self.create_tasks(1)
+        with self.app.app_context():
+            db.session.execute(update(Task).where(Task.id.in_(ids[:2])).values(sort_order=5.0))
+            db.session.commit()
+        self.request("POST", f"/tasks/{ids[2]}/reorder", 200, json={
+            "target_status": "done", "target_position": 0, "after_task_id": ids[0]
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
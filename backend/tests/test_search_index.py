@@ -0,0 +1,111 @@
+# backend/tests/test_search_index.py
+"""
+The SQLite search index is written by TaskService, not by triggers, so
+connections that lack the app's task_text() function can still write to
+the task table. Run from the backend directory:
+
+    python -m unittest discover tests
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.services.search_index_service import SearchIndexService
+
+
+class SearchConfig(Config):
+    TESTING = True
+    TASK_CACHE_BACKEND = "memory"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "search.db")
+        self.app = create_app(type("Config", (SearchConfig,), {"SQLALCHEMY_DATABASE_URI": "sqlite:///" + self.path}))
+        with self.app.app_context():
+            db.create_all()
+        self.client = self.app.test_client()
+        self.headers = self.register("alice")
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def register(self, username):
+        response = self.client.post("/auth/register", json={
+            "username": username, "email": f"{username}@example.com", "password": "secret1"
+        })
+        return {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+
+    def create(self, headers=None, **fields):
+        response = self.client.post("/tasks", json=fields, headers=headers or self.headers)
+        return response.get_json()["task"]["id"]
+
+    def search(self, q, headers=None):
+        response = self.client.get("/tasks/search", query_string={"q": q}, headers=headers or self.headers)
+        self.assertEqual(response.status_code, 200)
+        return [task["id"] for task in response.get_json()["tasks"]]
+
+    def test_task_writes_are_indexed(self):
+        long_text = "Compressed zeppelin notes. " * 100
+        first = self.create(title="Fix login bug", what=long_text)
+        second = self.create(title="Dashboard")
+        self.assertEqual(self.search("zeppelin"), [first])
+
+        self.client.put(f"/tasks/{second}", json={"how": "Rework login"}, headers=self.headers)
+        self.client.put(f"/tasks/{first}", json={"title": "Fix signup bug"}, headers=self.headers)
+        self.assertEqual(self.search("login"), [second])
+        self.assertEqual(self.search("zeppelin"), [first])
+
+        results = self.client.post("/tasks/bulk", json={"operations": [
+            {"op": "create", "data": {"title": "Bulk created", "why": "quokka"}},
+            {"op": "update", "id": first, "data": {"why": "quokka too"}},
+            {"op": "update", "id": second, "data": {"status": "done"}},
+        ]}, headers=self.headers).get_json()["results"]
+        self.assertEqual(sorted(self.search("quokka")), sorted([results[0]["id"], first]))
+        self.assertEqual(self.search("login"), [second])
+
+    def test_searches_are_scoped_to_the_user(self):
+        mine = self.create(title="Shared words")
+        other = self.register("bob")
+        theirs = self.create(other, title="Shared words")
+        self.assertEqual(self.search("shared"), [mine])
+        self.assertEqual(self.search("shared", other), [theirs])
+        # Owner tokens are not searchable text
+        self.assertEqual(self.search("u1"), [])
+
+    def test_other_clients_can_write_tasks(self):
+        kept = self.create(title="Kept", what="Compressed walrus notes. " * 100)
+        removed = self.create(title="Removed walrus")
+
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute("UPDATE task SET title = 'Edited elsewhere' WHERE id = ?", (kept,))
+            connection.execute(
+                "INSERT INTO task (title, status, sort_order, is_deleted, user_id, change_seq, created_at) "
+                "VALUES ('Inserted elsewhere', 'BACKLOG', 1.0, 0, 1, 0, CURRENT_TIMESTAMP)"
+            )
+            connection.execute("DELETE FROM task WHERE id = ?", (removed,))
+        connection.close()
+
+        # Hard deletes leave the index through the trigger; other writes
+        # wait for a rebuild
+        self.assertEqual(self.search("walrus"), [kept])
+        self.assertEqual(self.search("elsewhere"), [])
+        with self.app.app_context():
+            self.assertEqual(SearchIndexService.rebuild(), 2)
+            db.session.commit()
+        self.assertEqual(sorted(self.search("elsewhere")), [kept, kept + 2])
+        self.assertEqual(self.search("walrus"), [kept])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# backend/tests/test_task_counters.py
+"""
+Concurrent task writes against the maintained user_task_counters: pairs of
+requests released together by a barrier race on the same task, and the
+counters must then equal what TaskCounterService.rebuild() recomputes from
+the task table. Run from the backend directory:
+
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy import select
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import UserTaskCounter
+from app.services.task_counter_service import TaskCounterService
+
+
+class CounterConfig(Config):
+    TESTING = True
+    TASK_CACHE_BACKEND = "memory"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
+
+
+# Races per scenario; the unlocked code drifted in most rounds
+ROUNDS = 3
+
+
+class TaskCounterRaceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        database_uri = "sqlite:///" + os.path.join(self.tmpdir.name, "counters.db")
+        self.app = create_app(type("Config", (CounterConfig,), {"SQLALCHEMY_DATABASE_URI": database_uri}))
+        with self.app.app_context():
+            db.create_all()
+        client = self.app.test_client()
+        response = client.post("/auth/register", json={
+            "username": "alice", "email": "alice@example.com", "password": "secret1"
+        })
+        self.headers = {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def create_task(self):
+        response = self.app.test_client().post("/tasks", json={
+            "title": "Raced", "due_date": "2030-01-01T00:00:00Z"
+        }, headers=self.headers)
+        return response.get_json()["task"]["id"]
+
+    def race(self, *requests):
+        """Send each request from its own thread, released together; return the status codes."""
+        barrier = threading.Barrier(len(requests))
+        statuses = [None] * len(requests)
+
+        def run(index, request):
+            client = self.app.test_client()
+            barrier.wait()
+            statuses[index] = request(client).status_code
+
+        threads = [threading.Thread(target=run, args=item) for item in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return statuses
+
+    def assertCountersMatchRebuild(self):
+        def read():
+            return {
+                (row.status, row.live_count, row.overdue_eligible_count)
+                for row in db.session.scalars(select(UserTaskCounter))
+                if row.live_count or row.overdue_eligible_count
+            }
+
+        with self.app.app_context():
+            maintained = read()
+            TaskCounterService.rebuild()
+            rebuilt = read()
+            db.session.rollback()
+        self.assertEqual(maintained, rebuilt)
+
+    def put(self, task_id, status):
+        return lambda client: client.put(f"/tasks/{task_id}", json={"status": status}, headers=self.headers)
+
+    def delete(self, task_id):
+        return lambda client: client.delete(f"/tasks/{task_id}", headers=self.headers)
+
+    def test_concurrent_deletes(self):
+        for _ in range(ROUNDS):
+            task_id = self.create_task()
+            self.assertEqual(sorted(self.race(self.delete(task_id), self.delete(task_id))), [200, 404])
+            self.assertCountersMatchRebuild()
+
+    def test_concurrent_updates(self):
+        for _ in range(ROUNDS):
+            task_id = self.create_task()
+            self.assertEqual(self.race(self.put(task_id, "done"), self.put(task_id, "in_review")), [200, 200])
+            self.assertCountersMatchRebuild()
+
+    def test_concurrent_reorders(self):
+        for _ in range(ROUNDS):
+            task_id = self.create_task()
+            single = [
+                lambda client, status=status: client.post(f"/tasks/{task_id}/reorder", json={
+                    "target_status": status, "target_position": 0
+                }, headers=self.headers)
+                for status in ("done", "in_review")
+            ]
+            batch = [
+                lambda client, status=status: client.post("/tasks/reorder", json={"moves": [
+                    {"task_id": task_id, "target_status": status, "target_position": 0}
+                ]}, headers=self.headers)
+                for status in ("backlog", "wont_do")
+            ]
+            self.assertEqual(self.race(*single), [200, 200])
+            self.assertCountersMatchRebuild()
+            self.assertEqual(self.race(*batch), [200, 200])
+            self.assertCountersMatchRebuild()
+
+    def test_concurrent_bulk_updates(self):
+        for _ in range(ROUNDS):
+            task_id = self.create_task()
+            bulk = [
+                lambda client, status=status: client.post("/tasks/bulk", json={"operations": [
+                    {"op": "update", "id": task_id, "data": {"status": status}}
+                ]}, headers=self.headers)
+                for status in ("done", "in_progress")
+            ]
+            self.assertEqual(self.race(*bulk), [200, 200])
+            self.assertCountersMatchRebuild()
+
+    def test_concurrent_update_and_delete(self):
+        for _ in range(ROUNDS):
+            task_id = self.create_task()
+            statuses = self.race(self.put(task_id, "done"), self.delete(task_id))
+            self.assertEqual(statuses[1], 200)
+            self.assertIn(statuses[0], (200, 404))
+            self.assertCountersMatchRebuild()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# backend/tests/test_task_service.py
+"""
+TaskService write behaviour seen through the API: what else a task write
+touches, and where reorders place tasks. Run from the backend directory:
+
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import select, update
+from app import create_app
+from app.config import Config
+from app.extensions import db
+from app.models import User
+from app.services.task_service import TaskService
+
+
+class TaskServiceConfig(Config):
+    TESTING = True
+    TASK_CACHE_BACKEND = "memory"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+    PASSWORD_HASH_WORKERS = 0
+
+
+class TaskServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tasks.db")
+        self.app = create_app(type("Config", (TaskServiceConfig,), {"SQLALCHEMY_DATABASE_URI": "sqlite:///" + self.path}))
+        with self.app.app_context():
+            db.create_all()
+        self.client = self.app.test_client()
+        response = self.client.post("/auth/register", json={
+            "username": "alice", "email": "alice@example.com", "password": "secret1"
+        })
+        self.user_id = response.get_json()["user"]["id"]
+        self.headers = {"Authorization": f"Bearer {response.get_json()['access_token']}"}
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def user_row(self):
+        with self.app.app_context():
+            return db.session.execute(
+                select(User.updated_at, User.task_change_seq).where(User.id == self.user_id)
+            ).one()
+
+    def test_task_writes_leave_profile_updated_at_alone(self):
+        before = self.user_row()
+        task_id = self.client.post("/tasks", json={"title": "Task"}, headers=self.headers).get_json()["task"]["id"]
+        self.client.put(f"/tasks/{task_id}", json={"title": "Renamed"}, headers=self.headers)
+        self.client.post(f"/tasks/{task_id}/reorder", json={"target_status": "done", "target_position": 0},
+                         headers=self.headers)
+        self.client.delete(f"/tasks/{task_id}", headers=self.headers)
+        with self.app.app_context():
+            # The maintenance path advances every user's sequence
+            TaskService.advance_change_seq()
+            db.session.commit()
+
+        after = self.user_row()
+        self.assertEqual(after.task_change_seq, before.task_change_seq + 5)
+        self.assertEqual(after.updated_at, before.updated_at)
+
+    def test_profile_changes_still_set_updated_at(self):
+        with self.app.app_context():
+            db.session.execute(update(User).where(User.id == self.user_id).values(username="renamed"))
+            db.session.commit()
+        self.assertIsNotNone(self.user_row().updated_at)
+
+    def board_column(self, status):
+        tasks = self.client.get("/tasks", headers=self.headers).get_json()["tasks"]
+        return [task["id"] for task in tasks if task["status"] == status]
+
+    def test_reorder_after_task(self):
+        ids = [
+            self.client.post("/tasks", json={"title": f"Task {i}"}, headers=self.headers).get_json()["task"]["id"]
+            for i in range(4)
+        ]
+        response = self.client.post(f"/tasks/{ids[0]}/reorder", json={
+            "target_status": "backlog", "target_position": 0, "after_task_id": ids[2]
+        }, headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.board_column("backlog"), [ids[1], ids[2], ids[0], ids[3]])
+
+        # Dropping below the last task appends
+        self.client.post(f"/tasks/{ids[1]}/reorder", json={
+            "target_status": "backlog", "target_position": 0, "after_task_id": ids[3]
+        }, headers=self.headers)
+        self.assertEqual(self.board_column("backlog"), [ids[2], ids[0], ids[3], ids[1]])
+
+        response = self.client.post("/tasks/reorder", json={"moves": [
+            {"task_id": ids[3], "target_status": "done", "target_position": 0},
+            {"task_id": ids[2], "target_status": "done", "target_position": 0, "after_task_id": ids[3]},
+        ]}, headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.board_column("done"), [ids[3], ids[2]])
+
+    def test_reorder_after_task_outside_the_column(self):
+        first, second = [
+            self.client.post("/tasks", json={"title": f"Task {i}", "status": status}, headers=self.headers)
+            .get_json()["task"]["id"]
+            for i, status in enumerate(("backlog", "done"))
+        ]
+        for after_task_id in (second, first):
+            response = self.client.post(f"/tasks/{first}/reorder", json={
+                "target_status": "backlog", "target_position": 0, "after_task_id": after_task_id
+            }, headers=self.headers)
+            self.assertEqual(response.status_code, 409)
+        response = self.client.post("/tasks/reorder", json={"moves": [
+            {"task_id": first, "target_status": "backlog", "target_position": 0, "after_task_id": second},
+        ]}, headers=self.headers)
+        self.assertEqual(response.status_code, 409)
+        # The rejected moves left the board alone
+        self.assertEqual(self.board_column("backlog"), [first])
+        self.assertEqual(self.board_column("done"), [second])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -67,12 +67,19 @@ export async function deleteTask(taskId: number) {
   });
 }
 
-export async function reorderTask(taskId: number, targetStatus: TaskStatus, targetPosition: number) {
+export async function reorderTask(
+  taskId: number,
+  targetStatus: TaskStatus,
+  targetPosition: number,
+  afterTaskId?: number,
+) {
   return authenticatedAPI.request<{ task: Task }>(`/tasks/${taskId}/reorder`, {
     method: 'POST',
     body: {
       target_status: targetStatus,
       target_position: targetPosition,
+      // The task dropped below; the server finds it by key, not by counting
+      ...(afterTaskId !== undefined ? { after_task_id: afterTaskId } : {}),
     },
   });
 }
\ No newline at end of file
@@ -187,8 +187,13 @@ export default function DashboardPage() {
       return [...otherTasks, ...targetTasks];
     });
 
+    // Task directly above the drop position, if any
+    const afterTask = targetPosition > 0
+      ? tasks.filter(t => t.status === targetStatus && t.id !== draggedTask.id)[targetPosition - 1]
+      : undefined;
+
     try {
-      const response = await reorderTask(draggedTask.id, targetStatus, targetPosition);
+      const response = await reorderTask(draggedTask.id, targetStatus, targetPosition, afterTask?.id);
       if (response.status === 'success' && response.data) {
         // Only update if there are meaningful differences to avoid unnecessary re-renders
         const apiTask = response.data.task;